@@ -1,5 +1,5 @@
 """ClickHouse database module."""
 
-from db.clickhouse.client import ClickHouseClient, get_clickhouse_client
+from db.clickhouse.client import ClickHouseClient, get_clickhouse_client, get_query_executor
 
-__all__ = ["ClickHouseClient", "get_clickhouse_client"]
+__all__ = ["ClickHouseClient", "get_clickhouse_client", "get_query_executor"]
@@ -1,10 +1,14 @@
 """ClickHouse client using clickhouse-connect."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
 import clickhouse_connect
+from clickhouse_connect.driver import httputil
 from clickhouse_connect.driver.client import Client
+from clickhouse_connect.driver.common import StreamContext
 from clickhouse_connect.driver.query import QueryResult
 
 from shared.config import settings
@@ -34,6 +38,10 @@ class ClickHouseClient:
             # this is a no-op semantically — just the standard sessionless, pooled
             # shared-client pattern used by mature ClickHouse-backed services.
             autogenerate_session_id=False,
+            # A dedicated pool sized for the service's concurrency. The library
+            # default keeps only 8 connections per host and silently discards
+            # the rest, so bursts past 8 paid a fresh TCP connect per query.
+            pool_mgr=httputil.get_pool_manager(maxsize=ch.pool_size),
         )
         return cls(client)
 
@@ -203,6 +211,28 @@ class ClickHouseClient:
         """
         return self._client.query(query, parameters=parameters, settings=settings)
 
+    def query_rows_stream(
+        self, query: str, parameters: dict[str, Any] | None = None
+    ) -> StreamContext:
+        """Execute a query and stream its rows back block by block.
+
+        The query runs (and fails) at call time; rows are read off the HTTP
+        response only as the returned context is iterated, so a large result is
+        never materialized in full. Column names are available up front via
+        ``stream.source.column_names``.
+
+        Args:
+            query (str): SQL text, optionally with ``{name:Type}`` server-side
+                parameter bindings.
+            parameters (dict[str, Any] | None): Values for the server-side
+                bindings.
+
+        Returns:
+            StreamContext: Must be entered (``with stream:``) before iterating;
+                yields lists of row tuples and releases the connection on exit.
+        """
+        return self._client.query_rows_stream(query, parameters=parameters)
+
     def close(self) -> None:
         """Close the client connection."""
         self._client.close()
@@ -218,3 +248,25 @@ def get_clickhouse_client() -> ClickHouseClient:
     if _client is None:
         _client = ClickHouseClient.from_settings()
     return _client
+
+
+# Threads for issuing a request's independent read queries side by side (a page
+# and its total, a skeleton and its span I/O). Shared and bounded, so fan-out
+# never spawns threads per request and its extra ClickHouse concurrency is
+# capped process-wide; past the cap, follow-up queries queue. A task submitted
+# here must not itself wait on this executor.
+QUERY_FANOUT_WORKERS = 8
+_query_executor: ThreadPoolExecutor | None = None
+_query_executor_lock = threading.Lock()
+
+
+def get_query_executor() -> ThreadPoolExecutor:
+    """Get or create the shared executor for concurrent ClickHouse reads."""
+    global _query_executor
+    if _query_executor is None:
+        with _query_executor_lock:
+            if _query_executor is None:
+                _query_executor = ThreadPoolExecutor(
+                    max_workers=QUERY_FANOUT_WORKERS, thread_name_prefix="ch-fanout"
+                )
+    return _query_executor
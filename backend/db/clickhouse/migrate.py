@@ -21,6 +21,9 @@ PRESSLY_GOOSE_MARKERS = (
     "Usage: goose DRIVER DBSTRING [OPTIONS] COMMAND",
 )
 DOCKER_GOOSE_ACTIONS = {"up", "down", "status"}
+# Resolved once at import: resolve() follows symlinks with a stat per path
+# component, and every migrate/status command asks for this directory.
+_MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
 
 
 def _run_command(
@@ -45,7 +48,7 @@ def _run_command(
 
 
 def migrations_dir() -> Path:
-    return Path(__file__).resolve().parent / "migrations"
+    return _MIGRATIONS_DIR
 
 
 def goose_dbstring(env: dict[str, str] | None = None) -> str:
@@ -59,14 +62,19 @@ def goose_dbstring(env: dict[str, str] | None = None) -> str:
     )
 
 
-def _goose_candidates(env: dict[str, str] | None = None) -> list[Path]:
-    merged_env = {**os.environ, **(env or {})}
+def _merged_env(env: dict[str, str] | None = None) -> dict[str, str]:
+    """Snapshot ``os.environ`` once, with ``env`` overrides layered on top."""
+    return {**os.environ, **(env or {})}
+
+
+def _goose_candidates(env: dict[str, str]) -> list[Path]:
+    """Candidate goose paths; ``env`` is the complete (already merged) environment."""
     candidates = [
         Path.home() / "bin" / "goose",
         Path.home() / "go" / "bin" / "goose",
     ]
 
-    resolved = shutil.which("goose", path=merged_env.get("PATH"))
+    resolved = shutil.which("goose", path=env.get("PATH"))
     if resolved:
         candidates.append(Path(resolved))
 
@@ -81,7 +89,7 @@ def _goose_candidates(env: dict[str, str] | None = None) -> list[Path]:
     return deduped
 
 
-def is_pressly_goose(executable: str | Path, env: dict[str, str] | None = None) -> bool:
+def _probe_pressly_goose(executable: str | Path, env: dict[str, str]) -> bool:
     candidate = Path(executable)
     if not candidate.exists():
         return False
@@ -91,7 +99,7 @@ def is_pressly_goose(executable: str | Path, env: dict[str, str] | None = None)
             [str(candidate), "--help"],
             check=False,
             capture_output=True,
-            env={**os.environ, **(env or {})},
+            env=env,
         )
     except OSError:
         return False
@@ -100,13 +108,23 @@ def is_pressly_goose(executable: str | Path, env: dict[str, str] | None = None)
     return result.returncode == 0 and any(marker in output for marker in PRESSLY_GOOSE_MARKERS)
 
 
-def resolve_pressly_goose(env: dict[str, str] | None = None) -> str | None:
+def _find_pressly_goose(env: dict[str, str]) -> str | None:
+    # One merged snapshot serves the PATH lookup and every candidate probe, rather
+    # than re-copying os.environ per helper call.
     for candidate in _goose_candidates(env):
-        if is_pressly_goose(candidate, env):
+        if _probe_pressly_goose(candidate, env):
             return str(candidate)
     return None
 
 
+def is_pressly_goose(executable: str | Path, env: dict[str, str] | None = None) -> bool:
+    return _probe_pressly_goose(executable, _merged_env(env))
+
+
+def resolve_pressly_goose(env: dict[str, str] | None = None) -> str | None:
+    return _find_pressly_goose(_merged_env(env))
+
+
 def goose_command(
     action: str,
     *,
@@ -156,8 +174,8 @@ def run_goose(
     capture_output: bool = False,
     docker_fallback: bool = False,
 ) -> subprocess.CompletedProcess:
-    merged_env = {**os.environ, **(env or {})}
-    executable = resolve_pressly_goose(merged_env)
+    merged_env = _merged_env(env)
+    executable = _find_pressly_goose(merged_env)
 
     if executable:
         return _run_command(
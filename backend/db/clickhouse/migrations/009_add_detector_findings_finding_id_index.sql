@@ -0,0 +1,19 @@
+-- +goose Up
+-- Point lookups by finding_id (finding detail pages, the public
+-- GET /findings/{finding_id} route) cannot use the sort key: detector_findings
+-- is ordered by (project_id, trace_id, finding_id), so finding_id sits behind
+-- trace_id and the read scans every granule of the project to return one row.
+-- A bloom-filter skip index lets those reads drop the granules that cannot hold
+-- the id. finding_id is already in the sort key and the index is a separate
+-- structure, so the table is not rewritten.
+--
+-- Deliberately NO `MATERIALIZE INDEX`, for the same reason as 008: new parts get
+-- the index on insert and existing parts as they merge, and reads over parts
+-- without it behave exactly as they do today. Run
+-- `ALTER TABLE detector_findings MATERIALIZE INDEX idx_finding_id` off the
+-- migration path if historical lookups need it sooner.
+ALTER TABLE detector_findings
+    ADD INDEX IF NOT EXISTS idx_finding_id finding_id TYPE bloom_filter(0.01) GRANULARITY 1;
+
+-- +goose Down
+ALTER TABLE detector_findings DROP INDEX IF EXISTS idx_finding_id;
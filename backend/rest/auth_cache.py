@@ -0,0 +1,100 @@
+"""Short-lived in-process cache for auth lookups against the Next.js control plane.
+
+Every dashboard read and every public API call resolves its identity through a
+Next.js internal route (``validate-project-access`` / ``validate-api-key``), a
+network + Postgres round-trip for a value that changes rarely. When
+``settings.auth_cache_ttl_seconds`` is set (it is 0, i.e. off, by default),
+successful results are cached for that long so back-to-back requests from the
+same caller skip it. There is no invalidation hook: a revoked key, a removed
+member or a newly set ``ingestion_blocked`` flag takes effect only once the
+entry expires, separately on each REST process. Failures (401/403/404/503) are
+never cached, so a transient auth-service outage is retried on the next request.
+
+Concurrent misses for the same key are coalesced behind a per-key lock, so a
+burst of parallel requests (e.g. a dashboard fanning out its widgets) costs one
+upstream call rather than one per request.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from shared.config import settings
+
+T = TypeVar("T")
+
+AUTH_CACHE_MAX = 4096
+
+
+class AuthCache(Generic[T]):
+    """Bounded TTL cache with per-key single-flight loading."""
+
+    def __init__(self, max_entries: int = AUTH_CACHE_MAX):
+        self._max_entries = max_entries
+        self._entries: dict[tuple, tuple[float, T]] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+        # Requests holding or queued on each lock; the lock is dropped at zero.
+        self._lock_users: dict[tuple, int] = {}
+
+    def _get(self, key: tuple) -> T | None:
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return cached[1]
+
+    def _put(self, key: tuple, value: T, ttl: float) -> None:
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def get_or_load(self, key: tuple, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        Args:
+            key (tuple): Cache key; must identify the caller completely.
+            loader (Callable[[], Awaitable[T]]): Fetches the value upstream. Its
+                exceptions propagate and nothing is cached, so a coalesced
+                waiter retries the load itself.
+
+        Returns:
+            T: The cached or freshly loaded value.
+        """
+        ttl = settings.auth_cache_ttl_seconds
+        if ttl <= 0:
+            return await loader()
+
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        # Counted rather than checked with lock.locked(): between a release and the
+        # next waiter resuming the lock reads as free, and dropping it then would let
+        # a new arrival load in parallel on a fresh lock.
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                cached = self._get(key)
+                if cached is not None:
+                    return cached
+                value = await loader()
+                self._put(key, value, ttl)
+                return value
+        finally:
+            users = self._lock_users.pop(key) - 1
+            if users:
+                self._lock_users[key] = users
+            else:
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop every cached entry (tests, or after a known control-plane change).
+
+        Per-key locks are left alone: in-flight loads still hold them and drop
+        them as they finish.
+        """
+        self._entries.clear()
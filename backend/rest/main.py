@@ -6,14 +6,17 @@ This server handles:
 """
 
 import os
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from dotenv import load_dotenv
+from shared.env import load_env
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from slowapi.errors import RateLimitExceeded
@@ -30,12 +33,22 @@ from rest.routers.sessions import router as sessions_router
 from rest.routers.traces import router as traces_router
 from rest.routers.users import router as users_router
 from rest.schemas.common import HealthResponse
+from rest.ui_client import close_ui_client
 from shared.config import settings
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Release pooled outbound connections on shutdown."""
+    yield
+    await close_ui_client()
+
+
 app = FastAPI(
     title="TraceRoot API",
     description="Observability and self-improving layer for AI agents",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Compress responses (e.g. large trace payloads). Added before CORS so that
@@ -80,10 +93,16 @@ app.include_router(public_detectors_read_router, prefix="/api/v1")
 app.include_router(internal_router, prefix="/api/v1")
 
 
+# Probes hit this constantly and the answer never changes: encode it once and
+# return the bytes, skipping per-call response validation and serialization.
+# response_model still documents the shape in the OpenAPI schema.
+_HEALTH_OK = HealthResponse(status="ok").model_dump_json().encode()
+
+
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return HealthResponse(status="ok")
+    return Response(content=_HEALTH_OK, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -93,4 +112,8 @@ if __name__ == "__main__":
         "rest.main:app",
         host=host,
         port=port,
+        # uvicorn[standard] ships both; pin them so a missing extra fails loudly
+        # instead of silently falling back to asyncio + h11. uvloop is POSIX-only.
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
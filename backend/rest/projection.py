@@ -23,6 +23,10 @@ Finer-grained ``io.input`` / ``io.output`` projection is a deliberate follow-up
 (see the trace-read-projection epic); today ``io`` covers input+output together.
 """
 
+import functools
+
+from db.clickhouse import get_query_executor
+
 CORE = "core"
 USAGE = "usage"
 IO = "io"
@@ -56,6 +60,10 @@ class InvalidFieldsError(ValueError):
     """
 
 
+# Clients send the same handful of ``fields`` strings on every trace read, so the
+# parse is memoized; the LRU bound caps what arbitrary client input can pin.
+# Results are frozensets, safe to share; rejected values raise and are not cached.
+@functools.lru_cache(maxsize=256)
 def resolve_span_fields(fields: str | None, *, default: frozenset[str]) -> frozenset[str]:
     """Parse a ``fields`` query value into a validated, canonical group set.
 
@@ -145,31 +153,95 @@ def merge_span_io(trace: dict, span_io: dict[str, dict]) -> None:
     module) so both the public and internal trace endpoints share it without
     cross-importing.
     """
+    if not span_io:
+        return
     for span in trace.get("spans", []):
         io = span_io.get(span["span_id"])
         if io:
             span.update(io)
 
 
-def hydrate_span_io(
+def fetch_span_io(
     service,
-    trace: dict,
     *,
     project_id: str,
     trace_id: str,
     groups: frozenset[str],
-) -> None:
-    """Attach per-span I/O to a skeleton ``trace`` for the resolved projection, in place.
+) -> dict[str, dict]:
+    """Run the bulk span-I/O query for the resolved projection, if it needs one.
 
-    The single gate for the bulk span-I/O query: it runs **only** when ``groups``
-    includes ``io``/``metadata`` (``io_columns`` non-empty). Centralizing it here —
+    The single gate for that query: it runs **only** when ``groups`` includes
+    ``io``/``metadata`` (``io_columns`` non-empty). Centralizing it here —
     rather than copy-pasting the gate into each router — means a new ``fields``
     endpoint cannot forget the ``core``/``usage``-only fast path that keeps the
     default skeleton read off the heavy query (the #1040 win). ``service`` is any
     object exposing ``get_trace_spans_io(project_id, trace_id, columns)``.
+
+    Returns:
+        dict[str, dict]: The ``{span_id: {column: value}}`` map for
+            ``merge_span_io``; empty when the projection requests no I/O.
     """
     columns = io_columns(groups)
     if not columns:
-        return
-    span_io = service.get_trace_spans_io(project_id=project_id, trace_id=trace_id, columns=columns)
+        return {}
+    span_io: dict[str, dict] = service.get_trace_spans_io(
+        project_id=project_id, trace_id=trace_id, columns=columns
+    )
+    return span_io
+
+
+def hydrate_span_io(
+    service,
+    trace: dict,
+    *,
+    project_id: str,
+    trace_id: str,
+    groups: frozenset[str],
+) -> None:
+    """Attach per-span I/O to a skeleton ``trace`` for the resolved projection, in place.
+
+    ``fetch_span_io`` followed by ``merge_span_io``; a no-op (no query) for
+    ``core``/``usage``-only projections.
+    """
+    span_io = fetch_span_io(service, project_id=project_id, trace_id=trace_id, groups=groups)
     merge_span_io(trace, span_io)
+
+
+def get_trace_with_span_io(
+    service,
+    *,
+    project_id: str,
+    trace_id: str,
+    groups: frozenset[str],
+    **get_trace_kwargs,
+) -> tuple[dict | None, dict[str, dict]]:
+    """Read a trace skeleton and its projected bulk span I/O concurrently.
+
+    The I/O query is keyed only by ``(project_id, trace_id)`` — it never needs
+    the skeleton — so when the projection asks for ``io``/``metadata`` both
+    reads are issued at once and the request waits for the slower one rather
+    than their sum. The map is returned unmerged: callers still gate on the
+    skeleton (404, source scope, retention) and only then apply it with
+    ``merge_span_io``, so a trace that fails a gate discards its I/O unread.
+
+    Args:
+        service: Reader exposing ``get_trace`` and ``get_trace_spans_io``.
+        project_id (str): Project that owns the trace; scopes both reads.
+        trace_id (str): Trace to fetch.
+        groups (frozenset[str]): Resolved projection groups.
+        **get_trace_kwargs: Forwarded to ``get_trace`` (e.g. ``source``).
+
+    Returns:
+        tuple[dict | None, dict[str, dict]]: The skeleton (None when not found)
+            and the span-I/O map (empty when the projection requests no I/O).
+    """
+    if not io_columns(groups):
+        trace = service.get_trace(project_id=project_id, trace_id=trace_id, **get_trace_kwargs)
+        return trace, {}
+    # The I/O read goes to the shared fan-out executor while this thread reads
+    # the skeleton; the ClickHouse client is sessionless and safe to share.
+    span_io_future = get_query_executor().submit(
+        fetch_span_io, service, project_id=project_id, trace_id=trace_id, groups=groups
+    )
+    trace = service.get_trace(project_id=project_id, trace_id=trace_id, **get_trace_kwargs)
+    return trace, span_io_future.result()
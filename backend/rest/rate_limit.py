@@ -35,6 +35,7 @@ Failure mode is fail-open: ``in_memory_fallback_enabled`` covers Redis outages
 and ``swallow_errors`` ensures a broken limiter never turns into a 500.
 """
 
+import functools
 import logging
 import time
 from contextvars import ContextVar
@@ -68,8 +69,11 @@ _rate_limit_exempt: ContextVar[bool] = ContextVar("rate_limit_exempt", default=F
 # --- OpenTelemetry counter (no-op until a MeterProvider is configured) -------
 # Instrument with the OTel metrics API only; wiring a MeterProvider/exporter is
 # a separate, platform-wide concern. The structured log line below guarantees
-# observability even before a provider exists.
-def _build_exceeded_counter():
+# observability even before a provider exists. Built on the first 429 rather than
+# at import, so processes that never throttle (workers, tests, CLI tools
+# importing this module) skip loading the metrics API altogether.
+@functools.lru_cache(maxsize=1)
+def _get_exceeded_counter():
     try:
         from opentelemetry import metrics
 
@@ -82,9 +86,6 @@ def _build_exceeded_counter():
         return None
 
 
-_exceeded_counter = _build_exceeded_counter()
-
-
 def clear_request_rate_limit_exempt() -> None:
     """Reset the exemption to the default for the current request.
 
@@ -129,10 +130,11 @@ def set_rate_limit_identity(
 
     Returns:
         None. Stamps ``rl_workspace_id`` and ``rl_billing_plan`` onto
-        ``request.state``.
+        ``request.state`` and drops any bucket key built from a prior stamp.
     """
     request.state.rl_workspace_id = workspace_id or ""
     request.state.rl_billing_plan = normalize_plan(billing_plan)
+    request.state.rl_key = None
 
 
 def _identity(request: Request) -> tuple[str, str]:
@@ -143,18 +145,33 @@ def _identity(request: Request) -> tuple[str, str]:
     return workspace_id, plan
 
 
+def _bucket_key(request: Request, bucket: str) -> str:
+    """Build (once per request) the ``rl:{bucket}:{plan}:{workspace_id}`` key.
+
+    slowapi calls a route's ``key_func`` twice per request — once to feed the
+    dynamic limit (``resolve_limit``) and again to evaluate it — so the key is
+    kept on ``request.state`` and the second call returns it as is.
+    ``set_rate_limit_identity`` drops it whenever the identity is (re)stamped.
+    """
+    state = request.state
+    cached = getattr(state, "rl_key", None)
+    if cached is not None and getattr(state, "rl_bucket", None) == bucket:
+        return str(cached)
+    workspace_id, plan = _identity(request)
+    key = f"{_KEY_PREFIX}:{bucket}:{plan}:{workspace_id}"
+    state.rl_bucket = bucket
+    state.rl_key = key
+    return key
+
+
 def key_ingest(request: Request) -> str:
     """Bucket key for ingestion: per workspace, with the plan embedded."""
-    workspace_id, plan = _identity(request)
-    request.state.rl_bucket = BUCKET_INGEST
-    return f"{_KEY_PREFIX}:{BUCKET_INGEST}:{plan}:{workspace_id}"
+    return _bucket_key(request, BUCKET_INGEST)
 
 
 def key_read(request: Request) -> str:
     """Bucket key for dashboard reads: per workspace, with the plan embedded."""
-    workspace_id, plan = _identity(request)
-    request.state.rl_bucket = BUCKET_READ
-    return f"{_KEY_PREFIX}:{BUCKET_READ}:{plan}:{workspace_id}"
+    return _bucket_key(request, BUCKET_READ)
 
 
 def key_export(request: Request) -> str:
@@ -163,9 +180,7 @@ def key_export(request: Request) -> str:
     Export has its own bucket (separate from ``read``) so its tighter tier
     throttles independently of list/get on the same workspace.
     """
-    workspace_id, plan = _identity(request)
-    request.state.rl_bucket = BUCKET_EXPORT
-    return f"{_KEY_PREFIX}:{BUCKET_EXPORT}:{plan}:{workspace_id}"
+    return _bucket_key(request, BUCKET_EXPORT)
 
 
 def resolve_limit(key: str) -> str:
@@ -218,12 +233,13 @@ def _record_exceeded(request: Request, retry_after: int) -> None:
         retry_after,
         storage,
     )
-    if _exceeded_counter is not None:
+    exceeded_counter = _get_exceeded_counter()
+    if exceeded_counter is not None:
         try:
             # Only bounded-cardinality attributes here. workspace_id is high
             # cardinality and would blow up a metrics backend — it stays in the
             # log line above for debugging, not on the metric.
-            _exceeded_counter.add(1, {"bucket": bucket, "plan": plan, "storage": storage})
+            exceeded_counter.add(1, {"bucket": bucket, "plan": plan, "storage": storage})
         except Exception:  # pragma: no cover - best-effort metric
             logger.debug("failed to record rate_limit.exceeded counter", exc_info=True)
 
@@ -315,12 +331,13 @@ def _build_limiter() -> Limiter:
     ``RATE_LIMIT_ENABLED=false`` also disables it on cloud.
     The billing gate is read once at startup; it does not change at runtime.
     """
-    enabled = settings.rate_limit.enabled and is_billing_enabled()
+    billing_enabled = is_billing_enabled()
+    enabled = settings.rate_limit.enabled and billing_enabled
     storage_uri = settings.rate_limit.storage_uri or settings.redis.url
     logger.info(
         "Initialising REST rate limiter (enabled=%s, billing_enabled=%s, storage=%s)",
         enabled,
-        is_billing_enabled(),
+        billing_enabled,
         "redis" if storage_uri.startswith("redis") else storage_uri,
     )
     return Limiter(
@@ -334,3 +351,10 @@ def _build_limiter() -> Limiter:
 
 
 limiter: Limiter = _build_limiter()
+
+# The shared read budget (see "Buckets" above). Every dashboard and public read
+# route applies this one prebuilt decorator instead of re-spelling (and
+# re-constructing) the same ``shared_limit`` call per route.
+read_limit = limiter.shared_limit(
+    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
+)
@@ -7,10 +7,12 @@ Plan-to-days mapping syncs with frontend/packages/core/src/ee/billing/plans.ts
 ENTITLEMENT_CONFIG (15d/30d/90d/custom-retention).
 """
 
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
 
+from rest.sql_utils import to_utc_naive, utc_now_naive
+
 _PLAN_RETENTION_DAYS: dict[str, int | None] = {
     "free": 15,
     "starter": 30,
@@ -21,12 +23,6 @@ _PLAN_RETENTION_DAYS: dict[str, int | None] = {
 _FAIL_CLOSED_DAYS = 15
 
 
-def _to_naive_utc(dt: datetime) -> datetime:
-    if dt.tzinfo is not None:
-        return dt.astimezone(UTC).replace(tzinfo=None)
-    return dt
-
-
 def get_retention_cutoff(billing_plan: str) -> datetime | None:
     """Return the cutoff datetime (naive UTC) for a plan, or None if unlimited.
 
@@ -36,7 +32,7 @@ def get_retention_cutoff(billing_plan: str) -> datetime | None:
     days = _PLAN_RETENTION_DAYS.get(billing_plan, _FAIL_CLOSED_DAYS)
     if days is None:
         return None
-    return datetime.now(UTC).replace(tzinfo=None) - timedelta(days=days, hours=1)
+    return utc_now_naive() - timedelta(days=days, hours=1)
 
 
 def _retention_403(billing_plan: str, cutoff: datetime) -> HTTPException:
@@ -60,13 +56,17 @@ def clamp_retention_window(
 
     Lists never 403 — the UI date picker prevents out-of-window selections,
     and this clamp is the server-side safety net. Returns the (possibly
-    adjusted) start_after and end_before.
+    adjusted) start_after and end_before. A clamped plan gets start_after back
+    already normalized to naive UTC, so the reader's own to_utc_naive is a
+    no-op instead of a second astimezone conversion.
     """
     cutoff = get_retention_cutoff(billing_plan)
     if cutoff is None:
         return start_after, end_before
 
-    if start_after is None or _to_naive_utc(start_after) < cutoff:
+    if start_after is not None:
+        start_after = to_utc_naive(start_after)
+    if start_after is None or start_after < cutoff:
         start_after = cutoff
 
     return start_after, end_before
@@ -80,5 +80,5 @@ def enforce_retention_by_time(
     cutoff = get_retention_cutoff(billing_plan)
     if cutoff is None:
         return
-    if timestamp is not None and _to_naive_utc(timestamp) < cutoff:
+    if timestamp is not None and to_utc_naive(timestamp) < cutoff:
         raise _retention_403(billing_plan, cutoff)
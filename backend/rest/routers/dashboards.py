@@ -5,17 +5,14 @@ detectors). This router only executes queries against ClickHouse and exposes
 the field registry that drives the builder UI.
 """
 
+import json
 import logging
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from rest.rate_limit import (
-    BUCKET_READ,
-    is_request_rate_limit_exempt,
-    key_read,
-    limiter,
-    resolve_limit,
+    read_limit,
 )
 from rest.retention import clamp_retention_window
 from rest.routers.deps import RateLimitedProjectAccess
@@ -31,10 +28,8 @@ router = APIRouter(prefix="/projects/{project_id}/widgets", tags=["Dashboards"])
 
 
 @router.get("/field-values/{view}/{field}", response_model=FilterValuesResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_widget_field_values(
+@read_limit
+def get_widget_field_values(
     request: Request,
     response: Response,
     project_id: str,
@@ -112,25 +107,28 @@ async def get_widget_field_values(
     return {"field": field, "values": values}
 
 
+# REGISTRY is fixed at import, so the builder schema is encoded once (with the
+# same compact separators FastAPI's JSONResponse uses) rather than per request.
+_REGISTRY_SCHEMA_BODY = json.dumps(
+    registry_schema(), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+).encode()
+
+
 @router.get("/schema")
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
+@read_limit
 async def get_widget_schema(
     request: Request,
     response: Response,
     project_id: str,
     _access: RateLimitedProjectAccess,  # Validates access + sets rate-limit identity
-) -> dict:
+) -> Response:
     """Field registry for the widget builder (views, fields, ops, aggs)."""
-    return registry_schema()
+    return Response(content=_REGISTRY_SCHEMA_BODY, media_type="application/json")
 
 
 @router.post("/query", response_model=WidgetQueryResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def query_widget_data(
+@read_limit
+def query_widget_data(
     request: Request,
     response: Response,
     project_id: str,
@@ -157,7 +155,7 @@ async def query_widget_data(
             detail={"step": e.step, "message": e.message},
         ) from e
     except Exception as e:
-        logger.exception(f"Widget query failed: {e}")
+        logger.exception("Widget query failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Widget query failed",
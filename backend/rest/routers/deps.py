@@ -2,94 +2,57 @@
 
 import hmac
 import logging
+from dataclasses import dataclass
 from typing import Annotated
 
 import httpx
 from fastapi import Depends, Header, HTTPException, Request, status
 
+from rest.auth_cache import AuthCache
 from rest.rate_limit import (
     clear_request_rate_limit_exempt,
     mark_request_rate_limit_exempt,
     set_rate_limit_identity,
 )
+from rest.ui_client import get_ui_client
 from shared.config import settings
 from shared.enums import MemberRole
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
 class ProjectAccessInfo:
-    """Information about user's access to a project."""
-
-    def __init__(
-        self,
-        project_id: str,
-        user_id: str,
-        role: str,
-        workspace_id: str = "",
-        billing_plan: str = "free",
-    ):
-        self.project_id = project_id
-        self.user_id = user_id
-        self.role = role
-        # Resolved for rate limiting (keyed per workspace, tiered by plan).
-        self.workspace_id = workspace_id
-        self.billing_plan = billing_plan
-
+    """Information about user's access to a project.
 
-async def get_project_access(
-    project_id: str,
-    x_user_id: Annotated[str | None, Header()] = None,
-    x_internal_secret: Annotated[str | None, Header()] = None,
-) -> ProjectAccessInfo:
+    Frozen: a successful check is cached and handed to every request from the
+    same caller within the TTL, so no request may mutate the shared instance.
     """
-    Validate user has access to a project via Next.js internal API.
 
-    Auth modes:
-    - x-user-id: User's unique ID (from session) — normal user-initiated requests.
-    - X-Internal-Secret: Shared secret — for trusted server-to-server calls
-      (e.g. the agent service running a system-initiated RCA session that has no
-      associated user). Bypasses the Next.js per-user access check; the agent
-      service is itself trusted to scope access correctly.
+    project_id: str
+    user_id: str
+    role: str
+    # Resolved for rate limiting (keyed per workspace, tiered by plan).
+    workspace_id: str = ""
+    billing_plan: str = "free"
 
-    Raises 401 if neither auth mode succeeds, 403 if no access, 404 if project
-    not found.
-    """
-    # Establish a clean per-request exemption baseline before deciding below
-    # (defense-in-depth against any stale ContextVar value).
-    clear_request_rate_limit_exempt()
 
-    # System bypass: agent service / worker calling on behalf of the system.
-    # Constant-time compare to avoid leaking the secret via response timing.
-    if (
-        x_internal_secret
-        and settings.internal_api_secret
-        and hmac.compare_digest(x_internal_secret, settings.internal_api_secret)
-    ):
-        # Trusted internal traffic is not rate limited (system-controlled volume)
-        # and exempt from retention gating (enterprise-equivalent access).
-        mark_request_rate_limit_exempt()
-        return ProjectAccessInfo(
-            project_id=project_id,
-            user_id=x_user_id or "system",
-            role=MemberRole.ADMIN,
-            billing_plan="enterprise",
-        )
+# Successful access checks keyed by (user_id, project_id); see rest.auth_cache.
+_project_access_cache: AuthCache[ProjectAccessInfo] = AuthCache()
 
-    if not x_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing x-user-id header",
-        )
 
-    # Validate access via Next.js internal API
+async def _validate_project_access(user_id: str, project_id: str) -> ProjectAccessInfo:
+    """Resolve ``user_id``'s access to ``project_id`` via the Next.js internal API.
+
+    Raises 401/403/404/503 exactly as ``get_project_access`` documents; only a
+    successful result reaches the cache.
+    """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{settings.traceroot_ui_url}/api/internal/validate-project-access",
-                json={"userId": x_user_id, "projectId": project_id},
-                headers={"X-Internal-Secret": settings.internal_api_secret},
-            )
+        response = await get_ui_client().post(
+            f"{settings.traceroot_ui_url}/api/internal/validate-project-access",
+            json={"userId": user_id, "projectId": project_id},
+            headers={"X-Internal-Secret": settings.internal_api_secret},
+        )
     except httpx.RequestError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -133,13 +96,65 @@ async def get_project_access(
 
     return ProjectAccessInfo(
         project_id=project_id,
-        user_id=x_user_id,
+        user_id=user_id,
         role=data.get("role", MemberRole.VIEWER),
         workspace_id=workspace_id,
         billing_plan=data.get("billingPlan", "free"),
     )
 
 
+async def get_project_access(
+    project_id: str,
+    x_user_id: Annotated[str | None, Header()] = None,
+    x_internal_secret: Annotated[str | None, Header()] = None,
+) -> ProjectAccessInfo:
+    """
+    Validate user has access to a project via Next.js internal API.
+
+    Auth modes:
+    - x-user-id: User's unique ID (from session) — normal user-initiated requests.
+    - X-Internal-Secret: Shared secret — for trusted server-to-server calls
+      (e.g. the agent service running a system-initiated RCA session that has no
+      associated user). Bypasses the Next.js per-user access check; the agent
+      service is itself trusted to scope access correctly.
+
+    Raises 401 if neither auth mode succeeds, 403 if no access, 404 if project
+    not found. Successful user checks are reused for
+    ``settings.auth_cache_ttl_seconds`` when it is set (see ``rest.auth_cache``).
+    """
+    # Establish a clean per-request exemption baseline before deciding below
+    # (defense-in-depth against any stale ContextVar value).
+    clear_request_rate_limit_exempt()
+
+    # System bypass: agent service / worker calling on behalf of the system.
+    # Constant-time compare to avoid leaking the secret via response timing.
+    if (
+        x_internal_secret
+        and settings.internal_api_secret
+        and hmac.compare_digest(x_internal_secret, settings.internal_api_secret)
+    ):
+        # Trusted internal traffic is not rate limited (system-controlled volume)
+        # and exempt from retention gating (enterprise-equivalent access).
+        mark_request_rate_limit_exempt()
+        return ProjectAccessInfo(
+            project_id=project_id,
+            user_id=x_user_id or "system",
+            role=MemberRole.ADMIN,
+            billing_plan="enterprise",
+        )
+
+    if not x_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing x-user-id header",
+        )
+
+    return await _project_access_cache.get_or_load(
+        (x_user_id, project_id),
+        lambda: _validate_project_access(x_user_id, project_id),
+    )
+
+
 ProjectAccess = Annotated[ProjectAccessInfo, Depends(get_project_access)]
 
 
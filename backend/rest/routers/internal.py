@@ -3,17 +3,25 @@
 These endpoints are protected by X-Internal-Secret header and not exposed publicly.
 """
 
+import asyncio
 import gzip
 import hmac
+import json
 import logging
 import re
 import zlib
+from collections.abc import Iterator
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Annotated, Any
+from decimal import Decimal
+from typing import Annotated, Any, cast
 
+from clickhouse_connect.driver.query import QueryResult
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from google.protobuf.message import DecodeError
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
 from db.clickhouse.client import ClickHouseClient, get_clickhouse_client
 from rest.routers.public.traces import decode_otlp_protobuf
@@ -27,8 +35,6 @@ from worker.detector_transform import UnattributableSpanError, transform_detecto
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/internal", tags=["internal"])
-
 # Caps for the digest LLM-summary sample (see the window-summary endpoint).
 # Enforced in ClickHouse so a finding storm never materializes unbounded rows.
 DIGEST_SUMMARY_MAX_PER_DETECTOR = 10
@@ -82,7 +88,7 @@ def _detector_summary_expr(finding_id_col: str) -> str:
     )
 
 
-def verify_internal_secret(
+async def verify_internal_secret(
     x_internal_secret: Annotated[str | None, Header()] = None,
 ) -> None:
     """Verify the internal API secret.
@@ -91,6 +97,10 @@ def verify_internal_secret(
     rather than silently allowing them. (Previous behavior treated an empty
     secret as "dev mode allow-all", which left the new detector write
     endpoints open to anonymous writes whenever the env var was unset.)
+
+    Declared ``async`` although it never awaits: FastAPI runs plain ``def``
+    dependencies in the threadpool, and this pure-CPU check guards every
+    internal request.
     """
     if not settings.internal_api_secret:
         raise HTTPException(
@@ -103,6 +113,15 @@ def verify_internal_secret(
         raise HTTPException(status_code=403, detail="Invalid internal secret")
 
 
+# Every internal endpoint requires the secret, so the check is declared once on
+# the router rather than repeated on each route.
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    dependencies=[Depends(verify_internal_secret)],
+)
+
+
 # =============================================================================
 # Usage Endpoints (for billing metering)
 # =============================================================================
@@ -121,9 +140,8 @@ class UsageDetailsResponse(BaseModel):
 @router.get(
     "/usage/total",
     response_model=UsageTotalResponse,
-    dependencies=[Depends(verify_internal_secret)],
 )
-async def get_usage_total(
+def get_usage_total(
     project_ids: str = Query(..., description="Comma-separated list of project IDs"),
     start: datetime = Query(..., description="Start of interval (ISO format)"),
     end: datetime = Query(..., description="End of interval (ISO format)"),
@@ -169,9 +187,8 @@ async def get_usage_total(
 @router.get(
     "/usage/details",
     response_model=UsageDetailsResponse,
-    dependencies=[Depends(verify_internal_secret)],
 )
-async def get_usage_details(
+def get_usage_details(
     project_ids: str = Query(..., description="Comma-separated list of project IDs"),
     start: datetime = Query(..., description="Start of interval (ISO format)"),
     end: datetime = Query(..., description="End of interval (ISO format)"),
@@ -188,55 +205,27 @@ async def get_usage_details(
     start_str = start.strftime("%Y-%m-%d %H:%M:%S")
     end_str = end.strftime("%Y-%m-%d %H:%M:%S")
 
-    # Query traces count — uniqExact dedups across pre-merge ReplacingMergeTree
-    # rows (a single trace can have multiple rows until background merge runs,
-    # e.g. on status update). uniqExact is faster than count(DISTINCT trace_id)
-    # in ClickHouse and produces identical results.
-    traces_result = ch.query(
-        """
-        SELECT uniqExact(trace_id) as total
-        FROM traces
-        WHERE project_id IN {project_ids:Array(String)}
-          AND ch_create_time >= {start:String}
-          AND ch_create_time < {end:String}
-        """,
-        parameters={
-            "project_ids": project_id_list,
-            "start": start_str,
-            "end": end_str,
-        },
-    )
-
-    # Query spans count — same uniqExact pattern for ReplacingMergeTree dedup
-    spans_result = ch.query(
-        """
-        SELECT uniqExact(span_id) as total
-        FROM spans
-        WHERE project_id IN {project_ids:Array(String)}
-          AND ch_create_time >= {start:String}
-          AND ch_create_time < {end:String}
-        """,
-        parameters={
-            "project_ids": project_id_list,
-            "start": start_str,
-            "end": end_str,
-        },
-    )
-
-    traces = int(traces_result.result_rows[0][0]) if traces_result.result_rows else 0
-    spans = int(spans_result.result_rows[0][0]) if spans_result.result_rows else 0
-
-    # Detector runs: count every scan attempt recorded by the detector worker
+    # All three counts in one round-trip (scalar subqueries, as in /usage/total).
+    # uniqExact dedups across pre-merge ReplacingMergeTree rows (a single trace
+    # can have multiple rows until background merge runs, e.g. on status update)
+    # and is faster than count(DISTINCT ...) with identical results.
+    # Detector runs count every scan attempt recorded by the detector worker
     # (BYOK + system source both count toward Free-plan hard cap).
-    # uniqExact on run_id dedups pre-merge duplicates in the ReplacingMergeTree —
-    # same pattern as the traces / spans queries above.
-    detector_runs_result = ch.query(
+    result = ch.query(
         """
-        SELECT uniqExact(run_id) as total
-        FROM detector_runs
-        WHERE project_id IN {project_ids:Array(String)}
-          AND timestamp >= {start:String}
-          AND timestamp < {end:String}
+        SELECT
+            (SELECT uniqExact(trace_id) FROM traces
+             WHERE project_id IN {project_ids:Array(String)}
+               AND ch_create_time >= {start:String}
+               AND ch_create_time < {end:String}) AS traces,
+            (SELECT uniqExact(span_id) FROM spans
+             WHERE project_id IN {project_ids:Array(String)}
+               AND ch_create_time >= {start:String}
+               AND ch_create_time < {end:String}) AS spans,
+            (SELECT uniqExact(run_id) FROM detector_runs
+             WHERE project_id IN {project_ids:Array(String)}
+               AND timestamp >= {start:String}
+               AND timestamp < {end:String}) AS detector_runs
         """,
         parameters={
             "project_ids": project_id_list,
@@ -244,9 +233,9 @@ async def get_usage_details(
             "end": end_str,
         },
     )
-    detector_runs = (
-        int(detector_runs_result.result_rows[0][0]) if detector_runs_result.result_rows else 0
-    )
+
+    row = result.result_rows[0] if result.result_rows else (0, 0, 0)
+    traces, spans, detector_runs = (int(v) for v in row)
 
     return UsageDetailsResponse(traces=traces, spans=spans, detector_runs=detector_runs)
 
@@ -272,6 +261,16 @@ class DetectorRunPayload(BaseModel):
     timestamp_ms: int | None = Field(default=None, alias="timestampMs")
 
 
+# Upper bound on runs per batch write. A worker settles one trace's detectors
+# at a time, so real batches are a handful of rows; the cap only bounds the
+# size of the generated INSERT.
+MAX_DETECTOR_RUN_BATCH = 500
+
+
+class DetectorRunBatchPayload(BaseModel):
+    runs: list[DetectorRunPayload] = Field(min_length=1, max_length=MAX_DETECTOR_RUN_BATCH)
+
+
 class DetectorFindingPayload(BaseModel):
     model_config = {"populate_by_name": True}
 
@@ -309,8 +308,38 @@ def _maybe_stamp_timestamp(
         params["timestamp_ms"] = timestamp_ms
 
 
-@router.post("/detector-runs", dependencies=[Depends(verify_internal_secret)])
-async def write_detector_run(body: DetectorRunPayload):
+# detector_runs columns every write supplies, with their parameter types, in
+# INSERT order. ``timestamp`` is handled separately (see _maybe_stamp_timestamp).
+_DETECTOR_RUN_COLUMNS = (
+    ("run_id", "String"),
+    ("detector_id", "String"),
+    ("project_id", "String"),
+    ("trace_id", "String"),
+    ("finding_id", "Nullable(String)"),
+    ("status", "String"),
+    ("self_traced", "Bool"),
+)
+
+
+def _detector_run_values(body: DetectorRunPayload, suffix: str = "") -> tuple[list[str], dict]:
+    """Build one detector_runs row's value placeholders and bound parameters.
+
+    Args:
+        body (DetectorRunPayload): The run to write.
+        suffix (str): Appended to every parameter name, so several rows can be
+            bound into one INSERT without their parameters colliding.
+
+    Returns:
+        tuple[list[str], dict]: Placeholders in ``_DETECTOR_RUN_COLUMNS``
+            order, and the parameters they reference.
+    """
+    vals = [f"{{{name}{suffix}:{ch_type}}}" for name, ch_type in _DETECTOR_RUN_COLUMNS]
+    params = {f"{name}{suffix}": getattr(body, name) for name, _ in _DETECTOR_RUN_COLUMNS}
+    return vals, params
+
+
+@router.post("/detector-runs")
+def write_detector_run(body: DetectorRunPayload) -> dict[str, bool]:
     """Record a detector run result in ClickHouse.
 
     A worker-supplied ``timestamp_ms`` is written into ``timestamp`` verbatim so
@@ -318,33 +347,8 @@ async def write_detector_run(body: DetectorRunPayload):
     otherwise ClickHouse defaults the column to ``now64(3)`` at INSERT.
     """
     ch = get_clickhouse_client()
-    cols = [
-        "run_id",
-        "detector_id",
-        "project_id",
-        "trace_id",
-        "finding_id",
-        "status",
-        "self_traced",
-    ]
-    vals = [
-        "{run_id:String}",
-        "{detector_id:String}",
-        "{project_id:String}",
-        "{trace_id:String}",
-        "{finding_id:Nullable(String)}",
-        "{status:String}",
-        "{self_traced:Bool}",
-    ]
-    params = {
-        "run_id": body.run_id,
-        "detector_id": body.detector_id,
-        "project_id": body.project_id,
-        "trace_id": body.trace_id,
-        "finding_id": body.finding_id,
-        "status": body.status,
-        "self_traced": body.self_traced,
-    }
+    cols = [name for name, _ in _DETECTOR_RUN_COLUMNS]
+    vals, params = _detector_run_values(body)
     _maybe_stamp_timestamp(cols, vals, params, body.timestamp_ms)
     ch.query(
         f"INSERT INTO detector_runs ({', '.join(cols)}) VALUES ({', '.join(vals)})",
@@ -353,8 +357,38 @@ async def write_detector_run(body: DetectorRunPayload):
     return {"ok": True}
 
 
-@router.post("/detector-findings", dependencies=[Depends(verify_internal_secret)])
-async def write_detector_finding(body: DetectorFindingPayload):
+@router.post("/detector-runs/batch")
+def write_detector_runs(body: DetectorRunBatchPayload) -> dict[str, bool]:
+    """Record several detector run results with a single ClickHouse INSERT.
+
+    The batch form of :func:`write_detector_run`, for a worker settling every
+    run of a trace at once: one request and one insert instead of one per run.
+    ``timestamp_ms`` behaves as there; a run without one gets ``now64(3)`` —
+    the column default — so rows with and without it share the INSERT.
+    """
+    ch = get_clickhouse_client()
+    cols = [name for name, _ in _DETECTOR_RUN_COLUMNS]
+    cols.append("timestamp")
+    rows: list[str] = []
+    params: dict = {}
+    for i, run in enumerate(body.runs):
+        vals, run_params = _detector_run_values(run, f"_{i}")
+        if run.timestamp_ms is None:
+            vals.append("now64(3)")
+        else:
+            vals.append(f"fromUnixTimestamp64Milli({{timestamp_ms_{i}:Int64}})")
+            run_params[f"timestamp_ms_{i}"] = run.timestamp_ms
+        rows.append(f"({', '.join(vals)})")
+        params.update(run_params)
+    ch.query(
+        f"INSERT INTO detector_runs ({', '.join(cols)}) VALUES {', '.join(rows)}",
+        parameters=params,
+    )
+    return {"ok": True}
+
+
+@router.post("/detector-findings")
+def write_detector_finding(body: DetectorFindingPayload) -> dict[str, bool]:
     """Record a detector finding in ClickHouse.
 
     ``timestamp_ms`` behaves as in :func:`write_detector_run`.
@@ -386,9 +420,8 @@ async def write_detector_finding(body: DetectorFindingPayload):
 @router.get(
     "/detector-runs",
     response_model=RunListResponse,
-    dependencies=[Depends(verify_internal_secret)],
 )
-async def list_detector_runs(
+def list_detector_runs(
     project_id: str,
     detector_id: str,
     page: int = Query(0, ge=0, description="Page number (0-indexed)"),
@@ -497,12 +530,7 @@ async def list_detector_runs(
     count_result = ch.query(count_query, parameters=params)
     total = count_result.result_rows[0][0] if count_result.result_rows else 0
 
-    runs = []
-    for row in result.result_rows:
-        row_dict = dict(zip(result.column_names, row))
-        if hasattr(row_dict.get("timestamp"), "isoformat"):
-            row_dict["timestamp"] = row_dict["timestamp"].isoformat()
-        runs.append(row_dict)
+    runs = [dict(zip(result.column_names, row)) for row in result.result_rows]
 
     return {
         "data": runs,
@@ -510,23 +538,38 @@ async def list_detector_runs(
     }
 
 
-@router.get(
-    "/traces/{trace_id}/spans-jsonl",
-    dependencies=[Depends(verify_internal_secret)],
-)
-async def get_spans_jsonl(trace_id: str, project_id: str):
-    """Return all spans for a trace as newline-delimited JSON."""
-    import json
+def _spans_jsonl_default(obj: Any) -> Any:
+    """Encode the non-JSON ClickHouse column types of a spans row."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
-    from fastapi.responses import PlainTextResponse
+# Built once: json.dumps(..., default=...) constructs a fresh encoder on every
+# call, which on this route is once per exported span.
+_SPANS_JSONL_ENCODER = json.JSONEncoder(default=_spans_jsonl_default)
 
+
+@router.get("/traces/{trace_id}/spans-jsonl")
+def get_spans_jsonl(trace_id: str, project_id: str) -> StreamingResponse:
+    """Return all spans for a trace as newline-delimited JSON.
+
+    Rows are streamed from ClickHouse one block at a time and written out as
+    they arrive, so a large trace starts reaching the caller before the scan
+    finishes and is never held in memory in full. The query and its first block
+    are read before the response is built, so an error there surfaces as a 500;
+    an error on a later block aborts the 200 mid-body, leaving the caller a
+    truncated stream. The ClickHouse stream is closed however the body ends.
+    """
     ch = get_clickhouse_client()
     # Dedup ReplacingMergeTree rows without FINAL (FINAL scans all parts and
     # defeats the trace_id-first sort key / no-IO projection): keep the latest
     # version per span_id, then order for output. span_start_time is only
     # ms-precision, so sub-ms parallel siblings need span_end_time + span_id as
     # stable tie-breakers for deterministic export ordering.
-    result = ch.query(
+    stream = ch.query_rows_stream(
         """SELECT * FROM (
                SELECT * FROM spans
                WHERE trace_id = {trace_id:String} AND project_id = {project_id:String}
@@ -536,28 +579,44 @@ async def get_spans_jsonl(trace_id: str, project_id: str):
            ORDER BY span_start_time ASC, span_end_time ASC, span_id ASC""",
         parameters={"trace_id": trace_id, "project_id": project_id},
     )
-
-    def _default(obj):
-        if hasattr(obj, "isoformat"):
-            return obj.isoformat()
-        from decimal import Decimal
-
-        if isinstance(obj, Decimal):
-            return float(obj)
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-
-    lines = [
-        json.dumps(dict(zip(result.column_names, row)), default=_default)
-        for row in result.result_rows
-    ]
-    return PlainTextResponse("\n".join(lines))
+    column_names = cast(QueryResult, stream.source).column_names
+    encode = _SPANS_JSONL_ENCODER.encode
+    closer = ExitStack()
+    closer.enter_context(stream)
+    # Read the first block before the response exists, so a failing query or
+    # first block is raised here (a 500) rather than after the 200 headers.
+    try:
+        first_block = next(stream, None)
+    except BaseException:
+        closer.close()
+        raise
+
+    def _lines() -> Iterator[str]:
+        # Sync generator: Starlette drains it in a worker thread, keeping the
+        # blocking socket reads off the event loop. Lines are newline-joined with
+        # no trailing newline, matching the previous buffered body.
+        try:
+            if first_block is None:
+                return
+            yield "\n".join(encode(dict(zip(column_names, row))) for row in first_block)
+            for block in stream:
+                yield "\n" + "\n".join(encode(dict(zip(column_names, row))) for row in block)
+        finally:
+            closer.close()
+
+    # The generator's ``finally`` covers a body that started, even one abandoned
+    # mid-stream; a client that disconnects before the first chunk never starts
+    # the generator, so the background task closes the stream in that case.
+    # ExitStack.close is a no-op the second time.
+    return StreamingResponse(
+        _lines(),
+        media_type="text/plain; charset=utf-8",
+        background=BackgroundTask(closer.close),
+    )
 
 
-@router.get(
-    "/traces/{trace_id}/time-since-last-span",
-    dependencies=[Depends(verify_internal_secret)],
-)
-async def get_time_since_last_span(trace_id: str, project_id: str):
+@router.get("/traces/{trace_id}/time-since-last-span")
+def get_time_since_last_span(trace_id: str, project_id: str) -> dict[str, int]:
     """Report how long a trace has been quiet — milliseconds since its last span.
 
     The detector worker waits until this reaches EVALUATOR_DELAY before
@@ -589,17 +648,15 @@ async def get_time_since_last_span(trace_id: str, project_id: str):
     return {"time_since_last_span_ms": age}
 
 
-@router.get(
-    "/traces/{trace_id}/findings",
-    dependencies=[Depends(verify_internal_secret)],
-)
-async def get_trace_findings(trace_id: str, project_id: str):
+@router.get("/traces/{trace_id}/findings")
+def get_trace_findings(trace_id: str, project_id: str) -> dict[str, list[dict[str, Any]]]:
     """List all detector findings recorded for a single trace.
 
     Queries the ``detector_findings`` table with ``FINAL`` so pre-merge
     ReplacingMergeTree duplicates (a finding can be re-written under the same
     deterministic ``finding_id`` on a retry) collapse to one row per finding.
-    Timestamps are normalised to ISO-8601 strings for JSON serialisation.
+    Rows are returned with their native ``datetime`` timestamps; the response
+    serializer renders them as ISO-8601 in a single pass.
 
     Args:
         trace_id (str): Trace whose findings to return.
@@ -619,20 +676,12 @@ async def get_trace_findings(trace_id: str, project_id: str):
            ORDER BY timestamp DESC""",
         parameters={"trace_id": trace_id, "project_id": project_id},
     )
-    findings = []
-    for row in result.result_rows:
-        row_dict = dict(zip(result.column_names, row))
-        if hasattr(row_dict.get("timestamp"), "isoformat"):
-            row_dict["timestamp"] = row_dict["timestamp"].isoformat()
-        findings.append(row_dict)
+    findings = [dict(zip(result.column_names, row)) for row in result.result_rows]
     return {"findings": findings}
 
 
-@router.get(
-    "/traces/{trace_id}/detector-runs",
-    dependencies=[Depends(verify_internal_secret)],
-)
-async def list_trace_detector_runs(trace_id: str, project_id: str):
+@router.get("/traces/{trace_id}/detector-runs")
+def list_trace_detector_runs(trace_id: str, project_id: str) -> dict[str, list[dict[str, Any]]]:
     """List every detector run recorded against a single trace.
 
     Both ``detector_runs`` and ``detector_findings`` are ReplacingMergeTree
@@ -676,12 +725,7 @@ async def list_trace_detector_runs(trace_id: str, project_id: str):
     """
     result = ch.query(query, parameters={"trace_id": trace_id, "project_id": project_id})
 
-    runs = []
-    for row in result.result_rows:
-        row_dict = dict(zip(result.column_names, row))
-        if hasattr(row_dict.get("timestamp"), "isoformat"):
-            row_dict["timestamp"] = row_dict["timestamp"].isoformat()
-        runs.append(row_dict)
+    runs = [dict(zip(result.column_names, row)) for row in result.result_rows]
     return {"runs": runs}
 
 
@@ -805,9 +849,8 @@ def _fetch_sample_summaries(
 @router.get(
     "/detector-window-summary",
     response_model=DetectorWindowSummaryResponse,
-    dependencies=[Depends(verify_internal_secret)],
 )
-async def list_detector_window_summary(
+def list_detector_window_summary(
     project_id: str,
     start_after: datetime = Query(
         ..., description="Lower bound on detector_runs.timestamp (inclusive)"
@@ -898,18 +941,18 @@ async def list_detector_window_summary(
     """
 
     result = ch.query(query, parameters=params)
-    data: dict[str, dict] = {}
-    for row in result.result_rows:
-        row_dict = dict(zip(result.column_names, row))
-        # One representative trace today, shaped as a list so surfacing more
-        # later (groupArray in the query) needs no contract change. "" (a
-        # detector that ran but never fired) collapses to an empty list.
-        latest_trace_id = row_dict["latest_trace_id"]
-        data[row_dict["detector_id"]] = {
-            "finding_count": int(row_dict["finding_count"]),
-            "run_count": int(row_dict["run_count"]),
+    # Rows unpack positionally in the SELECT's column order — no per-row dict.
+    # One representative trace today, shaped as a list so surfacing more later
+    # (groupArray in the query) needs no contract change. "" (a detector that ran
+    # but never fired) collapses to an empty list.
+    data: dict[str, dict] = {
+        detector_id: {
+            "finding_count": int(finding_count),
+            "run_count": int(run_count),
             "sample_trace_ids": [latest_trace_id] if latest_trace_id else [],
         }
+        for detector_id, run_count, finding_count, latest_trace_id in result.result_rows
+    }
 
     if include_summaries and any(v["finding_count"] > 0 for v in data.values()):
         for detector_id, summaries in _fetch_sample_summaries(ch, window_clause, params).items():
@@ -927,56 +970,23 @@ _TRACE_ID_RE = re.compile(r"^[0-9a-f]{32}$")
 _SPAN_ID_RE = re.compile(r"^[0-9a-f]{16}$")
 
 
-@router.post("/traces", dependencies=[Depends(verify_internal_secret)])
-async def ingest_internal_traces(
-    request: Request,
-    project_id: str | None = Query(
-        default=None, description="Fallback project for spans without a per-span attribute"
-    ),
-    x_project_id: Annotated[str | None, Header()] = None,
-) -> dict:
-    """Ingest detector self-traces (OTLP protobuf) directly into ClickHouse.
-
-    Trusted, internal-only counterpart of the public OTLP ingest: the worker
-    posts here with the shared secret, spans run through the detector-only
-    multi-project wrapper (which calls the same transform as customer traffic,
-    once per project group), and the rows are inserted in-process — no S3 hop and
-    no detection enqueue, so a detector can never scan its own emission. Spans are inserted before the trace row
-    so a partial failure cannot leave a trace row that points at missing
-    spans. Every record is force-stamped source='detector' regardless of
-    payload content.
+def _ingest_detector_otlp(
+    body: bytes, content_encoding: str, fallback_project_id: str | None
+) -> None:
+    """Decode, validate, stamp and insert one internal OTLP batch.
 
-    Project attribution is per-span and primary: the worker serves every
-    project off one queue, so each span carries its own
-    ``traceroot.project_id`` attribute. The request-level project id (header
-    or query) is only a fallback for spans without the attribute.
+    The blocking half of :func:`ingest_internal_traces`, run off the event loop.
 
     Args:
-        request (Request): Raw request; body is OTLP protobuf, optionally
-            gzip-compressed (Content-Encoding: gzip).
-        project_id (str | None): Fallback project for spans without a
-            per-span attribute, as a query parameter; trusted because the
-            route is secret-gated.
-        x_project_id (str | None): Same, as the X-Project-Id header. The
-            header wins when both are given. Optional — a batch whose every
-            span carries the per-span attribute needs neither.
-
-    Returns:
-        dict: ``{"ok": True}`` on success.
+        body (bytes): Raw request body, non-empty.
+        content_encoding (str): The request's Content-Encoding header.
+        fallback_project_id (str | None): Project for spans without a per-span
+            attribute.
 
     Raises:
-        HTTPException: 400 on an empty body, an undecodable payload, a span
-            with neither a per-span project attribute nor a request-level
-            fallback, a trace id that is not exactly 32 lowercase hex chars,
-            or a span/parent id that is present but not exactly 16.
+        HTTPException: 400 on any payload the route rejects (see the route).
     """
-    fallback_project_id = x_project_id or project_id
-
-    body = await request.body()
-    if not body:
-        raise HTTPException(status_code=400, detail="Empty request body")
-
-    if "gzip" in request.headers.get("content-encoding", "").lower():
+    if "gzip" in content_encoding.lower():
         try:
             body = gzip.decompress(body)
         except (OSError, EOFError, zlib.error) as e:
@@ -1026,4 +1036,63 @@ async def ingest_internal_traces(
     ch = get_clickhouse_client()
     ch.insert_spans_batch(spans)
     ch.insert_traces_batch(traces)
+
+
+@router.post("/traces")
+async def ingest_internal_traces(
+    request: Request,
+    project_id: str | None = Query(
+        default=None, description="Fallback project for spans without a per-span attribute"
+    ),
+    x_project_id: Annotated[str | None, Header()] = None,
+) -> dict:
+    """Ingest detector self-traces (OTLP protobuf) directly into ClickHouse.
+
+    Trusted, internal-only counterpart of the public OTLP ingest: the worker
+    posts here with the shared secret, spans run through the detector-only
+    multi-project wrapper (which calls the same transform as customer traffic,
+    once per project group), and the rows are inserted in-process — no S3 hop and
+    no detection enqueue, so a detector can never scan its own emission. Spans are inserted before the trace row
+    so a partial failure cannot leave a trace row that points at missing
+    spans. Every record is force-stamped source='detector' regardless of
+    payload content.
+
+    Project attribution is per-span and primary: the worker serves every
+    project off one queue, so each span carries its own
+    ``traceroot.project_id`` attribute. The request-level project id (header
+    or query) is only a fallback for spans without the attribute.
+
+    Args:
+        request (Request): Raw request; body is OTLP protobuf, optionally
+            gzip-compressed (Content-Encoding: gzip).
+        project_id (str | None): Fallback project for spans without a
+            per-span attribute, as a query parameter; trusted because the
+            route is secret-gated.
+        x_project_id (str | None): Same, as the X-Project-Id header. The
+            header wins when both are given. Optional — a batch whose every
+            span carries the per-span attribute needs neither.
+
+    Returns:
+        dict: ``{"ok": True}`` on success.
+
+    Raises:
+        HTTPException: 400 on an empty body, an undecodable payload, a span
+            with neither a per-span project attribute nor a request-level
+            fallback, a trace id that is not exactly 32 lowercase hex chars,
+            or a span/parent id that is present but not exactly 16.
+    """
+    fallback_project_id = x_project_id or project_id
+
+    body = await request.body()
+    if not body:
+        raise HTTPException(status_code=400, detail="Empty request body")
+
+    # Decompress, decode, transform and insert are all blocking; run them on a
+    # worker thread so a large batch does not stall the event loop.
+    await asyncio.to_thread(
+        _ingest_detector_otlp,
+        body,
+        request.headers.get("content-encoding", ""),
+        fallback_project_id,
+    )
     return {"ok": True}
@@ -8,7 +8,7 @@ import asyncio
 import json
 import logging
 import time
-from datetime import UTC, datetime
+from datetime import datetime
 
 from fastapi import APIRouter, Request
 from starlette.responses import StreamingResponse
@@ -16,6 +16,7 @@ from starlette.responses import StreamingResponse
 from rest.retention import enforce_retention_by_time
 from rest.routers.deps import ProjectAccess
 from rest.services.trace_reader import get_trace_reader_service
+from rest.sql_utils import utc_now_naive
 from shared.config import settings
 
 logger = logging.getLogger(__name__)
@@ -86,39 +87,49 @@ async def live_trace_stream(
     reach the client before trace_complete closes the frontend stream.
     """
 
-    from shared.redis import get_async_redis_client
+    from shared.redis import get_async_redis_client, live_trace_channel
 
     redis_client = get_async_redis_client()
     pubsub = redis_client.pubsub()
-    channel = f"trace:live:{project_id}:{trace_id}"
-
-    # Subscribe FIRST so no live events are lost during subsequent checks.
-    await pubsub.subscribe(channel)
-    logger.info(f"SSE client subscribed to {channel}")
-
-    # Retention check after subscribe but before StreamingResponse — a 403
-    # here is still a proper HTTP error (response headers not yet sent).
+    channel = live_trace_channel(project_id, trace_id)
+
+    # Retention check before StreamingResponse — a 403 here is still a proper
+    # HTTP error (response headers not yet sent). The start-time lookup reads
+    # only immutable trace data, so it needs no ordering against the
+    # subscription and is started first to overlap the SUBSCRIBE round-trip.
+    # The completion-state query must see everything published before the
+    # subscription, so it starts only once subscribed — no live event is lost
+    # between the two. If any step fails the TaskGroup cancels the rest.
     try:
         service = get_trace_reader_service()
-        trace_start_time = await asyncio.to_thread(
-            service.get_trace_start_time, project_id, trace_id
-        )
-        enforce_retention_by_time(_access.billing_plan, trace_start_time)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                start_task = tg.create_task(
+                    asyncio.to_thread(service.get_trace_start_time, project_id, trace_id)
+                )
+                await pubsub.subscribe(channel)
+                logger.info("SSE client subscribed to %s", channel)
+                state_task = tg.create_task(
+                    asyncio.to_thread(_completion_state_in_clickhouse, project_id, trace_id)
+                )
+        except ExceptionGroup as eg:
+            # Surface the underlying error, not the group, so FastAPI's
+            # handlers still see an HTTPException or a plain 500.
+            raise eg.exceptions[0] from None
+        enforce_retention_by_time(_access.billing_plan, start_task.result())
     except BaseException:
         await pubsub.unsubscribe(channel)
         await pubsub.close()
         raise
 
+    # Whether ClickHouse already has a root span with an end time. That starts
+    # the quiet window, but it does not immediately close the stream:
+    # distributed traces can still receive descendant spans after the root
+    # wrapper has finished.
+    root_end_time, last_ingest_time = state_task.result()
+
     async def event_generator():
         try:
-            # Check whether ClickHouse already has a root span with an end time.
-            # That starts the quiet window, but it does not immediately close the
-            # stream: distributed traces can still receive descendant spans after
-            # the root wrapper has finished.
-            root_end_time, last_ingest_time = await asyncio.to_thread(
-                _completion_state_in_clickhouse, project_id, trace_id
-            )
-
             completion_deadline = None
             if root_end_time is not None:
                 # Anchor the quiet window to the LATEST of root end and last
@@ -129,7 +140,7 @@ async def live_trace_stream(
                 # ClickHouse stores naive UTC timestamps; clamp age at 0
                 # against clock skew.
                 anchor = max(root_end_time, last_ingest_time or root_end_time)
-                now_utc = datetime.now(UTC).replace(tzinfo=None)
+                now_utc = utc_now_naive()
                 age = max(0.0, (now_utc - anchor).total_seconds())
                 completion_deadline = time.monotonic() + max(
                     0.0, TRACE_COMPLETE_QUIET_SECONDS - age
@@ -189,7 +200,7 @@ async def live_trace_stream(
         finally:
             await pubsub.unsubscribe(channel)
             await pubsub.close()
-            logger.info(f"SSE client disconnected from {channel}")
+            logger.info("SSE client disconnected from %s", channel)
 
     return StreamingResponse(
         event_generator(),
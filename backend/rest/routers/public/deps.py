@@ -7,21 +7,25 @@ delegated to the Next.js internal ``validate-api-key`` route, which owns the
 Postgres/Prisma control-plane data.
 """
 
+import asyncio
 import hashlib
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Annotated
 
 import httpx
 from fastapi import Depends, Header, HTTPException, Request, status
 
+from rest.auth_cache import AuthCache
 from rest.rate_limit import clear_request_rate_limit_exempt, set_rate_limit_identity
+from rest.ui_client import get_ui_client
 from shared.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AuthResult:
     """Result of API key authentication.
 
@@ -29,6 +33,9 @@ class AuthResult:
     (``project_name``/``workspace_name``/``key_name``/``key_hint``) power the
     ``whoami`` endpoint; they are optional because ``validate-api-key`` may not
     return them, and ingestion does not need them.
+
+    Frozen because cached results are shared across requests (see
+    ``_api_key_cache``).
     """
 
     project_id: str
@@ -41,41 +48,24 @@ class AuthResult:
     key_hint: str | None = None
 
 
-async def authenticate_api_key(
-    authorization: Annotated[str | None, Header()] = None,
-) -> AuthResult:
-    """Authenticate the request via the Next.js internal validate-api-key route.
+# Successful API-key validations keyed by key hash; see rest.auth_cache.
+_api_key_cache: AuthCache[AuthResult] = AuthCache()
 
-    Expects ``Authorization: Bearer <api_key>``. The raw key is hashed before it
-    leaves this process; the full token is never forwarded or logged.
-    """
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing Authorization header",
-        )
 
-    parts = authorization.split(" ", 1)
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid Authorization header format. Expected: Bearer <api_key>",
-        )
-
-    api_key = parts[1]
-    # SHA256 is appropriate for API keys (high-entropy random UUIDs, not user passwords).
-    # codeql[py/weak-sensitive-data-hashing]
-    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+async def _validate_api_key(key_hash: str) -> AuthResult:
+    """Resolve an API-key hash to its project/workspace via validate-api-key.
 
+    Raises 401/503 exactly as ``authenticate_api_key`` documents; only a
+    successful result reaches the cache.
+    """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{settings.traceroot_ui_url}/api/internal/validate-api-key",
-                json={"keyHash": key_hash},
-                headers={"X-Internal-Secret": settings.internal_api_secret},
-            )
+        response = await get_ui_client().post(
+            f"{settings.traceroot_ui_url}/api/internal/validate-api-key",
+            json={"keyHash": key_hash},
+            headers={"X-Internal-Secret": settings.internal_api_secret},
+        )
     except httpx.RequestError as e:
-        logger.error(f"Failed to validate API key: {e}")
+        logger.error("Failed to validate API key: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service unavailable",
@@ -88,7 +78,7 @@ async def authenticate_api_key(
         )
 
     if response.status_code != 200:
-        logger.error(f"Unexpected response from auth service: {response.status_code}")
+        logger.error("Unexpected response from auth service: %s", response.status_code)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service error",
@@ -99,7 +89,7 @@ async def authenticate_api_key(
     try:
         data = response.json()
     except ValueError as e:
-        logger.error(f"Malformed JSON from auth service: {e}")
+        logger.error("Malformed JSON from auth service: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service error",
@@ -125,7 +115,7 @@ async def authenticate_api_key(
         billing_plan = data["billingPlan"]
         ingestion_blocked = data["ingestionBlocked"]
     except KeyError as e:
-        logger.error(f"Auth service response missing required field: {e}")
+        logger.error("Auth service response missing required field: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Authentication service error",
@@ -163,6 +153,36 @@ async def authenticate_api_key(
     )
 
 
+async def authenticate_api_key(
+    authorization: Annotated[str | None, Header()] = None,
+) -> AuthResult:
+    """Authenticate the request via the Next.js internal validate-api-key route.
+
+    Expects ``Authorization: Bearer <api_key>``. The raw key is hashed before it
+    leaves this process; the full token is never forwarded or logged. Successful
+    validations are reused for ``settings.auth_cache_ttl_seconds`` when it is set.
+    """
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing Authorization header",
+        )
+
+    parts = authorization.split(" ", 1)
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid Authorization header format. Expected: Bearer <api_key>",
+        )
+
+    api_key = parts[1]
+    # SHA256 is appropriate for API keys (high-entropy random UUIDs, not user passwords).
+    # codeql[py/weak-sensitive-data-hashing]
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+
+    return await _api_key_cache.get_or_load((key_hash,), lambda: _validate_api_key(key_hash))
+
+
 Auth = Annotated[AuthResult, Depends(authenticate_api_key)]
 
 
@@ -191,3 +211,68 @@ async def authenticate_and_stamp_identity(request: Request, auth: Auth) -> AuthR
 
 
 StampedAuth = Annotated[AuthResult, Depends(authenticate_and_stamp_identity)]
+
+
+@dataclass(slots=True)
+class _ExportSlots:
+    """A workspace's export semaphore plus how many requests hold or await it."""
+
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+# Per-workspace export slots, created on first use and dropped once the last
+# request holding or waiting on them finishes, so idle workspaces cost nothing.
+_export_slots: dict[str, _ExportSlots] = {}
+
+
+async def acquire_export_slot(auth: StampedAuth) -> AsyncIterator[AuthResult]:
+    """Hold one of the workspace's concurrent-export slots for the request.
+
+    The rate limiter bounds how many exports a workspace starts per window, not
+    how many run at once; a burst within budget could still pin every threadpool
+    worker and ClickHouse connection on full-I/O reads. This caps the in-flight
+    count per workspace at ``settings.max_concurrent_exports_per_workspace`` (per
+    process); excess requests wait on the event loop without holding a thread,
+    for at most ``settings.export_slot_wait_seconds``. The slot is released once
+    the response, including a streamed body, is sent.
+
+    Args:
+        auth (StampedAuth): Authenticated, identity-stamped API-key context.
+
+    Yields:
+        AuthResult: ``auth``, passed through to the route handler.
+
+    Raises:
+        HTTPException: 429 if no slot frees up within the wait limit.
+    """
+    limit = settings.max_concurrent_exports_per_workspace
+    if limit <= 0:
+        yield auth
+        return
+    slots = _export_slots.get(auth.workspace_id)
+    if slots is None:
+        slots = _export_slots[auth.workspace_id] = _ExportSlots(asyncio.Semaphore(limit))
+    # Counted before the wait so the entry cannot be dropped (and a second
+    # semaphore created) while requests are still queued on this one.
+    slots.users += 1
+    try:
+        try:
+            async with asyncio.timeout(settings.export_slot_wait_seconds):
+                await slots.semaphore.acquire()
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many concurrent exports for this workspace; retry shortly",
+            ) from None
+        try:
+            yield auth
+        finally:
+            slots.semaphore.release()
+    finally:
+        slots.users -= 1
+        if slots.users == 0:
+            del _export_slots[auth.workspace_id]
+
+
+ExportAuth = Annotated[AuthResult, Depends(acquire_export_slot)]
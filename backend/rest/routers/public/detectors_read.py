@@ -12,11 +12,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from rest.rate_limit import (
-    BUCKET_READ,
-    is_request_rate_limit_exempt,
-    key_read,
-    limiter,
-    resolve_limit,
+    read_limit,
 )
 from rest.retention import clamp_retention_window, enforce_retention_by_time
 from rest.routers.public.deps import StampedAuth
@@ -34,10 +30,8 @@ router = APIRouter(prefix="/public/detectors", tags=["Detectors (Public)"])
 
 
 @router.get("", response_model=PublicDetectorListResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def list_detectors(
+@read_limit
+def list_detectors(
     request: Request,
     response: Response,
     auth: StampedAuth,
@@ -59,7 +53,7 @@ async def list_detectors(
             end_before=end_before,
         )
     except Exception as e:
-        logger.exception(f"Error listing detectors: {e}")
+        logger.exception("Error listing detectors: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list detectors",
@@ -71,10 +65,8 @@ async def list_detectors(
 
 
 @router.get("/findings", response_model=PublicFindingListResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def list_findings(
+@read_limit
+def list_findings(
     request: Request,
     response: Response,
     auth: StampedAuth,
@@ -101,7 +93,7 @@ async def list_findings(
             trace_id=trace_id,
         )
     except Exception as e:
-        logger.exception(f"Error listing detector findings: {e}")
+        logger.exception("Error listing detector findings: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list findings",
@@ -113,10 +105,8 @@ async def list_findings(
 
 
 @router.get("/findings/{finding_id}", response_model=FindingDetail)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_finding(
+@read_limit
+def get_finding(
     request: Request,
     response: Response,
     auth: StampedAuth,
@@ -130,10 +120,8 @@ async def get_finding(
 
 
 @router.get("/traces/{trace_id}/finding", response_model=FindingDetail)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_finding_by_trace(
+@read_limit
+def get_finding_by_trace(
     request: Request,
     response: Response,
     auth: StampedAuth,
@@ -151,7 +139,7 @@ def _require_finding(fetch: Callable[[], FindingDetail | None], billing_plan: st
     try:
         finding = fetch()
     except Exception as e:
-        logger.exception(f"Error reading detector finding: {e}")
+        logger.exception("Error reading detector finding: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to read finding",
@@ -5,9 +5,17 @@ the identical payload, and that `git_context` is assembled the same way
 everywhere.
 """
 
+from collections.abc import Iterator
+
+from rest.schemas.public import ExportManifest, GitContext, PublicTraceDetailResponse
+from rest.schemas.traces import SpanResponse
 from rest.url_utils import build_trace_url
 from shared.config import settings
 
+# Spans encoded per yielded chunk. A sync body iterator costs one threadpool hop
+# per chunk, so one chunk per span would trade the buffer for scheduling overhead.
+_EXPORT_SPANS_PER_CHUNK = 64
+
 
 def public_trace_detail(trace: dict, project_id: str) -> dict:
     """The public `traces get` payload: the trace dict + a backend-built trace_url."""
@@ -57,3 +65,55 @@ def export_bundle(trace: dict, project_id: str) -> dict:
         "spans": detail["spans"],
         "git_context": git_context(trace),
     }
+
+
+def export_bundle_json(trace: dict, project_id: str) -> Iterator[bytes]:
+    """Encode the V1 export bundle as a stream of JSON byte chunks.
+
+    Produces the same document as serializing ``export_bundle`` through
+    ``PublicTraceExportResponse``, without holding the whole encoded body: spans
+    are encoded a chunk at a time as the response is sent. Each span is validated
+    once even though it appears in both ``trace.spans`` and ``spans``.
+
+    Validation runs eagerly, before the returned iterator is consumed, so a row
+    that does not fit the schema still fails the request with a 500 instead of
+    truncating a 200 mid-body.
+
+    Args:
+        trace (dict): Trace detail dict from the reader, with its ``spans``.
+        project_id (str): Project that owns the trace.
+
+    Returns:
+        Iterator[bytes]: Chunks whose concatenation is the bundle's JSON.
+    """
+    bundle = export_bundle(trace, project_id)
+    spans = [SpanResponse.model_validate(span) for span in bundle["spans"]]
+    detail = PublicTraceDetailResponse.model_validate({**bundle["trace"], "spans": []})
+    manifest = ExportManifest.model_validate(bundle["manifest"])
+    context = GitContext.model_validate(bundle["git_context"])
+    return _export_bundle_chunks(manifest, detail, spans, context)
+
+
+def _export_bundle_chunks(
+    manifest: ExportManifest,
+    detail: PublicTraceDetailResponse,
+    spans: list[SpanResponse],
+    context: GitContext,
+) -> Iterator[bytes]:
+    """Yield the validated bundle parts as JSON, splicing ``spans`` in twice."""
+    yield b'{"manifest":' + manifest.model_dump_json().encode()
+    # The detail without its spans ends in "}"; reopen it to append the array.
+    yield b',"trace":' + detail.model_dump_json(exclude={"spans"}).encode()[:-1]
+    yield b',"spans":['
+    yield from _span_array_chunks(spans)
+    yield b']},"spans":['
+    yield from _span_array_chunks(spans)
+    yield b'],"git_context":' + context.model_dump_json().encode() + b"}"
+
+
+def _span_array_chunks(spans: list[SpanResponse]) -> Iterator[bytes]:
+    """Yield the comma-separated JSON of ``spans`` (no brackets) in batches."""
+    for start in range(0, len(spans), _EXPORT_SPANS_PER_CHUNK):
+        batch = spans[start : start + _EXPORT_SPANS_PER_CHUNK]
+        chunk = b",".join(span.model_dump_json().encode() for span in batch)
+        yield chunk if start == 0 else b"," + chunk
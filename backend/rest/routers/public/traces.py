@@ -11,6 +11,7 @@ Authentication is via API key in the Authorization header:
     Authorization: Bearer <api_key>
 """
 
+import asyncio
 import gzip
 import logging
 import uuid
@@ -76,6 +77,80 @@ class IngestResponse(BaseModel):
     file_key: str
 
 
+def _store_and_enqueue(body: bytes, content_encoding: str, project_id: str) -> str:
+    """Decode an OTLP batch, store it in S3 and enqueue its processing task.
+
+    Everything here blocks (gzip, protobuf decode, the S3 PUT, the broker
+    publish), so the route runs it on a worker thread.
+
+    Args:
+        body (bytes): Raw request body, non-empty.
+        content_encoding (str): The request's Content-Encoding header.
+        project_id (str): Project the batch belongs to.
+
+    Returns:
+        str: The S3 key the batch was stored under.
+
+    Raises:
+        HTTPException: 400 on an undecodable payload, 500 when S3 rejects it.
+    """
+    # 2. Decompress if gzip
+    if "gzip" in content_encoding.lower():
+        try:
+            body = gzip.decompress(body)
+        except Exception as e:
+            logger.warning("Failed to decompress gzip: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid gzip payload",
+            ) from e
+
+    # 3. Decode protobuf to camelCase JSON (OTLP standard format)
+    try:
+        trace_data = decode_otlp_protobuf(body)
+        logger.debug("Decoded OTLP protobuf to JSON")
+    except Exception as e:
+        logger.warning("Failed to parse OTLP protobuf: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to parse OTLP protobuf: {e}",
+        ) from e
+
+    # 4. Generate S3 key (time-partitioned)
+    now = datetime.now(UTC)
+    file_id = str(uuid.uuid4())
+    s3_key = (
+        f"events/otel/{project_id}/"
+        f"{now.year}/{now.month:02d}/{now.day:02d}/{now.hour:02d}/"
+        f"{file_id}.json"
+    )
+
+    # 5. Upload JSON to S3
+    try:
+        s3_service = get_s3_service()
+        s3_service.ensure_bucket_exists()
+        s3_service.upload_json(s3_key, trace_data)
+    except Exception as e:
+        logger.error("Failed to upload OTEL JSON to S3: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Storage error: {e}",
+        ) from e
+
+    # 6. Enqueue Celery task for async processing (S3 reference only, not full payload)
+    try:
+        process_s3_traces.delay(s3_key=s3_key, project_id=project_id)
+    except Exception as e:
+        # Log but don't fail the request - S3 has the data, can retry later
+        logger.error("Failed to enqueue Celery task for %s: %s", s3_key, e)
+    else:
+        # One record per ingest request rather than one per step: this is the
+        # hottest route, and each record is a synchronous handler write.
+        logger.info("Stored OTEL JSON to %s for project %s and enqueued it", s3_key, project_id)
+
+    return s3_key
+
+
 @router.post("", response_model=IngestResponse)
 @limiter.limit(resolve_limit, key_func=key_ingest)
 async def ingest_traces(
@@ -134,58 +209,10 @@ async def ingest_traces(
             detail="Empty request body",
         )
 
-    # 2. Decompress if gzip
-    content_encoding = request.headers.get("content-encoding", "")
-    if "gzip" in content_encoding.lower():
-        try:
-            body = gzip.decompress(body)
-        except Exception as e:
-            logger.warning(f"Failed to decompress gzip: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid gzip payload",
-            ) from e
-
-    # 3. Decode protobuf to camelCase JSON (OTLP standard format)
-    try:
-        trace_data = decode_otlp_protobuf(body)
-        logger.debug("Decoded OTLP protobuf to JSON")
-    except Exception as e:
-        logger.warning(f"Failed to parse OTLP protobuf: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to parse OTLP protobuf: {e}",
-        ) from e
-
-    # 4. Generate S3 key (time-partitioned)
-    now = datetime.now(UTC)
-    file_id = str(uuid.uuid4())
-    s3_key = (
-        f"events/otel/{project_id}/"
-        f"{now.year}/{now.month:02d}/{now.day:02d}/{now.hour:02d}/"
-        f"{file_id}.json"
+    # 2-6. Decode, store and enqueue off the event loop
+    s3_key = await asyncio.to_thread(
+        _store_and_enqueue, body, request.headers.get("content-encoding", ""), project_id
     )
 
-    # 5. Upload JSON to S3
-    try:
-        s3_service = get_s3_service()
-        s3_service.ensure_bucket_exists()
-        s3_service.upload_json(s3_key, trace_data)
-        logger.info(f"Stored OTEL JSON to {s3_key} for project {project_id}")
-    except Exception as e:
-        logger.error(f"Failed to upload OTEL JSON to S3: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Storage error: {e}",
-        ) from e
-
-    # 6. Enqueue Celery task for async processing (S3 reference only, not full payload)
-    try:
-        process_s3_traces.delay(s3_key=s3_key, project_id=project_id)
-        logger.info(f"Enqueued Celery task for {s3_key}")
-    except Exception as e:
-        # Log but don't fail the request - S3 has the data, can retry later
-        logger.error(f"Failed to enqueue Celery task for {s3_key}: {e}")
-
     # 7. Return success (async processing happens in background)
     return IngestResponse(status="ok", file_key=s3_key)
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from rest.projection import (
     FIELDS_PARAM_DESC,
@@ -17,20 +18,20 @@ from rest.projection import (
     SKELETON,
     InvalidFieldsError,
     drop_span_tree_metadata,
-    hydrate_span_io,
+    get_trace_with_span_io,
+    merge_span_io,
     resolve_span_fields,
 )
 from rest.rate_limit import (
-    BUCKET_READ,
     is_request_rate_limit_exempt,
     key_export,
-    key_read,
     limiter,
+    read_limit,
     resolve_limit,
 )
 from rest.retention import clamp_retention_window, enforce_retention_by_time
-from rest.routers.public.deps import StampedAuth
-from rest.routers.public.serialize import export_bundle, public_trace_detail
+from rest.routers.public.deps import ExportAuth, StampedAuth
+from rest.routers.public.serialize import export_bundle_json, public_trace_detail
 from rest.schemas.public import (
     PublicTraceDetailResponse,
     PublicTraceExportResponse,
@@ -46,10 +47,8 @@ router = APIRouter(prefix="/public/traces", tags=["Traces (Public)"])
 
 
 @router.get("", response_model=PublicTraceListResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def list_traces(
+@read_limit
+def list_traces(
     request: Request,
     response: Response,
     auth: StampedAuth,
@@ -74,7 +73,7 @@ async def list_traces(
             end_before=end_before,
         )
     except Exception as e:
-        logger.exception(f"Error listing traces: {e}")
+        logger.exception("Error listing traces: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list traces",
@@ -88,10 +87,8 @@ async def list_traces(
 
 
 @router.get("/{trace_id}", response_model=PublicTraceDetailResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_trace(
+@read_limit
+def get_trace(
     request: Request,
     response: Response,
     auth: StampedAuth,
@@ -126,10 +123,10 @@ async def get_trace(
 
 @router.get("/{trace_id}/export", response_model=PublicTraceExportResponse)
 @limiter.limit(resolve_limit, key_func=key_export, exempt_when=is_request_rate_limit_exempt)
-async def export_trace(
+def export_trace(
     request: Request,
     response: Response,
-    auth: StampedAuth,
+    auth: ExportAuth,
     trace_id: str,
     fields: str | None = Query(None, description=FIELDS_PARAM_DESC),
 ):
@@ -144,8 +141,9 @@ async def export_trace(
     full bundle.
 
     Args:
-        auth (StampedAuth): Resolved API-key context; scopes the read to its
-            project and stamps the rate-limit identity.
+        auth (ExportAuth): Resolved API-key context; scopes the read to its
+            project, stamps the rate-limit identity, and holds a concurrent-export
+            slot for the workspace.
         trace_id (str): Trace to export.
         fields (str | None): Comma-separated projection groups or an alias
             (``skeleton``/``full``). ``None`` selects the default `full`
@@ -161,7 +159,12 @@ async def export_trace(
     """
     groups = _resolve_fields(fields, default=FULL)
     trace = _require_trace(auth.project_id, trace_id, groups, auth.billing_plan)
-    return export_bundle(trace, auth.project_id)
+    # Streamed so a full-I/O export of a large trace is never encoded into one
+    # buffer. response_model stays on the route for the OpenAPI schema;
+    # returning a Response skips FastAPI's buffered validate-and-dump.
+    return StreamingResponse(
+        export_bundle_json(trace, auth.project_id), media_type="application/json"
+    )
 
 
 def _resolve_fields(fields: str | None, *, default: frozenset[str]) -> frozenset[str]:
@@ -210,17 +213,19 @@ def _require_trace(
     """
     try:
         service = get_trace_reader_service()
-        trace = service.get_trace(project_id=project_id, trace_id=trace_id)
+        trace, span_io = get_trace_with_span_io(
+            service, project_id=project_id, trace_id=trace_id, groups=groups
+        )
         if trace:
             # The skeleton's span-path metadata subset exists for the dashboard's
             # live-tree repair; API clients build trees from parent_span_id and
             # their contract is `metadata: null` unless they ask for it. Clear it
-            # first, then let the hydration below refill `metadata` with the real
+            # first, then let the merge below refill `metadata` with the real
             # blob for the projections that do request it.
             drop_span_tree_metadata(trace)
-            hydrate_span_io(service, trace, project_id=project_id, trace_id=trace_id, groups=groups)
+            merge_span_io(trace, span_io)
     except Exception as e:
-        logger.exception(f"Error getting trace: {e}")
+        logger.exception("Error getting trace: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get trace",
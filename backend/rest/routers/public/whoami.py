@@ -8,11 +8,7 @@ the client reached, ``ui_base_url`` is where trace links point.
 from fastapi import APIRouter, Request, Response
 
 from rest.rate_limit import (
-    BUCKET_READ,
-    is_request_rate_limit_exempt,
-    key_read,
-    limiter,
-    resolve_limit,
+    read_limit,
 )
 from rest.routers.public.deps import StampedAuth
 from rest.schemas.public import WhoamiResponse
@@ -22,9 +18,7 @@ router = APIRouter(prefix="/public/whoami", tags=["Whoami (Public)"])
 
 
 @router.get("", response_model=WhoamiResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
+@read_limit
 async def whoami(request: Request, response: Response, auth: StampedAuth) -> WhoamiResponse:
     """Return the identity the authenticated API key maps to."""
     # `host` reflects the request's Host header (the API host the client
@@ -6,11 +6,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from rest.rate_limit import (
-    BUCKET_READ,
-    is_request_rate_limit_exempt,
-    key_read,
-    limiter,
-    resolve_limit,
+    read_limit,
 )
 from rest.retention import clamp_retention_window
 from rest.routers.deps import RateLimitedProjectAccess
@@ -23,10 +19,8 @@ router = APIRouter(prefix="/projects/{project_id}/sessions", tags=["Sessions"])
 
 
 @router.get("", response_model=SessionListResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def list_sessions(
+@read_limit
+def list_sessions(
     request: Request,
     response: Response,
     project_id: str,
@@ -51,7 +45,7 @@ async def list_sessions(
         )
         return result
     except Exception as e:
-        logger.exception(f"Error listing sessions: {e}")
+        logger.exception("Error listing sessions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list sessions",
@@ -59,10 +53,8 @@ async def list_sessions(
 
 
 @router.get("/{session_id}", response_model=SessionDetailResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_session(
+@read_limit
+def get_session(
     request: Request,
     response: Response,
     project_id: str,
@@ -90,7 +82,7 @@ async def get_session(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error getting session: {e}")
+        logger.exception("Error getting session: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get session",
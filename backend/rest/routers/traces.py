@@ -10,19 +10,17 @@ from rest.projection import (
     FIELDS_PARAM_DESC,
     SKELETON,
     InvalidFieldsError,
-    hydrate_span_io,
+    get_trace_with_span_io,
+    merge_span_io,
     resolve_span_fields,
 )
 from rest.rate_limit import (
-    BUCKET_READ,
-    is_request_rate_limit_exempt,
-    key_read,
-    limiter,
-    resolve_limit,
+    read_limit,
 )
 from rest.retention import clamp_retention_window, enforce_retention_by_time
 from rest.routers.deps import RateLimitedProjectAccess
 from rest.schemas.traces import (
+    FilterField,
     FilterFieldsResponse,
     FilterValuesResponse,
     SpanIOResponse,
@@ -39,15 +37,13 @@ router = APIRouter(prefix="/projects/{project_id}/traces", tags=["Traces"])
 
 
 @router.get("/exists")
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def traces_exist(
+@read_limit
+def traces_exist(
     request: Request,
     response: Response,
     project_id: str,
     _access: RateLimitedProjectAccess,
-):
+) -> dict[str, bool]:
     """Check if a project has ever ingested traces (bypasses retention).
 
     Returns a boolean — no trace data is exposed, so retention gating
@@ -58,10 +54,8 @@ async def traces_exist(
 
 
 @router.get("", response_model=TraceListResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def list_traces(
+@read_limit
+def list_traces(
     request: Request,
     response: Response,
     project_id: str,
@@ -102,17 +96,38 @@ async def list_traces(
         )
         return result
     except Exception as e:
-        logger.exception(f"Error listing traces: {e}")
+        logger.exception("Error listing traces: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list traces",
         ) from e
 
 
-@router.get("/filter-fields", response_model=FilterFieldsResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
+# The filter registry is fixed at import, so its serialized form is too: validate
+# and encode it once instead of rebuilding and re-dumping it on every dropdown open.
+_FILTER_FIELDS_BODY = (
+    FilterFieldsResponse(
+        fields=[
+            FilterField(
+                field=c.name,
+                label=c.label,
+                type=c.type,
+                level=c.level,
+                operators=list(c.operators),
+                value_source=c.value_source,
+                enum_values=list(c.enum_values),
+                integer=c.is_integer,
+            )
+            for c in filter_columns.FILTER_COLUMNS
+        ]
+    )
+    .model_dump_json()
+    .encode()
 )
+
+
+@router.get("/filter-fields", response_model=FilterFieldsResponse)
+@read_limit
 async def get_filter_fields(
     request: Request,
     response: Response,
@@ -132,28 +147,12 @@ async def get_filter_fields(
     Returns:
         FilterFieldsResponse: One entry per registry column with its UI metadata.
     """
-    return {
-        "fields": [
-            {
-                "field": c.name,
-                "label": c.label,
-                "type": c.type,
-                "level": c.level,
-                "operators": list(c.operators),
-                "value_source": c.value_source,
-                "enum_values": list(c.enum_values),
-                "integer": c.is_integer,
-            }
-            for c in filter_columns.FILTER_COLUMNS
-        ]
-    }
+    return Response(content=_FILTER_FIELDS_BODY, media_type="application/json")
 
 
 @router.get("/filter-values/{field}", response_model=FilterValuesResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_filter_values(
+@read_limit
+def get_filter_values(
     request: Request,
     response: Response,
     project_id: str,
@@ -209,10 +208,8 @@ async def get_filter_values(
 
 
 @router.get("/{trace_id}", response_model=TraceDetailResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_trace(
+@read_limit
+def get_trace(
     request: Request,
     response: Response,
     project_id: str,
@@ -259,7 +256,9 @@ async def get_trace(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
     service = get_trace_reader_service()
-    trace = service.get_trace(project_id=project_id, trace_id=trace_id, source=source)
+    trace, span_io = get_trace_with_span_io(
+        service, project_id=project_id, trace_id=trace_id, groups=groups, source=source
+    )
 
     if not trace:
         raise HTTPException(
@@ -269,15 +268,13 @@ async def get_trace(
 
     enforce_retention_by_time(_access.billing_plan, trace.get("trace_start_time"))
 
-    hydrate_span_io(service, trace, project_id=project_id, trace_id=trace_id, groups=groups)
+    merge_span_io(trace, span_io)
     return trace
 
 
 @router.get("/{trace_id}/spans/{span_id}/io", response_model=SpanIOResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def get_span_io(
+@read_limit
+def get_span_io(
     request: Request,
     response: Response,
     project_id: str,
@@ -307,7 +304,7 @@ async def get_span_io(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error getting span I/O: {e}")
+        logger.exception("Error getting span I/O: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get span I/O",
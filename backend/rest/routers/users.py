@@ -6,11 +6,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from rest.rate_limit import (
-    BUCKET_READ,
-    is_request_rate_limit_exempt,
-    key_read,
-    limiter,
-    resolve_limit,
+    read_limit,
 )
 from rest.retention import clamp_retention_window
 from rest.routers.deps import RateLimitedProjectAccess
@@ -23,10 +19,8 @@ router = APIRouter(prefix="/projects/{project_id}/users", tags=["Users"])
 
 
 @router.get("", response_model=UserListResponse)
-@limiter.shared_limit(
-    resolve_limit, scope=BUCKET_READ, key_func=key_read, exempt_when=is_request_rate_limit_exempt
-)
-async def list_users(
+@read_limit
+def list_users(
     request: Request,
     response: Response,
     project_id: str,
@@ -51,7 +45,7 @@ async def list_users(
         )
         return result
     except Exception as e:
-        logger.exception(f"Error listing users: {e}")
+        logger.exception("Error listing users: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list users",
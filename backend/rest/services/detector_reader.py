@@ -13,12 +13,14 @@ controlled 500).
 
 import json
 import logging
+import threading
 from datetime import datetime
 from typing import Any
 
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
-from db.clickhouse import get_clickhouse_client
+from db.clickhouse import get_clickhouse_client, get_query_executor
 from rest.schemas.public import (
     DetectorItem,
     DetectorResultItem,
@@ -37,19 +39,66 @@ class DetectorReaderService:
 
     def __init__(self):
         self._client = get_clickhouse_client()
+        self._pg_pool: ThreadedConnectionPool | None = None
+        self._pg_pool_size = settings.database_pool_size
+        # Bounds checkouts to the pool size so a full pool makes callers wait
+        # for a connection instead of raising PoolError.
+        self._pg_slots = threading.BoundedSemaphore(self._pg_pool_size)
+        self._pg_pool_lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     # Postgres boundary (single read-only seam; mocked in unit tests)
     # ------------------------------------------------------------------ #
+    def _get_pg_pool(self) -> ThreadedConnectionPool:
+        """Get or lazily create the Postgres connection pool.
+
+        Connections are opened on demand (none at startup) and kept for reuse
+        between requests, up to ``settings.database_pool_size``. Creation is
+        locked so concurrent first requests share one pool instead of each
+        building (and leaking) their own.
+        """
+        if self._pg_pool is None:
+            with self._pg_pool_lock:
+                if self._pg_pool is None:
+                    self._pg_pool = ThreadedConnectionPool(
+                        0, self._pg_pool_size, settings.database_url
+                    )
+        return self._pg_pool
+
     def _pg_rows(self, sql: str, params: tuple) -> list[tuple]:
-        """Run a read-only Postgres query and return all rows."""
-        conn = psycopg2.connect(settings.database_url)
-        try:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                return list(cur.fetchall())
-        finally:
-            conn.close()
+        """Run a read-only Postgres query on a pooled connection and return all rows.
+
+        Autocommit keeps the connection from idling inside an open transaction
+        between uses; a connection that broke mid-query is discarded rather than
+        handed back to the pool. When every connection is checked out the call
+        waits for one to be returned — psycopg2's ``getconn`` would otherwise
+        raise ``PoolError`` on an exhausted pool.
+
+        A pooled connection can die while idle (Postgres restart,
+        ``idle_session_timeout``, a NAT/LB idle drop) and still report
+        ``closed == 0`` until it is used. If a query fails and leaves its
+        connection closed, that connection is discarded and the query retried on
+        another; all idle ones may have died together, so up to a pool's worth of
+        retries are allowed before the pool opens a fresh connection. An error on
+        a connection that is still open (a real query failure) is not retried.
+        """
+        pool = self._get_pg_pool()
+        with self._pg_slots:
+            retries_left = self._pg_pool_size
+            while True:
+                conn = pool.getconn()
+                try:
+                    conn.autocommit = True
+                    with conn.cursor() as cur:
+                        cur.execute(sql, params)
+                        return list(cur.fetchall())
+                except psycopg2.Error:
+                    if not conn.closed or retries_left == 0:
+                        raise
+                    retries_left -= 1
+                    logger.info("Discarding dead pooled Postgres connection; retrying query")
+                finally:
+                    pool.putconn(conn, close=bool(conn.closed))
 
     # ------------------------------------------------------------------ #
     # payload helpers
@@ -108,6 +157,7 @@ class DetectorReaderService:
             params.append(to_utc_naive(end_before))
         where = " AND ".join(conditions)
 
+        # One after the other, so a request holds at most one pooled connection.
         count_rows = self._pg_rows(f"SELECT count(*) FROM detectors WHERE {where}", tuple(params))
         total = count_rows[0][0] if count_rows else 0
 
@@ -214,16 +264,21 @@ class DetectorReaderService:
         """
 
         count_query = f"SELECT count() FROM ({deduped}){outer_where}"
-        count_result = self._client.query(count_query, parameters=params)
-        total = count_result.result_rows[0][0] if count_result.result_rows else 0
-
         list_query = f"""
             SELECT finding_id, project_id, trace_id, summary, payload, timestamp
             FROM ({deduped}){outer_where}
             ORDER BY timestamp DESC
             LIMIT {{limit:UInt32}}
         """
+        # The total and the page share only their filters, so the count goes to the
+        # shared fan-out executor while this thread reads the page; either failure
+        # propagates.
+        count_future = get_query_executor().submit(
+            self._client.query, count_query, parameters=params
+        )
         result = self._client.query(list_query, parameters=params)
+        count_result = count_future.result()
+        total = count_result.result_rows[0][0] if count_result.result_rows else 0
         items = [
             FindingSummary(
                 finding_id=row[0],
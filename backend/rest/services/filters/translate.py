@@ -12,6 +12,7 @@ existence); the safety boundary is the per-field operator whitelist validated ag
 registry here, not downstream.
 """
 
+import functools
 import json
 import math
 from typing import Any
@@ -60,6 +61,17 @@ def parse_filters_param(raw: str | None) -> list[Predicate]:
     """
     if not raw:
         return []
+    return list(_parse_filters(raw))
+
+
+# The trace list re-sends the same ``filters`` string on every poll and page
+# turn, so the parse + registry validation is memoized per raw value; the LRU
+# bound caps what arbitrary client input can pin. Rejected values raise and are
+# not cached. Callers get a fresh list over the shared predicates, which nothing
+# downstream mutates.
+@functools.lru_cache(maxsize=256)
+def _parse_filters(raw: str) -> tuple[Predicate, ...]:
+    """Parse and validate a non-empty ``?filters=`` value (see ``parse_filters_param``)."""
     try:
         data = json.loads(raw)
     except json.JSONDecodeError as e:
@@ -76,7 +88,7 @@ def parse_filters_param(raw: str | None) -> list[Predicate]:
             raise ValueError(f"invalid filter predicate: {e}") from e
         validate_predicate(pred)  # registry field/op whitelist
         predicates.append(pred)
-    return predicates
+    return tuple(predicates)
 
 
 def validate_predicate(pred: Predicate) -> FilterColumn:
@@ -325,15 +337,12 @@ def build_conditions(filters: list[Predicate], params: dict) -> list[str]:
         else:
             raise NotImplementedError(f"level {col.level} not yet lowered: {col.name}")
 
-    conditions: list[str] = []
     # Inline trace-row predicates (t.*), keyed on the outer query so they land in both the
     # page and count queries.
-    for i, col, pred in trace:
-        conditions.append(_trace_condition(i, col, pred, params))
+    conditions: list[str] = [_trace_condition(i, col, pred, params) for i, col, pred in trace]
     # One semi-join per membership predicate (independent existence), each AND-combined via
     # the shared conditions list so every one lands in both the page and count queries.
-    for i, col, pred in membership:
-        conditions.append(_membership_semijoin(i, col, pred, params))
+    conditions.extend(_membership_semijoin(i, col, pred, params) for i, col, pred in membership)
     if aggregate:
         conditions.append(_aggregate_semijoin(aggregate, params))
     return conditions
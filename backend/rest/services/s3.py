@@ -14,11 +14,11 @@ This structure enables:
 Later, a worker will process these files and insert into ClickHouse.
 """
 
+import json
 import logging
+import threading
 from typing import Any
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from shared.config import settings
@@ -54,58 +54,88 @@ class S3Service:
         self._region = region or s3.region
 
         self._client: Any = None
+        # Ingest uploads run via asyncio.to_thread, so the first calls can race
+        # to build the client; creating clients concurrently on boto3's default
+        # session is not thread-safe.
+        self._client_lock = threading.Lock()
+        # Set once head/create has confirmed the bucket, so ingest does not pay
+        # a HEAD round-trip per upload. Cleared if an upload finds it missing.
+        self._bucket_verified = False
 
     def _get_client(self):
-        """Get or create the S3 client."""
+        """Get or create the S3 client (double-checked under a lock)."""
         if self._client is None:
-            config = Config(
-                retries={"max_attempts": 3, "mode": "adaptive"},
-                connect_timeout=5,
-                read_timeout=30,
-            )
-            self._client = boto3.client(
-                "s3",
-                endpoint_url=self._endpoint_url,
-                aws_access_key_id=self._access_key_id,
-                aws_secret_access_key=self._secret_access_key,
-                region_name=self._region,
-                config=config,
-            )
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
         return self._client
 
+    def _build_client(self):
+        """Build the S3 client from a dedicated boto3 session."""
+        # Deferred: boto3 (with s3transfer) is the slowest import on the REST
+        # boot path, and only the ingest route ever talks to S3.
+        import boto3
+        from botocore.config import Config
+
+        config = Config(
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            connect_timeout=5,
+            read_timeout=30,
+        )
+        return boto3.session.Session().client(
+            "s3",
+            endpoint_url=self._endpoint_url,
+            aws_access_key_id=self._access_key_id,
+            aws_secret_access_key=self._secret_access_key,
+            region_name=self._region,
+            config=config,
+        )
+
     def ensure_bucket_exists(self) -> None:
-        """Ensure the bucket exists, create if not."""
+        """Ensure the bucket exists, create if not.
+
+        Only the first call per service hits S3; later calls return at once
+        until an upload reports the bucket missing.
+        """
+        if self._bucket_verified:
+            return
         client = self._get_client()
         try:
             client.head_bucket(Bucket=self._bucket_name)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code")
             if error_code == "404":
-                logger.info(f"Creating bucket: {self._bucket_name}")
+                logger.info("Creating bucket: %s", self._bucket_name)
                 client.create_bucket(Bucket=self._bucket_name)
             else:
                 raise
+        self._bucket_verified = True
 
     def upload_json(self, s3_key: str, data: dict | list) -> None:
         """Upload JSON data to S3.
 
-        Serializes the data to JSON and uploads to S3.
+        Serializes the data to compact JSON (no whitespace between tokens) and
+        uploads to S3.
 
         Args:
             s3_key: Full S3 key path
             data: Python dict or list to serialize as JSON
         """
-        import json
-
         client = self._get_client()
-        json_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        client.put_object(
-            Bucket=self._bucket_name,
-            Key=s3_key,
-            Body=json_bytes,
-            ContentType="application/json",
-        )
-        logger.debug(f"Uploaded JSON to s3://{self._bucket_name}/{s3_key}")
+        json_bytes = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        try:
+            client.put_object(
+                Bucket=self._bucket_name,
+                Key=s3_key,
+                Body=json_bytes,
+                ContentType="application/json",
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchBucket":
+                # Deleted since it was verified: re-check on the next request.
+                self._bucket_verified = False
+            raise
+        logger.debug("Uploaded JSON to s3://%s/%s", self._bucket_name, s3_key)
 
     def download_json(self, s3_key: str) -> dict | list:
         """Download and parse JSON data from S3.
@@ -119,12 +149,10 @@ class S3Service:
         Raises:
             ClientError: If the file doesn't exist or download fails
         """
-        import json
-
         client = self._get_client()
         response = client.get_object(Bucket=self._bucket_name, Key=s3_key)
-        body = response["Body"].read()
-        return json.loads(body.decode("utf-8"))
+        # json.loads decodes UTF-8 bytes itself; skip the intermediate str copy.
+        return json.loads(response["Body"].read())
 
 
 # Global singleton instance
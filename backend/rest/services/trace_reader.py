@@ -1,11 +1,13 @@
 """Service for reading traces from ClickHouse."""
 
+import threading
 import time
-from datetime import UTC, datetime, timedelta
+from concurrent.futures import Future
+from datetime import datetime, timedelta
 
-from db.clickhouse import get_clickhouse_client
+from db.clickhouse import get_clickhouse_client, get_query_executor
 from rest.services.filters.translate import Predicate, build_conditions
-from rest.sql_utils import escape_ilike, to_utc_naive
+from rest.sql_utils import escape_ilike, to_utc_naive, utc_now_naive
 from shared.span_attributes import (
     SPAN_IDS_PATH,
     SPAN_PATH,
@@ -31,6 +33,9 @@ DISTINCT_VALUES_CACHE_TTL_SECONDS = 30
 # Bound the in-process cache so it can't grow without limit across projects/windows.
 DISTINCT_VALUES_CACHE_MAX = 256
 
+# Stripped input/output values that count as "no I/O" (see _is_empty_io).
+_EMPTY_IO_VALUES = frozenset({"", "{}", "null", "None"})
+
 # Default lookback for a span scan that arrives with no lower time bound (the filtered
 # trace list AND the categorical distinct-values dropdown). Those scan spans, so an
 # unbounded window is a full-project span scan — the OOM-prone class. The dashboard
@@ -87,7 +92,7 @@ def _default_lookback_start(normalized_end: datetime | None) -> datetime:
     Returns:
         datetime: Naive-UTC lower bound, ``lookback`` hours before the upper bound/now.
     """
-    upper = normalized_end if normalized_end is not None else datetime.now(UTC).replace(tzinfo=None)
+    upper = normalized_end if normalized_end is not None else utc_now_naive()
     return upper - timedelta(hours=DEFAULT_SPAN_SCAN_LOOKBACK_HOURS)
 
 
@@ -146,13 +151,21 @@ class TraceReaderService:
         self._client = get_clickhouse_client()
         # Per-(project, column, window) cache of distinct values: key -> (expiry, rows).
         self._distinct_cache: dict[tuple, tuple[float, list[dict]]] = {}
+        # Distinct-values scans in flight, keyed like the cache, so concurrent misses
+        # for one key (a dashboard opening several tiles at once) share one scan.
+        self._distinct_inflight: dict[tuple, Future[list[dict]]] = {}
+        self._distinct_lock = threading.Lock()
         # has_traces cache: project_id -> (expiry, result). True results use a
         # long TTL (1 hour); False results expire after 10s so the onboarding
         # poll doesn't scan all partitions every 3s. Bounded to 1024 entries.
         self._has_traces_cache: dict[str, tuple[float, bool]] = {}
-        # Trace start time cache: "project:trace" -> (expiry, datetime|None).
+        # Trace start time cache: (project, trace) -> (expiry, datetime|None).
         # Immutable once written, so 1-hour TTL is safe. Bounded to 1024 entries.
-        self._trace_start_cache: dict[str, tuple[float, datetime | None]] = {}
+        self._trace_start_cache: dict[tuple[str, str], tuple[float, datetime | None]] = {}
+        # Guards the evict-then-store on the two caches above: routes run in the
+        # threadpool, and an unlocked next(iter(...)) + pop can race another
+        # thread's eviction (StopIteration) or insert (RuntimeError).
+        self._small_cache_lock = threading.Lock()
 
     def get_distinct_span_values(
         self,
@@ -238,7 +251,7 @@ class TraceReaderService:
         start_after: datetime | None,
         end_before: datetime | None,
     ) -> list[dict]:
-        """Shared distinct-values scan: dedup, group, count, cache.
+        """Shared distinct-values scan: dedup, group, count, cache, coalesce misses.
 
         Args:
             table (str): Source table (``spans`` or ``traces``) — a literal chosen by
@@ -278,6 +291,56 @@ class TraceReaderService:
         if cached is not None and cached[0] > now:
             return cached[1]
 
+        # Single-flight: the first miss runs the scan; concurrent misses for the same
+        # key wait on its Future instead of repeating the GROUP BY. The lock only
+        # guards the in-flight map — it is never held across the query.
+        with self._distinct_lock:
+            inflight = self._distinct_inflight.get(cache_key)
+            if inflight is None:
+                leader: Future[list[dict]] = Future()
+                self._distinct_inflight[cache_key] = leader
+        if inflight is not None:
+            return inflight.result()
+
+        try:
+            rows = self._scan_distinct_values(
+                table, time_column, dedup_keys, project_id, column, normalized_start, normalized_end
+            )
+        except BaseException as e:
+            leader.set_exception(e)
+            raise
+        else:
+            # Bound the cache: drop expired entries, then evict oldest if still at capacity.
+            # Under the lock: routes run in the threadpool, and the rebuild iterates.
+            with self._distinct_lock:
+                self._distinct_cache = {k: v for k, v in self._distinct_cache.items() if v[0] > now}
+                if len(self._distinct_cache) >= DISTINCT_VALUES_CACHE_MAX:
+                    self._distinct_cache.pop(next(iter(self._distinct_cache)))
+                self._distinct_cache[cache_key] = (now + DISTINCT_VALUES_CACHE_TTL_SECONDS, rows)
+            leader.set_result(rows)
+            return rows
+        finally:
+            with self._distinct_lock:
+                self._distinct_inflight.pop(cache_key, None)
+
+    def _scan_distinct_values(
+        self,
+        table: str,
+        time_column: str,
+        dedup_keys: str,
+        project_id: str,
+        column: str,
+        normalized_start: datetime | None,
+        normalized_end: datetime | None,
+    ) -> list[dict]:
+        """Run the uncached distinct-values GROUP BY for ``_distinct_values``.
+
+        Args mirror ``_distinct_values``, with the window bounds already
+        normalized to naive UTC.
+
+        Returns:
+            list[dict]: ``[{"value": str, "count": int}]`` by descending frequency.
+        """
         params: dict = {"project_id": project_id}
         # Detector self-traces carry their own model/environment/name values; excluding
         # them keeps internal telemetry out of the customer's filter dropdown options.
@@ -312,13 +375,7 @@ class TraceReaderService:
             LIMIT {DISTINCT_VALUES_LIMIT}
         """
         result = self._client.query(query, parameters=params)
-        rows = [{"value": str(row[0]), "count": int(row[1])} for row in result.result_rows]
-        # Bound the cache: drop expired entries, then evict oldest if still at capacity.
-        self._distinct_cache = {k: v for k, v in self._distinct_cache.items() if v[0] > now}
-        if len(self._distinct_cache) >= DISTINCT_VALUES_CACHE_MAX:
-            self._distinct_cache.pop(next(iter(self._distinct_cache)))
-        self._distinct_cache[cache_key] = (now + DISTINCT_VALUES_CACHE_TTL_SECONDS, rows)
-        return rows
+        return [{"value": str(row[0]), "count": int(row[1])} for row in result.result_rows]
 
     _HAS_TRACES_CACHE_MAX = 1024
 
@@ -337,9 +394,10 @@ class TraceReaderService:
         )
         found = len(result.result_rows) > 0
         ttl = 3600.0 if found else 10.0
-        if len(self._has_traces_cache) >= self._HAS_TRACES_CACHE_MAX:
-            self._has_traces_cache.pop(next(iter(self._has_traces_cache)))
-        self._has_traces_cache[project_id] = (now + ttl, found)
+        with self._small_cache_lock:
+            if len(self._has_traces_cache) >= self._HAS_TRACES_CACHE_MAX:
+                self._has_traces_cache.pop(next(iter(self._has_traces_cache)), None)
+            self._has_traces_cache[project_id] = (now + ttl, found)
         return found
 
     _TRACE_START_CACHE_MAX = 1024
@@ -351,7 +409,8 @@ class TraceReaderService:
         Used by retention gating on by-id endpoints (span IO, live SSE)
         without the cost of a full get_trace() skeleton fetch.
         """
-        cache_key = f"{project_id}:{trace_id}"
+        # A tuple key hashes the two ids directly, with no per-call string build.
+        cache_key = (project_id, trace_id)
         now = time.monotonic()
         cached = self._trace_start_cache.get(cache_key)
         if cached is not None:
@@ -375,11 +434,20 @@ class TraceReaderService:
         )
         rows = result.result_rows
         ts = rows[0][0] if rows else None
-        if len(self._trace_start_cache) >= self._TRACE_START_CACHE_MAX:
-            self._trace_start_cache.pop(next(iter(self._trace_start_cache)))
-        self._trace_start_cache[cache_key] = (now + 3600.0, ts)
+        self._remember_trace_start(cache_key, ts, now)
         return ts
 
+    def _remember_trace_start(
+        self, cache_key: tuple[str, str], ts: datetime | None, now: float
+    ) -> None:
+        """Store a ``get_trace_start_time`` answer in its bounded 1-hour cache."""
+        with self._small_cache_lock:
+            if cache_key not in self._trace_start_cache and (
+                len(self._trace_start_cache) >= self._TRACE_START_CACHE_MAX
+            ):
+                self._trace_start_cache.pop(next(iter(self._trace_start_cache)), None)
+            self._trace_start_cache[cache_key] = (now + 3600.0, ts)
+
     def list_traces(
         self,
         project_id: str,
@@ -726,6 +794,13 @@ class TraceReaderService:
 
         spans = []
         for row in spans_result.result_rows:
+            # Converted once and shared by the response fields and the cost
+            # breakdown, rather than rebuilt per consumer.
+            input_tokens = int(row[11]) if row[11] is not None else None
+            output_tokens = int(row[12]) if row[12] is not None else None
+            # clickhouse-connect already decodes a Map column into a fresh dict
+            # per row, and nothing downstream mutates it — no defensive copy.
+            usage_details = row[14] or {}
             spans.append(
                 {
                     "span_id": row[0],
@@ -739,15 +814,12 @@ class TraceReaderService:
                     "status_message": row[8],
                     "model_name": row[9],
                     "cost": float(row[10]) if row[10] is not None else None,
-                    "input_tokens": int(row[11]) if row[11] is not None else None,
-                    "output_tokens": int(row[12]) if row[12] is not None else None,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
                     "total_tokens": int(row[13]) if row[13] is not None else None,
-                    "usage_details": dict(row[14]) if row[14] else {},
+                    "usage_details": usage_details,
                     "cost_details": span_cost_details(
-                        row[9],  # model_name
-                        int(row[11]) if row[11] is not None else None,  # input_tokens
-                        int(row[12]) if row[12] is not None else None,  # output_tokens
-                        dict(row[14]) if row[14] else {},  # usage_details
+                        row[9], input_tokens, output_tokens, usage_details
                     ),
                     # Already reduced to the span-path subset by the query.
                     "metadata": row[15],
@@ -757,6 +829,18 @@ class TraceReaderService:
                 }
             )
 
+        # The skeleton already holds every deduped root span, so it answers
+        # get_trace_start_time for free: seed that cache so the span-I/O and live
+        # routes the UI opens next skip their own probe of the same trace. Only
+        # when the root has landed — an in-flight trace keeps the probe.
+        root_starts = [
+            span["span_start_time"]
+            for span in spans
+            if span["parent_span_id"] is None and span["span_start_time"] is not None
+        ]
+        if root_starts:
+            self._remember_trace_start((project_id, trace_id), min(root_starts), time.monotonic())
+
         trace["spans"] = spans
         return trace
 
@@ -1048,7 +1132,7 @@ class TraceReaderService:
         if not value:
             return True
         stripped = value.strip()
-        return stripped in ("", "{}", "null", "None")
+        return stripped in _EMPTY_IO_VALUES
 
     def get_session(
         self,
@@ -1146,46 +1230,34 @@ class TraceReaderService:
 
         # Step 2: For traces with empty input/output, fetch from root spans
         # The SDK often stores real I/O on agent_turn or root spans, not traces
-        needs_span_io = any(
-            self._is_empty_io(t["input"]) or self._is_empty_io(t["output"]) for t in traces
-        )
-        if needs_span_io and trace_ids:
-            # Get the first span's input and last span's output per trace
-            # (root span = no parent, or earliest AGENT span with real data)
-            # Dedup spans without FINAL (latest per span_id, scoped to these
-            # traces), then aggregate I/O over the deduped rows.
-            span_io_query = """
-                SELECT
-                    trace_id,
-                    argMin(input, span_start_time) as first_input,
-                    argMax(output, span_end_time) as last_output
-                FROM (
-                    SELECT trace_id, input, output, span_start_time, span_end_time
-                    FROM spans
-                    WHERE project_id = {project_id:String}
-                      AND trace_id IN ({trace_ids:Array(String)})
-                    ORDER BY ch_update_time DESC
-                    LIMIT 1 BY span_id
-                )
-                WHERE ((input != '' AND input != '{}') OR (output != '' AND output != '{}'))
-                GROUP BY trace_id
-            """
-            span_io_result = self._client.query(
-                span_io_query,
-                parameters={**params, "trace_ids": trace_ids},
+        # Only those traces are scanned: the span I/O query reads the heavy blob
+        # columns, so a session where most traces carry their own I/O should not
+        # pay for every span of every trace.
+        io_trace_ids = [
+            t["trace_id"]
+            for t in traces
+            if self._is_empty_io(t["input"]) or self._is_empty_io(t["output"])
+        ]
+        # Get the first span's input and last span's output per trace
+        # (root span = no parent, or earliest AGENT span with real data)
+        # Dedup spans without FINAL (latest per span_id, scoped to these
+        # traces), then aggregate I/O over the deduped rows.
+        span_io_query = """
+            SELECT
+                trace_id,
+                argMin(input, span_start_time) as first_input,
+                argMax(output, span_end_time) as last_output
+            FROM (
+                SELECT trace_id, input, output, span_start_time, span_end_time
+                FROM spans
+                WHERE project_id = {project_id:String}
+                  AND trace_id IN ({trace_ids:Array(String)})
+                ORDER BY ch_update_time DESC
+                LIMIT 1 BY span_id
             )
-            span_io_map: dict[str, tuple[str | None, str | None]] = {}
-            for row in span_io_result.result_rows:
-                span_io_map[row[0]] = (row[1], row[2])
-
-            # Patch traces with span-level I/O where trace-level is empty
-            for t in traces:
-                span_io = span_io_map.get(t["trace_id"])
-                if span_io:
-                    if self._is_empty_io(t["input"]) and not self._is_empty_io(span_io[0]):
-                        t["input"] = span_io[0]
-                    if self._is_empty_io(t["output"]) and not self._is_empty_io(span_io[1]):
-                        t["output"] = span_io[1]
+            WHERE ((input != '' AND input != '{}') OR (output != '' AND output != '{}'))
+            GROUP BY trace_id
+        """
 
         # Step 3: Get token totals from spans for all traces in this session
         # Dedup spans without FINAL (latest per span_id), then sum tokens/cost.
@@ -1203,10 +1275,36 @@ class TraceReaderService:
                 LIMIT 1 BY span_id
             )
         """
-        tokens_result = self._client.query(
-            tokens_query,
-            parameters={**params, "trace_ids": trace_ids},
-        )
+        trace_params = {**params, "trace_ids": trace_ids}
+
+        # Both per-trace follow-ups depend only on trace_ids, so the span-I/O read
+        # goes to the shared fan-out executor while this thread runs the token
+        # totals, rather than paying two ClickHouse round-trips back to back.
+        # The client is sessionless and safe to share across threads.
+        if io_trace_ids:
+            span_io_future = get_query_executor().submit(
+                self._client.query,
+                span_io_query,
+                parameters={**params, "trace_ids": io_trace_ids},
+            )
+            tokens_result = self._client.query(tokens_query, parameters=trace_params)
+            span_io_result = span_io_future.result()
+
+            span_io_map: dict[str, tuple[str | None, str | None]] = {}
+            for row in span_io_result.result_rows:
+                span_io_map[row[0]] = (row[1], row[2])
+
+            # Patch traces with span-level I/O where trace-level is empty
+            for t in traces:
+                span_io = span_io_map.get(t["trace_id"])
+                if span_io:
+                    if self._is_empty_io(t["input"]) and not self._is_empty_io(span_io[0]):
+                        t["input"] = span_io[0]
+                    if self._is_empty_io(t["output"]) and not self._is_empty_io(span_io[1]):
+                        t["output"] = span_io[1]
+        else:
+            tokens_result = self._client.query(tokens_query, parameters=trace_params)
+
         token_row = (
             tokens_result.result_rows[0] if tokens_result.result_rows else (None, None, None)
         )
@@ -1343,18 +1441,17 @@ class TraceReaderService:
         count_result = self._client.query(count_query, parameters=params)
         total = count_result.result_rows[0][0] if count_result.result_rows else 0
 
-        data = []
-        for row in result.result_rows:
-            data.append(
-                {
-                    "user_id": row[0],
-                    "trace_count": row[1],
-                    "last_trace_time": row[2],
-                    "total_input_tokens": int(row[3]) if row[3] is not None else None,
-                    "total_output_tokens": int(row[4]) if row[4] is not None else None,
-                    "total_cost": float(row[5]) if row[5] is not None else None,
-                }
-            )
+        data = [
+            {
+                "user_id": row[0],
+                "trace_count": row[1],
+                "last_trace_time": row[2],
+                "total_input_tokens": int(row[3]) if row[3] is not None else None,
+                "total_output_tokens": int(row[4]) if row[4] is not None else None,
+                "total_cost": float(row[5]) if row[5] is not None else None,
+            }
+            for row in result.result_rows
+        ]
 
         return {
             "data": data,
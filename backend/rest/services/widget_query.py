@@ -288,8 +288,11 @@ def run_widget_query(
     meta: dict[str, Any] = {}
     if spec.display.type in ("line", "area"):
         meta["granularity"] = _pick_granularity(start_time, end_time)
+    # Row tuples are handed over as-is: the route's WidgetQueryResponse
+    # validation already coerces them (and column_names) into lists, so a
+    # per-row list() here would copy every row twice.
     return {
-        "columns": list(result.column_names),
-        "rows": [list(r) for r in result.result_rows],
+        "columns": result.column_names,
+        "rows": result.result_rows,
         "meta": meta,
     }
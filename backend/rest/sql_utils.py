@@ -20,6 +20,14 @@ def to_utc_naive(dt: datetime) -> datetime:
     return dt
 
 
+def utc_now_naive() -> datetime:
+    """Current time as a naive UTC datetime, the form ClickHouse columns compare against.
+
+    Reads the clock directly in UTC — no local-timezone resolution or conversion.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 def escape_ilike(value: str) -> str:
     """Escape ClickHouse ILIKE wildcards (`%`, `_`) plus the escape char itself.
 
@@ -0,0 +1,32 @@
+"""Shared HTTP client for server-to-server calls to the Next.js internal API.
+
+Auth dependencies call ``validate-project-access`` / ``validate-api-key`` on the
+request path. One pooled client keeps those connections alive across requests
+instead of paying a fresh TCP (and TLS, off-cluster) handshake per call.
+"""
+
+import httpx
+
+# Matches the per-request client this replaces.
+UI_CLIENT_TIMEOUT_SECONDS = 10.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_ui_client() -> httpx.AsyncClient:
+    """Get the lazily created, process-wide async client for the Next.js internal API."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=UI_CLIENT_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_ui_client() -> None:
+    """Close the shared client (app shutdown). A later call recreates it."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
@@ -0,0 +1,26 @@
+"""Process-wide ``.env`` loading for service entrypoints.
+
+Both entrypoints (``rest.main`` and ``worker.celery_app``) load ``.env`` before
+anything imports ``shared.config``, and the REST app imports the Celery app
+(to enqueue ingest tasks). Routing both through ``load_env`` means the file is
+located and parsed once per process rather than once per entrypoint module.
+
+This module must not import ``shared.config``: it runs before Settings() exists.
+"""
+
+import functools
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> bool:
+    """Load the nearest ``.env`` into ``os.environ``, at most once per process.
+
+    Existing environment variables are never overridden (``load_dotenv``'s
+    default), so the real environment always wins over the file.
+
+    Returns:
+        bool: True if a ``.env`` file was found and loaded.
+    """
+    return load_dotenv()
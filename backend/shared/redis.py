@@ -9,6 +9,10 @@ import redis.asyncio
 
 from shared.config import settings
 
+# Per-trace pub/sub channel: the ingest worker publishes span batches here and
+# the live SSE endpoint subscribes. Both sides must build the identical name.
+LIVE_TRACE_CHANNEL_PREFIX = "trace:live:"
+
 _sync_client: redis.Redis | None = None
 _async_client: redis.asyncio.Redis | None = None
 
@@ -37,3 +41,8 @@ def get_async_redis_client() -> redis.asyncio.Redis:
             health_check_interval=30,
         )
     return _async_client
+
+
+def live_trace_channel(project_id: str, trace_id: str) -> str:
+    """Pub/sub channel carrying live span batches for one trace."""
+    return f"{LIVE_TRACE_CHANNEL_PREFIX}{project_id}:{trace_id}"
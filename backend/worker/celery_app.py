@@ -10,13 +10,14 @@ import ssl
 
 from celery import Celery
 from celery.signals import worker_ready
-from dotenv import load_dotenv
+
+from shared.env import load_env
 
 logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file FIRST, before any local imports
 # that transitively import shared.config (which creates Settings() at module level).
-load_dotenv()
+load_env()
 
 from db.clickhouse.migrate import run_goose
 from shared.config import settings
@@ -83,10 +84,10 @@ def on_worker_ready(**kwargs):
 
         if result.stdout:
             for line in result.stdout.strip().split("\n"):
-                logger.info(f"goose: {line}")
+                logger.info("goose: %s", line)
 
         if result.returncode != 0:
-            logger.warning(f"ClickHouse migration skipped: {result.stderr.strip()}")
+            logger.warning("ClickHouse migration skipped: %s", result.stderr.strip())
             return
 
         logger.info("ClickHouse migrations completed successfully")
@@ -94,4 +95,4 @@ def on_worker_ready(**kwargs):
     except FileNotFoundError:
         logger.warning("goose not found, skipping ClickHouse migrations.")
     except Exception as e:
-        logger.error(f"ClickHouse migration failed: {e}")
+        logger.error("ClickHouse migration failed: %s", e)
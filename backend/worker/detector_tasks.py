@@ -15,6 +15,8 @@ import asyncio
 import hashlib
 import json
 import logging
+import os
+import time
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,13 @@ _LOCK_TTL_SECONDS = 3600
 # TypeScript EVALUATOR_DELAY constant.
 EVALUATOR_DELAY = 60_000  # ms
 
+# Active detectors per project, reused across ingest batches for
+# settings.detectors_cache_ttl_seconds so a busy project does not open a
+# Postgres connection per batch. Per-process (each prefork child fills its
+# own); bounded so it cannot grow across projects.
+_DETECTORS_CACHE_MAX = 1024
+_detectors_cache: dict[str, tuple[float, list[dict]]] = {}
+
 # Token-checked release: delete the lock only when it still holds the exact
 # value this attempt wrote, so a failing attempt can never delete state
 # written by a successor (which would break exactly-once).
@@ -42,13 +51,29 @@ return 0
 """
 
 
+# Per-process broker client, reused across ingest batches so each batch does
+# not open (and leak) a fresh connection pool. Keyed by pid: a client built
+# before a prefork fork is never reused in the child.
+_redis_client = None
+_redis_client_pid: int | None = None
+
+
 def _get_redis():
-    """Get Redis client using same connection as Celery broker."""
-    import redis
+    """Get Redis client using same connection as Celery broker.
 
-    from worker.celery_app import app as celery_app
+    Built lazily once per worker process and reused; redis-py's pool is
+    thread-safe and reconnects on its own after a dropped connection.
+    """
+    global _redis_client, _redis_client_pid
+    pid = os.getpid()
+    if _redis_client is None or _redis_client_pid != pid:
+        import redis
 
-    return redis.from_url(celery_app.conf.broker_url)
+        from worker.celery_app import app as celery_app
+
+        _redis_client = redis.from_url(celery_app.conf.broker_url)
+        _redis_client_pid = pid
+    return _redis_client
 
 
 def _lock_key(project_id: str, trace_id: str) -> str:
@@ -118,51 +143,60 @@ def _sample_passes(trace_id: str, detector_id: str, sample_rate: float | None) -
     return int.from_bytes(digest[:8], "big") / 2**64 < rate / 100.0
 
 
-def _add_bullmq_job(job_id: str, data: dict) -> None:
-    """Enqueue one delayed detection job via the official BullMQ client.
+def _add_bullmq_jobs(jobs: list[tuple[str, dict]]) -> list[Exception | None]:
+    """Enqueue delayed detection jobs via the official BullMQ client.
 
-    The ``job_id`` is BullMQ's dedup handle: re-adding the same id is a no-op, so
-    a replayed enqueue can never create a second job for the trace. bullmq's API
-    is asyncio while this runs from synchronous Celery task context with no
-    running loop, so the add is wrapped in ``asyncio.run()``.
+    Each ``job_id`` is BullMQ's dedup handle: re-adding the same id is a no-op,
+    so a replayed enqueue can never create a second job for the trace. bullmq's
+    API is asyncio while this runs from synchronous Celery task context with no
+    running loop, so the adds run inside one ``asyncio.run()`` on one ``Queue``
+    (one Redis connection), gathered so a batch pays about one broker round-trip
+    rather than one loop, queue and connection per trace.
 
     Args:
-        job_id (str): Deterministic job id (``"{project}--{trace}"``) BullMQ uses
-            to dedup repeated adds for the same trace.
-        data (dict): Job payload handed to the worker — ``traceId``,
-            ``detectorIds`` and ``projectId``.
+        jobs (list[tuple[str, dict]]): ``(job_id, data)`` pairs. ``job_id`` is
+            the deterministic ``"{project}--{trace}"``; ``data`` is the payload
+            handed to the worker — ``traceId``, ``detectorIds`` and ``projectId``.
 
     Returns:
-        None.
+        list[Exception | None]: One outcome per job, in order — None when the
+            add succeeded, else its exception, so one failed add does not fail
+            the rest of the batch.
     """
     from bullmq import Queue
 
     from worker.celery_app import app as celery_app
 
-    async def _add() -> None:
+    async def _add_all() -> list:
         queue = Queue(DETECTOR_RUN_QUEUE, {"connection": celery_app.conf.broker_url})
         try:
-            await queue.add(
-                "detect",
-                data,
-                {
-                    "jobId": job_id,
-                    "delay": EVALUATOR_DELAY,
-                    # The worker throws on a transient time-since-last-span/eval
-                    # failure and relies on these retries. Back them off
-                    # exponentially (5s, 10s, 20s, 40s) so a brief backend or
-                    # ClickHouse blip doesn't burn every attempt in
-                    # milliseconds and silently drop the trace.
-                    "attempts": 5,
-                    "backoff": {"type": "exponential", "delay": 5000},
-                    "removeOnComplete": 100,
-                    "removeOnFail": 50,
-                },
+            return await asyncio.gather(
+                *(
+                    queue.add(
+                        "detect",
+                        data,
+                        {
+                            "jobId": job_id,
+                            "delay": EVALUATOR_DELAY,
+                            # The worker throws on a transient time-since-last-span/eval
+                            # failure and relies on these retries. Back them off
+                            # exponentially (5s, 10s, 20s, 40s) so a brief backend or
+                            # ClickHouse blip doesn't burn every attempt in
+                            # milliseconds and silently drop the trace.
+                            "attempts": 5,
+                            "backoff": {"type": "exponential", "delay": 5000},
+                            "removeOnComplete": 100,
+                            "removeOnFail": 50,
+                        },
+                    )
+                    for job_id, data in jobs
+                ),
+                return_exceptions=True,
             )
         finally:
             await queue.close()
 
-    asyncio.run(_add())
+    return [r if isinstance(r, Exception) else None for r in asyncio.run(_add_all())]
 
 
 def _eval_condition(trace_summary: dict, condition: dict) -> bool:
@@ -208,14 +242,18 @@ def _get_trace_summaries(project_id: str, trace_ids: list[str]) -> dict[str, dic
 
     ch = get_clickhouse_client()
 
+    # Only the root span carries the trace-level fields, so the root filter is
+    # pushed into WHERE rather than applied inside the aggregate: ClickHouse then
+    # reads and groups one span per trace instead of every span of the batch.
     result = ch.query(
         """
         SELECT
             trace_id,
-            anyIf(environment, parent_span_id IS NULL) AS environment
+            any(environment) AS environment
         FROM spans
         WHERE project_id = {project_id:String}
           AND trace_id IN {trace_ids:Array(String)}
+          AND parent_span_id IS NULL
         GROUP BY trace_id
         """,
         parameters={"project_id": project_id, "trace_ids": trace_ids},
@@ -230,6 +268,40 @@ def _get_trace_summaries(project_id: str, trace_ids: list[str]) -> dict[str, dic
 
 
 def _get_active_detectors(project_id: str) -> list[dict]:
+    """Return the project's active detectors, cached for a short TTL.
+
+    Nothing invalidates an entry early: a detector that is created, disabled,
+    deleted or re-rated takes effect once it expires, i.e. within
+    ``settings.detectors_cache_ttl_seconds`` (0 disables the cache). Empty
+    results are cached too — most projects have no detectors, and they
+    are the ones that would otherwise pay a Postgres round-trip per batch. The
+    returned list is shared between batches and must not be mutated.
+
+    Args:
+        project_id (str): Project whose detectors to load.
+
+    Returns:
+        list[dict]: Dicts with keys ``id``, ``sample_rate`` and ``conditions``.
+    """
+    from shared.config import settings
+
+    ttl = settings.detectors_cache_ttl_seconds
+    if ttl <= 0:
+        return _load_active_detectors(project_id)
+
+    now = time.monotonic()
+    cached = _detectors_cache.get(project_id)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    detectors = _load_active_detectors(project_id)
+    if project_id not in _detectors_cache and len(_detectors_cache) >= _DETECTORS_CACHE_MAX:
+        _detectors_cache.pop(next(iter(_detectors_cache)))
+    _detectors_cache[project_id] = (now + ttl, detectors)
+    return detectors
+
+
+def _load_active_detectors(project_id: str) -> list[dict]:
     """
     Fetch active detectors and their trigger conditions from PostgreSQL using psycopg2.
     Returns list of dicts with keys: id, sample_rate, conditions.
@@ -256,16 +328,13 @@ def _get_active_detectors(project_id: str) -> list[dict]:
 
     detectors = []
     for detector_id, sample_rate, conditions in rows:
-        # conditions is a JSON field; psycopg2 may return dict or None
-        if conditions is None:
-            cond_list = []
-        elif isinstance(conditions, list):
-            cond_list = conditions
-        elif isinstance(conditions, str):
-            cond_list = json.loads(conditions)
-        else:
-            # Already parsed by psycopg2 (dict/list from JSONB)
-            cond_list = conditions if isinstance(conditions, list) else []
+        try:
+            cond_list = _parse_conditions(conditions)
+        except ValueError as e:
+            # Rejected once here rather than raising for every trace evaluated
+            # against it; the project's other detectors still run.
+            logger.warning("Skipping detector %s with malformed conditions: %s", detector_id, e)
+            continue
 
         detectors.append(
             {
@@ -277,88 +346,185 @@ def _get_active_detectors(project_id: str) -> list[dict]:
     return detectors
 
 
-def _claim_and_enqueue(
+_ORDERING_OPS = frozenset((">", ">=", "<", "<="))
+
+
+def _parse_conditions(conditions: object) -> list[dict]:
+    """Parse and validate a detector's trigger conditions once, at load time.
+
+    Args:
+        conditions (object): The ``detector_triggers.conditions`` column —
+            None, a JSON string, or already parsed by psycopg2 (JSONB). A
+            non-list JSON value is treated as no conditions.
+
+    Returns:
+        list[dict]: The conditions, ready for ``_passes_trigger``.
+
+    Raises:
+        ValueError: The JSON is unparseable, a condition is not an object, or an
+            ordering comparison (``>``, ``>=``, ``<``, ``<=``) has a non-numeric
+            ``value`` — which ``_eval_condition`` would otherwise hit as a
+            ``float()`` failure on every trace.
+    """
+    if isinstance(conditions, str):
+        conditions = json.loads(conditions)
+    if not isinstance(conditions, list):
+        return []
+    for condition in conditions:
+        if not isinstance(condition, dict):
+            raise ValueError(f"condition is not an object: {condition!r}")
+        if condition.get("op") in _ORDERING_OPS:
+            value = condition.get("value")
+            if value is not None:
+                try:
+                    float(value)
+                    continue
+                except (TypeError, ValueError):
+                    pass
+            raise ValueError(f"non-numeric value for {condition.get('op')!r}: {value!r}")
+    return conditions
+
+
+def _claim_traces(
+    redis_client, project_id: str, trace_ids: list[str]
+) -> dict[str, tuple[str, str]]:
+    """NX-claim every root-bearing trace of a batch in one pipelined round-trip.
+
+    A claim loses against ingest-task retry replay, duplicate root delivery, or
+    a concurrent batch — exactly-once holds either way, since each SET NX is
+    still atomic on its own; the pipeline only saves the per-trace round-trip.
+
+    Args:
+        redis_client (redis.Redis): Redis client for the NX claims.
+        project_id (str): Project that owns the traces.
+        trace_ids (list[str]): Traces whose root span arrived in this batch.
+
+    Returns:
+        dict[str, tuple[str, str]]: For each claim this call won, the trace id
+            mapped to ``(token, lock value written)``.
+    """
+    # The lock's JSON payload (state/token/detector_ids) is diagnostic only —
+    # nothing reads it back now that re-eval is gone; the key is purely an NX
+    # dedup marker preventing a second enqueue for the same trace.
+    attempts: dict[str, tuple[str, str]] = {}
+    for trace_id in trace_ids:
+        token = uuid.uuid4().hex
+        attempts[trace_id] = (token, json.dumps({"state": "deciding", "token": token}))
+
+    pipe = redis_client.pipeline(transaction=False)
+    for trace_id, (_token, value) in attempts.items():
+        pipe.set(_lock_key(project_id, trace_id), value, nx=True, ex=_LOCK_TTL_SECONDS)
+    won = pipe.execute()
+
+    claimed: dict[str, tuple[str, str]] = {}
+    for (trace_id, attempt), ok in zip(attempts.items(), won):
+        if ok:
+            claimed[trace_id] = attempt
+        else:
+            logger.debug("Detector enqueue already claimed for trace %s; skipping", trace_id)
+    return claimed
+
+
+def _enqueue_claimed(
     redis_client,
     project_id: str,
-    trace_id: str,
+    claims: dict[str, tuple[str, str]],
     detectors: list[dict],
-    summary: dict,
+    summaries: dict[str, dict],
 ) -> None:
-    """Root-bearing batch: claim the trace and enqueue at most one detection job.
+    """Enqueue at most one detection job per trace this batch has claimed.
 
-    Takes the NX claim for ``(project_id, trace_id)``; if it wins, evaluates the
-    trigger conditions plus deterministic sampling and enqueues a single delayed
-    BullMQ job for the detectors that fire. A lost claim (ingest-task retry
-    replay, duplicate root delivery, or a concurrent batch) is a no-op, keeping
-    enqueue exactly-once.
+    Evaluates the trigger conditions plus deterministic sampling for each trace,
+    adds one delayed BullMQ job per trace whose detectors fire (all in a single
+    :func:`_add_bullmq_jobs` call), then records each outcome on its lock.
+
+    Failures are per trace, so a malformed condition (e.g. non-numeric ``value``
+    for a ``>`` op causing float() to ValueError, or a None sample_rate) or a
+    failed add only drops the offending trace: the lock value that attempt
+    wrote is released, so a later batch can re-claim, and the error is logged.
 
     Args:
-        redis_client (redis.Redis): Redis client for the NX claim and
+        redis_client (redis.Redis): Redis client for the lock updates and
             token-checked release.
-        project_id (str): Project that owns the trace.
-        trace_id (str): Trace whose root span arrived in this batch.
+        project_id (str): Project that owns the traces.
+        claims (dict[str, tuple[str, str]]): Trace id -> ``(token, lock value
+            written)`` from :func:`_claim_traces`.
         detectors (list[dict]): Active detectors, each a dict with ``id``,
             ``sample_rate`` and ``conditions``.
-        summary (dict): Trace summary fields used for trigger evaluation (e.g.
-            ``environment``).
-
-    Returns:
-        None: On an enqueue failure the lock value this attempt wrote is
-            released (so a later batch can re-claim) and the error is re-raised
-            to the caller, which logs it per-trace without breaking ingestion.
+        summaries (dict[str, dict]): Trace summary fields per trace used for
+            trigger evaluation (e.g. ``environment``).
     """
-    # The lock's JSON payload (state/token/detector_ids) is diagnostic only —
-    # nothing reads it back now that re-eval is gone; the key is purely an NX
-    # dedup marker preventing a second enqueue for the same trace.
-    key = _lock_key(project_id, trace_id)
-    token = uuid.uuid4().hex
-    last_written = json.dumps({"state": "deciding", "token": token})
-
-    # NX claim: loses against ingest-task retry replay, duplicate root
-    # delivery, or a concurrent batch — exactly-once holds either way.
-    if not redis_client.set(key, last_written, nx=True, ex=_LOCK_TTL_SECONDS):
-        logger.debug(f"Detector enqueue already claimed for trace {trace_id}; skipping")
-        return
+    triggered: dict[str, list[str]] = {}
+    for trace_id, (token, last_written) in claims.items():
+        key = _lock_key(project_id, trace_id)
+        summary = summaries.get(trace_id, {})
+        try:
+            triggered_ids = [
+                d["id"]
+                for d in detectors
+                if _passes_trigger(summary, d["conditions"])
+                and _sample_passes(trace_id, d["id"], d["sample_rate"])
+            ]
+            if not triggered_ids:
+                # Sticky no: a replay must not re-roll conditions or sampling.
+                redis_client.set(
+                    key,
+                    json.dumps({"state": "sampled_out", "token": token}),
+                    ex=_LOCK_TTL_SECONDS,
+                )
+                continue
+        except Exception as trace_err:
+            _fail_claimed(redis_client, key, last_written, trace_id, trace_err)
+            continue
+        triggered[trace_id] = triggered_ids
 
+    if not triggered:
+        return
+    jobs = [
+        (
+            f"{project_id}--{trace_id}",
+            {"traceId": trace_id, "detectorIds": triggered_ids, "projectId": project_id},
+        )
+        for trace_id, triggered_ids in triggered.items()
+    ]
     try:
-        triggered_ids = [
-            d["id"]
-            for d in detectors
-            if _passes_trigger(summary, d["conditions"])
-            and _sample_passes(trace_id, d["id"], d["sample_rate"])
-        ]
-
-        if not triggered_ids:
-            # Sticky no: a replay must not re-roll conditions or sampling.
+        outcomes = _add_bullmq_jobs(jobs)
+    except Exception as batch_err:
+        outcomes = [batch_err] * len(jobs)
+
+    for (trace_id, triggered_ids), error in zip(triggered.items(), outcomes):
+        token, last_written = claims[trace_id]
+        key = _lock_key(project_id, trace_id)
+        try:
+            if error is not None:
+                raise error
             redis_client.set(
                 key,
-                json.dumps({"state": "sampled_out", "token": token}),
+                json.dumps({"state": "pending", "detector_ids": triggered_ids, "token": token}),
                 ex=_LOCK_TTL_SECONDS,
             )
-            return
+            logger.debug("Enqueued detector run: trace=%s detectors=%s", trace_id, triggered_ids)
+        except Exception as trace_err:
+            _fail_claimed(redis_client, key, last_written, trace_id, trace_err)
 
-        _add_bullmq_job(
-            f"{project_id}--{trace_id}",
-            {
-                "traceId": trace_id,
-                "detectorIds": triggered_ids,
-                "projectId": project_id,
-            },
-        )
-        redis_client.set(
-            key,
-            json.dumps({"state": "pending", "detector_ids": triggered_ids, "token": token}),
-            ex=_LOCK_TTL_SECONDS,
-        )
-        logger.debug(f"Enqueued detector run: trace={trace_id} detectors={triggered_ids}")
-    except Exception:
-        # Release only the value this attempt wrote so a later batch or retry
-        # can re-claim; a BullMQ job that was already added dedups by jobId.
-        _release_lock_if_value(redis_client, key, last_written)
-        raise
+
+def _fail_claimed(
+    redis_client, key: str, last_written: str, trace_id: str, error: BaseException
+) -> None:
+    """Release a failed trace's claim and log it without failing the batch.
+
+    Only the value this attempt wrote is released, so a later batch or retry can
+    re-claim; a BullMQ job that was already added dedups by jobId.
+    """
+    _release_lock_if_value(redis_client, key, last_written)
+    logger.error("Failed to enqueue detector run for trace %s: %s", trace_id, error, exc_info=error)
 
 
-def enqueue_detector_runs(project_id: str, traces_with_root: set[str]) -> None:
+def enqueue_detector_runs(
+    project_id: str,
+    traces_with_root: set[str],
+    summaries: dict[str, dict] | None = None,
+) -> None:
     """Claim and (conditions + sampling permitting) enqueue detection for traces
     whose root span arrived in this ingest batch.
 
@@ -373,6 +539,9 @@ def enqueue_detector_runs(project_id: str, traces_with_root: set[str]) -> None:
         project_id (str): Project that owns the traces.
         traces_with_root (set[str]): Trace IDs whose root span arrived in this
             batch; each is claimed once and enqueued if it triggers.
+        summaries (dict[str, dict] | None): Trigger-evaluation fields per trace,
+            in the shape :func:`_get_trace_summaries` returns, when the caller
+            already holds the root spans. None reads them back from ClickHouse.
     """
     if not traces_with_root:
         return
@@ -381,29 +550,24 @@ def enqueue_detector_runs(project_id: str, traces_with_root: set[str]) -> None:
         root_traces = list(traces_with_root)
         redis_client = _get_redis()
         detectors = _get_active_detectors(project_id)
-        summaries = _get_trace_summaries(project_id, root_traces) if detectors else {}
-        for trace_id in root_traces:
-            # Per-trace try/except so a malformed condition (e.g. non-numeric
-            # `value` for a `>` op causing float() to ValueError, or a None
-            # sample_rate) only drops the offending trace — remaining traces
-            # in the batch still get enqueued.
-            try:
-                _claim_and_enqueue(
-                    redis_client,
-                    project_id,
-                    trace_id,
-                    detectors,
-                    summaries.get(trace_id, {}),
-                )
-            except Exception as trace_err:
-                logger.error(
-                    f"Failed to enqueue detector run for trace {trace_id}: {trace_err}",
-                    exc_info=True,
-                )
+        # Summaries only feed trigger conditions: when no active detector has
+        # any, skip the ClickHouse round-trip outright (sampling needs only ids).
+        needs_summaries = any(d["conditions"] for d in detectors)
+        if not needs_summaries:
+            summaries = {}
+        elif summaries is None:
+            summaries = _get_trace_summaries(project_id, root_traces)
+        # Claimed only once detectors and summaries are in hand, so a failed load
+        # cannot leave the batch's traces locked without a decision.
+        claims = _claim_traces(redis_client, project_id, root_traces)
+
+        _enqueue_claimed(redis_client, project_id, claims, detectors, summaries)
 
     except Exception as e:
         # Non-blocking: log and return, never raise
         logger.error(
-            f"Failed to enqueue detector runs for project {project_id}: {e}",
+            "Failed to enqueue detector runs for project %s: %s",
+            project_id,
+            e,
             exc_info=True,
         )
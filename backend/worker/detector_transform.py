@@ -13,6 +13,8 @@ honor a payload project id because this code simply is not in its chain —
 the security boundary is structural, not a flag.
 """
 
+from itertools import chain
+
 from worker.otel_transform import attributes_to_dict, transform_otel_to_clickhouse
 
 _PROJECT_ID_ATTR = "traceroot.project_id"
@@ -92,10 +94,13 @@ def transform_detector_traces(
                     }
                 )
 
-    all_traces: list[dict] = []
-    all_spans: list[dict] = []
-    for project_id, group in grouped.items():
-        traces, spans = transform_otel_to_clickhouse(group, project_id)
-        all_traces.extend(traces)
-        all_spans.extend(spans)
-    return all_traces, all_spans
+    results = [
+        transform_otel_to_clickhouse(group, project_id) for project_id, group in grouped.items()
+    ]
+    if len(results) == 1:
+        # The common case — one project per batch — needs no concatenation.
+        return results[0]
+    return (
+        list(chain.from_iterable(traces for traces, _ in results)),
+        list(chain.from_iterable(spans for _, spans in results)),
+    )
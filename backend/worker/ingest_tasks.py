@@ -5,6 +5,7 @@ This module defines the async tasks that process trace data from S3 to ClickHous
 
 import json
 import logging
+import os
 from collections import defaultdict
 from datetime import datetime
 
@@ -12,6 +13,31 @@ from worker.celery_app import app
 
 logger = logging.getLogger(__name__)
 
+# Per-process Redis client for live-span publishing, reused across ingest batches
+# so each batch does not open (and tear down) its own connection pool. Keyed by
+# pid and built lazily inside the worker: a client created before a prefork
+# fork() is never reused in the child (on macOS that crashes with SIGABRT).
+_live_redis_client = None
+_live_redis_client_pid: int | None = None
+
+
+def _get_live_redis():
+    """Get the per-process Redis client for live trace streaming.
+
+    redis-py's pool is thread-safe and reconnects on its own after a dropped
+    connection, so one client serves every batch the process handles.
+    """
+    global _live_redis_client, _live_redis_client_pid
+    pid = os.getpid()
+    if _live_redis_client is None or _live_redis_client_pid != pid:
+        import redis as redis_lib
+
+        from shared.config import settings
+
+        _live_redis_client = redis_lib.from_url(settings.redis.url, decode_responses=True)
+        _live_redis_client_pid = pid
+    return _live_redis_client
+
 
 def _json_serializer(obj: object) -> str:
     """JSON serializer for datetime objects in span dicts."""
@@ -20,6 +46,12 @@ def _json_serializer(obj: object) -> str:
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+# Built once: json.dumps(..., default=...) constructs a fresh encoder on every
+# call, i.e. once per trace in every ingest batch.
+_LIVE_SPANS_ENCODER = json.JSONEncoder(default=_json_serializer)
+_TRACE_COMPLETE_MESSAGE = json.dumps({"type": "trace_complete"})
+
+
 def _publish_live_spans(spans: list[dict], project_id: str) -> None:
     """Publish spans to Redis for live trace streaming.
 
@@ -27,45 +59,54 @@ def _publish_live_spans(spans: list[dict], project_id: str) -> None:
     Never raises — Redis failures must not break the ingest pipeline.
     """
     try:
-        import redis as redis_lib
+        from shared.redis import live_trace_channel
 
-        from shared.config import settings
+        # Not the shared get_redis_client() singleton: see _get_live_redis.
+        redis_client = _get_live_redis()
 
-        # Create a fresh Redis connection per call — do NOT use the singleton
-        # get_redis_client() here because Celery uses prefork and module-level
-        # singletons created before/across fork() crash on macOS (SIGABRT).
-        redis_client = redis_lib.from_url(settings.redis.url, decode_responses=True)
-
-        # Group spans by trace_id
+        # Group spans by trace_id, noting in the same pass which traces are
+        # complete (root span with end time) instead of rescanning each group.
         by_trace: dict[str, list[dict]] = defaultdict(list)
+        completed: set[str] = set()
         for span in spans:
-            by_trace[span["trace_id"]].append(span)
-
+            trace_id = span["trace_id"]
+            by_trace[trace_id].append(span)
+            if span.get("parent_span_id") is None and span.get("span_end_time") is not None:
+                completed.add(trace_id)
+
+        # Queue every publish on one non-transactional pipeline so the batch
+        # costs a single round-trip instead of one or two per trace. Per-channel
+        # order is preserved, so trace_complete still follows its spans.
+        pipe = redis_client.pipeline(transaction=False)
         for trace_id, trace_spans in by_trace.items():
-            channel = f"trace:live:{project_id}:{trace_id}"
-
-            # Publish spans
-            payload = json.dumps(
-                {"type": "spans", "spans": trace_spans},
-                default=_json_serializer,
-            )
-            redis_client.publish(channel, payload)
-
-            # Check if trace is complete (root span with end time)
-            for span in trace_spans:
-                if span.get("parent_span_id") is None and span.get("span_end_time") is not None:
-                    redis_client.publish(
-                        channel,
-                        json.dumps({"type": "trace_complete"}),
-                    )
-                    break
-
-        redis_client.close()
+            channel = live_trace_channel(project_id, trace_id)
+            payload = _LIVE_SPANS_ENCODER.encode({"type": "spans", "spans": trace_spans})
+            pipe.publish(channel, payload)
+            if trace_id in completed:
+                pipe.publish(channel, _TRACE_COMPLETE_MESSAGE)
+        pipe.execute()
 
     except Exception:
         logger.warning("Failed to publish live spans to Redis", exc_info=True)
 
 
+def _insert_traces_and_spans(ch_client, traces: list[dict], spans: list[dict]) -> None:
+    """Insert the trace batch, then the span batch.
+
+    Kept in order: if the trace insert fails the span insert never runs, and
+    Celery retries the whole task. Both inserts are idempotent under
+    ReplacingMergeTree, so a retry after a span failure heals the batch.
+    """
+    if traces:
+        ch_client.insert_traces_batch(traces)
+    if spans:
+        ch_client.insert_spans_batch(spans)
+
+    if traces or spans:
+        # One record per batch rather than one per table.
+        logger.info("Inserted %s traces and %s spans into ClickHouse", len(traces), len(spans))
+
+
 @app.task(
     bind=True,
     autoretry_for=(Exception,),
@@ -93,19 +134,26 @@ def process_s3_traces(self, s3_key: str, project_id: str) -> dict:
     from rest.services.s3 import get_s3_service
     from worker.otel_transform import transform_otel_to_clickhouse
 
-    logger.info(f"Processing S3 traces: {s3_key} for project {project_id}")
+    logger.info("Processing S3 traces: %s for project %s", s3_key, project_id)
 
     try:
         # 1. Download from S3
         s3_service = get_s3_service()
         otel_data = s3_service.download_json(s3_key)
-        logger.debug(f"Downloaded OTEL data from {s3_key}")
+        logger.debug("Downloaded OTEL data from %s", s3_key)
 
         # 2. Transform to ClickHouse format
         traces, spans = transform_otel_to_clickhouse(otel_data, project_id)
-        logger.info(f"Transformed {len(traces)} traces and {len(spans)} spans from {s3_key}")
-
-        root_bearing_trace_ids = {s["trace_id"] for s in spans if s.get("parent_span_id") is None}
+        logger.info("Transformed %s traces and %s spans from %s", len(traces), len(spans), s3_key)
+
+        # The root spans carry every field detector triggers read, so their
+        # summaries are taken here rather than read back after the insert.
+        root_summaries = {
+            s["trace_id"]: {"environment": s.get("environment")}
+            for s in spans
+            if s.get("parent_span_id") is None
+        }
+        root_bearing_trace_ids = set(root_summaries)
 
         # 3. Insert into ClickHouse
         if traces or spans:
@@ -140,13 +188,7 @@ def process_s3_traces(self, s3_key: str, project_id: str) -> dict:
                         or t["trace_id"] not in existing_ids
                     ]
 
-                if traces:
-                    ch_client.insert_traces_batch(traces)
-                    logger.info(f"Inserted {len(traces)} traces into ClickHouse")
-
-            if spans:
-                ch_client.insert_spans_batch(spans)
-                logger.info(f"Inserted {len(spans)} spans into ClickHouse")
+            _insert_traces_and_spans(ch_client, traces, spans)
 
         # Trigger detector runs (fire-and-forget, non-blocking). The batch that
         # carries a trace's root span triggers detection exactly once — a Redis
@@ -158,9 +200,9 @@ def process_s3_traces(self, s3_key: str, project_id: str) -> dict:
             try:
                 from worker.detector_tasks import enqueue_detector_runs
 
-                enqueue_detector_runs(project_id, root_bearing_trace_ids)
+                enqueue_detector_runs(project_id, root_bearing_trace_ids, summaries=root_summaries)
             except Exception as e:
-                logger.error(f"Failed to call detector tasks: {e}", exc_info=True)
+                logger.error("Failed to call detector tasks: %s", e, exc_info=True)
 
         # 4. Publish to Redis for live trace streaming
         if spans:
@@ -174,5 +216,5 @@ def process_s3_traces(self, s3_key: str, project_id: str) -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Failed to process {s3_key}: {e}", exc_info=True)
+        logger.error("Failed to process %s: %s", s3_key, e, exc_info=True)
         raise  # Re-raise to trigger Celery retry
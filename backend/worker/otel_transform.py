@@ -32,9 +32,10 @@ OTEL JSON structure (camelCase - standard OTLP format):
 """
 
 import base64
+import heapq
 import json
 import logging
-from datetime import UTC, datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 from shared.enums import SpanKind, SpanStatus
@@ -62,14 +63,26 @@ def _scope_skips_text_token_estimation(scope_name: str | None) -> bool:
 # operation name; "agent_step" is an emitter extension, not in the spec enum.
 _AGGREGATE_USAGE_OPERATIONS = frozenset({"invoke_agent", "agent_step"})
 
+# Span-kind lookups run once per ingested span, so the candidate sets are built
+# once here rather than as tuple literals scanned on every call. The kinds are
+# stored as plain strings: the attribute values they are matched against are.
+_SPAN_KIND_VALUES = frozenset(kind.value for kind in SpanKind)
+# GenAI semconv operation names that denote a model call.
+_LLM_OPERATIONS = frozenset({"chat", "text_completion", "embeddings"})
+
+
+def _scope_is_gen_ai(scope_name: str | None) -> bool:
+    return isinstance(scope_name, str) and scope_name.lower() == "gen_ai"
+
 
 def _span_aggregates_child_usage(
-    scope_name: str | None, span_kind: str, attrs: dict[str, Any]
+    scope_is_gen_ai: bool, span_kind: str, attrs: dict[str, Any]
 ) -> bool:
     """Check whether a span restates the token usage of its model-call children.
 
     Args:
-        scope_name (str | None): Instrumentation scope of the emitting tracer.
+        scope_is_gen_ai (bool): Whether the emitting tracer's scope is ``gen_ai``,
+            resolved once per scope by the caller (see ``_scope_is_gen_ai``).
         span_kind (str): Span kind already resolved for this span.
         attrs (dict[str, Any]): Span attributes.
 
@@ -84,13 +97,12 @@ def _span_aggregates_child_usage(
     # version that stops setting one would otherwise silently resume double-pricing,
     # which nothing else in the pipeline would surface. Narrow on purpose: it costs
     # nothing when the operation name is present, which is the shape observed today.
-    return (
-        isinstance(scope_name, str) and scope_name.lower() == "gen_ai" and span_kind != SpanKind.LLM
-    )
+    return scope_is_gen_ai and span_kind != SpanKind.LLM
 
 
-# Attributes that are already extracted into dedicated fields
-_KNOWN_ATTRIBUTE_PREFIXES = {
+# Attributes that are already extracted into dedicated fields. A tuple, not a set:
+# str.startswith takes it directly and tests every prefix in one C-level call.
+_KNOWN_ATTRIBUTE_PREFIXES = (
     "traceroot.span.input",
     "traceroot.span.output",
     "traceroot.span.type",
@@ -113,7 +125,7 @@ _KNOWN_ATTRIBUTE_PREFIXES = {
     "llm.model_name",
     "llm.input_messages",
     "llm.output_messages",
-}
+)
 
 
 # Extracted attributes matched by EXACT name — a prefix entry would also swallow
@@ -132,9 +144,8 @@ _KNOWN_ATTRIBUTE_EXACT = frozenset(
 
 def _is_known_attribute(key: str) -> bool:
     """Check if an attribute key is already extracted into a dedicated field."""
-    return key in _KNOWN_ATTRIBUTE_EXACT or any(
-        key == prefix or key.startswith(prefix) for prefix in _KNOWN_ATTRIBUTE_PREFIXES
-    )
+    # startswith also covers a key equal to a prefix, so no separate == test.
+    return key in _KNOWN_ATTRIBUTE_EXACT or key.startswith(_KNOWN_ATTRIBUTE_PREFIXES)
 
 
 def first_present(attrs: dict[str, Any], keys: list[str]) -> Any:
@@ -163,6 +174,10 @@ def first_present(attrs: dict[str, Any], keys: list[str]) -> Any:
 # magnitude beyond any shipped context window, so nothing legitimate is near it.
 _MAX_PLAUSIBLE_TOKENS = 10**9
 
+# Naive-UTC epoch that span timestamps are offset from. Built once so the per-span
+# conversion is a single integer add rather than a tz-aware round trip.
+_EPOCH = datetime(1970, 1, 1)
+
 
 def _usable_token_value(value: Any) -> bool:
     """Check whether a token attribute will survive ``int_or_zero`` intact.
@@ -356,12 +371,13 @@ def parse_manual_usage(raw: Any) -> dict[str, int]:
     # Fields outside the recognized set are never examined below, so without this
     # they vanish without any signal at all — a provider token type we don't model
     # yet (audio, image, a new cache variant) reads as if it was never reported.
-    # Bounded because the payload is client-controlled.
-    unrecognized = sorted(k for k in raw if k not in _MANUAL_USAGE_KEYS)
+    # Bounded because the payload is client-controlled: only the first ten
+    # names are reported, so a bounded heap selects them without sorting them all.
+    unrecognized = heapq.nsmallest(10, (k for k in raw if k not in _MANUAL_USAGE_KEYS))
     if unrecognized:
         logger.warning(
             "Manual usage fields %s are not recognized and were ignored; recognized fields are %s",
-            unrecognized[:10],
+            unrecognized,
             list(_MANUAL_USAGE_KEYS),
         )
     usage: dict[str, int] = {}
@@ -417,7 +433,7 @@ def decode_otel_id(b64_value: str | None) -> str | None:
             return None
         return hex_id
     except Exception as e:
-        logger.warning(f"Failed to decode OTEL ID '{b64_value}': {e}")
+        logger.warning("Failed to decode OTEL ID '%s': %s", b64_value, e)
         return b64_value  # Return as-is if decoding fails
 
 
@@ -428,7 +444,8 @@ def nanos_to_datetime(nanos: int | str | None) -> datetime | None:
         nanos: Unix timestamp in nanoseconds (int or string representation)
 
     Returns:
-        datetime object, or None if input is None/empty
+        datetime object, or None if input is None/empty or outside the range a
+        datetime can hold (treated as missing rather than failing the batch)
     """
     if nanos is None:
         return None
@@ -437,9 +454,16 @@ def nanos_to_datetime(nanos: int | str | None) -> datetime | None:
         if not nanos:
             return None
         nanos = int(nanos)
-    # Convert nanos to seconds (float to preserve precision)
-    seconds = nanos / 1_000_000_000
-    return datetime.fromtimestamp(seconds, tz=UTC).replace(tzinfo=None)
+    # Integer microseconds, rounded half to even as datetime.fromtimestamp
+    # rounds, but exact at any epoch and with no tz object.
+    micros, remainder = divmod(nanos, 1_000)
+    if remainder > 500 or (remainder == 500 and micros % 2):
+        micros += 1
+    try:
+        return _EPOCH + timedelta(microseconds=micros)
+    except OverflowError:
+        logger.warning("Ignoring out-of-range OTEL timestamp: %s ns", nanos)
+        return None
 
 
 def extract_attribute_value(attr_value: dict) -> Any:
@@ -506,7 +530,7 @@ def get_span_kind(attrs: dict[str, Any], otel_kind: int | str | None) -> str:
     """
     # Check explicit type attribute (handle None values)
     explicit_type = str_attr(attrs.get("traceroot.span.type")).upper()
-    if explicit_type in (SpanKind.LLM, SpanKind.SPAN, SpanKind.AGENT, SpanKind.TOOL):
+    if explicit_type in _SPAN_KIND_VALUES:
         return explicit_type
 
     # Check OpenInference semantic conventions (handle None values)
@@ -522,7 +546,7 @@ def get_span_kind(attrs: dict[str, Any], otel_kind: int | str | None) -> str:
 
     # GenAI semconv operation name (pydantic-ai, native OTel GenAI instrumentors)
     operation_name = str_attr(attrs.get("gen_ai.operation.name")).lower()
-    if operation_name in ("chat", "text_completion", "embeddings"):
+    if operation_name in _LLM_OPERATIONS:
         return SpanKind.LLM
     if operation_name == "execute_tool":
         return SpanKind.TOOL
@@ -616,6 +640,9 @@ def transform_otel_to_clickhouse(
         for scope_span in scope_spans:
             otel_spans = scope_span.get("spans", [])
             scope_name = (scope_span.get("scope") or {}).get("name")
+            # Scope-level facts, resolved once here rather than per span below.
+            scope_is_gen_ai = _scope_is_gen_ai(scope_name)
+            scope_skips_estimation = _scope_skips_text_token_estimation(scope_name)
 
             for otel_span in otel_spans:
                 # Decode IDs (camelCase: traceId, spanId, parentSpanId)
@@ -632,7 +659,7 @@ def transform_otel_to_clickhouse(
                 end_time = nanos_to_datetime(otel_span.get("endTimeUnixNano"))
 
                 if not start_time:
-                    logger.warning(f"Skipping span {span_id} with missing startTimeUnixNano")
+                    logger.warning("Skipping span %s with missing startTimeUnixNano", span_id)
                     continue
 
                 # Parse attributes
@@ -832,7 +859,7 @@ def transform_otel_to_clickhouse(
                     # keys gated above, moved into the normalized namespace.
                     # Adopting them prices every token twice.
                     aggregate_wrapper = _span_aggregates_child_usage(
-                        scope_name, span_kind, span_attrs
+                        scope_is_gen_ai, span_kind, span_attrs
                     )
 
                     # Manual usage reported via the SDKs' update-span API
@@ -939,7 +966,7 @@ def transform_otel_to_clickhouse(
                     elif (
                         not aggregate_wrapper
                         and span_kind == SpanKind.LLM
-                        and not _scope_skips_text_token_estimation(scope_name)
+                        and not scope_skips_estimation
                     ):
                         # Fall back to text-based estimation — only for LLM (completion)
                         # spans. Wrapper AGENT/CHAIN spans restate text their LLM children
@@ -1028,61 +1055,47 @@ def transform_otel_to_clickhouse(
                 span_git_ref = str_or_none(span_attrs.get("traceroot.git.ref"))
                 span_git_repo = str_or_none(span_attrs.get("traceroot.git.repo"))
 
-                if trace_id not in trace_attrs:
-                    trace_attrs[trace_id] = {"user_id": None, "session_id": None}
-                if trace_id not in trace_git_attrs:
-                    trace_git_attrs[trace_id] = {"git_ref": None, "git_repo": None}
+                # Bound once per span: every merge below reads and writes these.
+                ids_attrs = trace_attrs.setdefault(trace_id, {"user_id": None, "session_id": None})
+                git_attrs = trace_git_attrs.setdefault(
+                    trace_id, {"git_ref": None, "git_repo": None}
+                )
 
                 if not parent_span_id:
                     # Root span: always use its values if present (overwrites child values)
-                    trace_attrs[trace_id]["user_id"] = (
-                        span_user_id or trace_attrs[trace_id]["user_id"]
-                    )
-                    trace_attrs[trace_id]["session_id"] = (
-                        span_session_id or trace_attrs[trace_id]["session_id"]
-                    )
-                    trace_git_attrs[trace_id]["git_ref"] = (
-                        span_git_ref or trace_git_attrs[trace_id]["git_ref"]
-                    )
-                    trace_git_attrs[trace_id]["git_repo"] = (
-                        span_git_repo or trace_git_attrs[trace_id]["git_repo"]
-                    )
+                    ids_attrs["user_id"] = span_user_id or ids_attrs["user_id"]
+                    ids_attrs["session_id"] = span_session_id or ids_attrs["session_id"]
+                    git_attrs["git_ref"] = span_git_ref or git_attrs["git_ref"]
+                    git_attrs["git_repo"] = span_git_repo or git_attrs["git_repo"]
                 else:
                     # Child span: only set if not already set (first child wins)
-                    trace_attrs[trace_id]["user_id"] = (
-                        trace_attrs[trace_id]["user_id"] or span_user_id
-                    )
-                    trace_attrs[trace_id]["session_id"] = (
-                        trace_attrs[trace_id]["session_id"] or span_session_id
-                    )
-                    trace_git_attrs[trace_id]["git_ref"] = (
-                        trace_git_attrs[trace_id]["git_ref"] or span_git_ref
-                    )
-                    trace_git_attrs[trace_id]["git_repo"] = (
-                        trace_git_attrs[trace_id]["git_repo"] or span_git_repo
-                    )
+                    ids_attrs["user_id"] = ids_attrs["user_id"] or span_user_id
+                    ids_attrs["session_id"] = ids_attrs["session_id"] or span_session_id
+                    git_attrs["git_ref"] = git_attrs["git_ref"] or span_git_ref
+                    git_attrs["git_repo"] = git_attrs["git_repo"] or span_git_repo
 
                 # Eager trace creation:
                 # Create a "shallow" trace record on the FIRST span we see for
                 # a trace_id, so it appears in the UI immediately. When the root
                 # span arrives later, upgrade to a "full" trace with rich metadata.
-                if trace_id not in traces:
+                trace_record = traces.get(trace_id)
+                if trace_record is None:
                     # Shallow trace — minimal placeholder so the trace appears in the
                     # list immediately. The post-loop _trace_name_candidates correction
                     # always overwrites "name" with the authoritative value, so there
                     # is no need to compute path[0] here.
-                    traces[trace_id] = {
+                    trace_record = traces[trace_id] = {
                         "trace_id": trace_id,
                         "project_id": project_id,
                         "trace_start_time": start_time,
                         "name": span_name,
-                        "user_id": trace_attrs[trace_id]["user_id"],
-                        "session_id": trace_attrs[trace_id]["session_id"],
+                        "user_id": ids_attrs["user_id"],
+                        "session_id": ids_attrs["session_id"],
                     }
-                    if trace_git_attrs[trace_id]["git_ref"] is not None:
-                        traces[trace_id]["git_ref"] = trace_git_attrs[trace_id]["git_ref"]
-                    if trace_git_attrs[trace_id]["git_repo"] is not None:
-                        traces[trace_id]["git_repo"] = trace_git_attrs[trace_id]["git_repo"]
+                    if git_attrs["git_ref"] is not None:
+                        trace_record["git_ref"] = git_attrs["git_ref"]
+                    if git_attrs["git_repo"] is not None:
+                        trace_record["git_repo"] = git_attrs["git_repo"]
 
                 # Track the best-known root name for this trace using the span
                 # closest to the root (shortest ids_path). Batches may contain
@@ -1106,68 +1119,62 @@ def transform_otel_to_clickhouse(
 
                 if not parent_span_id:
                     # Root span arrived — upgrade to full trace with rich metadata
-                    traces[trace_id].update(
+                    trace_record.update(
                         {
                             "trace_start_time": start_time,
                             "name": span_name,
-                            "user_id": trace_attrs[trace_id]["user_id"],
-                            "session_id": trace_attrs[trace_id]["session_id"],
+                            "user_id": ids_attrs["user_id"],
+                            "session_id": ids_attrs["session_id"],
                         }
                     )
 
                     if isinstance(environment, str):
-                        traces[trace_id]["environment"] = environment
-                    if trace_git_attrs[trace_id]["git_ref"] is not None:
-                        traces[trace_id]["git_ref"] = trace_git_attrs[trace_id]["git_ref"]
-                    if trace_git_attrs[trace_id]["git_repo"] is not None:
-                        traces[trace_id]["git_repo"] = trace_git_attrs[trace_id]["git_repo"]
+                        trace_record["environment"] = environment
+                    if git_attrs["git_ref"] is not None:
+                        trace_record["git_ref"] = git_attrs["git_ref"]
+                    if git_attrs["git_repo"] is not None:
+                        trace_record["git_repo"] = git_attrs["git_repo"]
 
                     # Extract trace-level metadata
                     trace_metadata = span_attrs.get("traceroot.trace.metadata")
                     if trace_metadata is not None:
-                        traces[trace_id]["metadata"] = (
+                        trace_record["metadata"] = (
                             json.dumps(trace_metadata)
                             if not isinstance(trace_metadata, str)
                             else trace_metadata
                         )
 
-                    # Root span input/output becomes trace input/output
+                    # Root span input/output becomes trace input/output. The span
+                    # record already holds the serialized form, so reuse it.
                     if span_input is not None:
-                        traces[trace_id]["input"] = (
-                            json.dumps(span_input)
-                            if not isinstance(span_input, str)
-                            else span_input
-                        )
+                        trace_record["input"] = span_record["input"]
                     if span_output is not None:
-                        traces[trace_id]["output"] = (
-                            json.dumps(span_output)
-                            if not isinstance(span_output, str)
-                            else span_output
-                        )
-
-    # Correct eager trace names: the first span processed may not be the shallowest.
-    # Apply the best candidate (shortest ids_path) found across all spans in this batch.
-    for trace_id, (_, best_name) in _trace_name_candidates.items():
-        if trace_id in traces:
-            traces[trace_id]["name"] = best_name
-
-    # Update trace records with user_id/session_id collected from child spans (in
-    # case child spans with these attrs came after the root span was processed).
-    for trace_id, attrs in trace_attrs.items():
-        if trace_id in traces:
-            if attrs["user_id"] and not traces[trace_id].get("user_id"):
-                traces[trace_id]["user_id"] = attrs["user_id"]
-            if attrs["session_id"] and not traces[trace_id].get("session_id"):
-                traces[trace_id]["session_id"] = attrs["session_id"]
-
-    # Git repo/ref are stamped on every SDK span, but the root span often arrives
-    # last in live streaming. Promote the first child values so repo/ref are visible
-    # while the trace is still running, then let root values overwrite when present.
-    for trace_id, attrs in trace_git_attrs.items():
-        if trace_id in traces:
-            if attrs["git_ref"] is not None:
-                traces[trace_id]["git_ref"] = attrs["git_ref"]
-            if attrs["git_repo"] is not None:
-                traces[trace_id]["git_repo"] = attrs["git_repo"]
+                        trace_record["output"] = span_record["output"]
+
+    # Finalize every trace record in one pass, binding each record once instead of
+    # re-resolving it per accumulator. Every span that creates a trace record also
+    # populates all three accumulators for its trace_id, so they can be indexed.
+    for trace_id, trace_record in traces.items():
+        # Correct eager trace names: the first span processed may not be the
+        # shallowest. Apply the best candidate (shortest ids_path) in this batch.
+        trace_record["name"] = _trace_name_candidates[trace_id][1]
+
+        # Update with user_id/session_id collected from child spans (in case child
+        # spans with these attrs came after the root span was processed).
+        ids_attrs = trace_attrs[trace_id]
+        if ids_attrs["user_id"] and not trace_record.get("user_id"):
+            trace_record["user_id"] = ids_attrs["user_id"]
+        if ids_attrs["session_id"] and not trace_record.get("session_id"):
+            trace_record["session_id"] = ids_attrs["session_id"]
+
+        # Git repo/ref are stamped on every SDK span, but the root span often arrives
+        # last in live streaming. Promote the first child values so repo/ref are
+        # visible while the trace is still running, then let root values overwrite
+        # when present.
+        git_attrs = trace_git_attrs[trace_id]
+        if git_attrs["git_ref"] is not None:
+            trace_record["git_ref"] = git_attrs["git_ref"]
+        if git_attrs["git_repo"] is not None:
+            trace_record["git_repo"] = git_attrs["git_repo"]
 
     return list(traces.values()), spans
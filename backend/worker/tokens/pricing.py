@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from decimal import Decimal
 
 import psycopg2
@@ -27,6 +28,23 @@ logger = logging.getLogger(__name__)
 
 _cache: list[dict] | None = None
 
+# Resolved price per model string, so the exact-then-regex scan below runs once
+# per distinct model rather than once per span. Tied to the price list it was
+# built from (identity), so a reload starts a fresh memo. Model names come from
+# span attributes, hence the bound. Guarded by _model_price_lock: REST reads
+# price spans from threadpool threads.
+_MODEL_PRICE_MEMO_MAX = 1024
+_model_price_lock = threading.Lock()
+_model_price_memo: dict[str, dict[str, float] | None] = {}
+_model_price_memo_source: list[dict] | None = None
+
+# Lookup tables derived from that same price list, built once per load rather
+# than rescanned per miss: exact model_name -> prices, and the match patterns
+# precompiled in list order. Built off to the side and swapped in as one tuple
+# under _model_price_lock, so a lookup never sees half of a reindex.
+_PriceIndex = tuple[dict[str, dict[str, float]], list[tuple[re.Pattern[str], dict[str, float]]]]
+_price_index: _PriceIndex = ({}, [])
+
 
 def _load_cache() -> list[dict]:
     global _cache
@@ -87,20 +105,53 @@ def get_model_price(model: str) -> dict[str, float] | None:
     Returns dict with keys like ``input``, ``output``, ``cacheRead``, ``cacheWrite``
     (values in USD per token), or None if not found.
     """
+    global _model_price_memo_source, _price_index
     cache = _load_cache()
-
-    # Exact match on model_name
-    for entry in cache:
-        if entry["model_name"] == model:
-            return entry["prices"]
-
-    # Regex fallback using match_pattern
+    if not cache:
+        # Prices unavailable (DB down) — nothing to memoize; retry next call.
+        return None
+    with _model_price_lock:
+        if cache is not _model_price_memo_source:
+            _model_price_memo.clear()
+            _price_index = _index_price_list(cache)
+            _model_price_memo_source = cache
+        if model in _model_price_memo:
+            return _model_price_memo[model]
+
+        prices = _match_model_price(model)
+        if len(_model_price_memo) >= _MODEL_PRICE_MEMO_MAX:
+            _model_price_memo.pop(next(iter(_model_price_memo)))
+        _model_price_memo[model] = prices
+    return prices
+
+
+def _index_price_list(cache: list[dict]) -> _PriceIndex:
+    """Build the exact-name and compiled-pattern tables from ``cache``.
+
+    The first entry wins for a repeated name, matching the list-order scan; an
+    invalid pattern is skipped once here instead of failing on every lookup.
+    """
+    exact: dict[str, dict[str, float]] = {}
+    patterns: list[tuple[re.Pattern[str], dict[str, float]]] = []
     for entry in cache:
+        exact.setdefault(entry["model_name"], entry["prices"])
         try:
-            if re.search(entry["match_pattern"], model, re.IGNORECASE):
-                return entry["prices"]
+            patterns.append((re.compile(entry["match_pattern"], re.IGNORECASE), entry["prices"]))
         except re.error:
             continue
+    return exact, patterns
+
+
+def _match_model_price(model: str) -> dict[str, float] | None:
+    """Resolve ``model`` against the indexed price list: exact name first, then regex."""
+    exact, patterns = _price_index
+    prices = exact.get(model)
+    if prices is not None:
+        return prices
+
+    for pattern, prices in patterns:
+        if pattern.search(model):
+            return prices
 
     return None
 
@@ -1,5 +1,7 @@
 """Token counting for different model providers."""
 
+import functools
+
 import tiktoken
 
 from .types import is_claude_model
@@ -22,9 +24,18 @@ def count_tokens(text: str | None, model: str) -> int:
         return len(text) // CLAUDE_CHARS_PER_TOKEN
 
     # OpenAI or unknown - use tiktoken
+    return len(_encoding_for(model).encode(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _encoding_for(model: str) -> tiktoken.Encoding:
+    """Resolve the tiktoken encoding for ``model``, falling back to cl100k_base.
+
+    A batch repeats the same few model names across its spans, so the name
+    lookup (and the KeyError raised for every unknown model) runs once per name
+    rather than once per span.
+    """
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(encoding.encode(text))
+        return tiktoken.get_encoding("cl100k_base")
@@ -4,7 +4,7 @@ import type { Span } from "@/types/api";
 import type { SpanTreeRow } from "../types";
 import { buildSpanTree } from "../utils";
 import { flattenTreeWithMetrics } from "../utils/timeline";
-import { getVisibleSpanRows, buildTreeRows } from "./SpanTreeView";
+import { getVisibleSpanRows, buildTreeRows, buildRowIndexBySpanId } from "./SpanTreeView";
 
 // Minimal span factory — only fields relevant to the tree row model.
 function makeSpan(overrides: Partial<Span> & { span_id: string }): Span {
@@ -110,16 +110,16 @@ describe("buildTreeRows", () => {
   it("locates a span's virtualizer index past the trace-root offset", () => {
     const { spanById, rows } = makeTree();
     const treeRows = buildTreeRows(rows, spanById, new Set());
-    // scrollToSpan uses exactly this findIndex; "a" sits at [trace, root, a, ...]
-    const index = treeRows.findIndex((r) => r.type === "span" && r.row.span.span_id === "a");
-    expect(index).toBe(2);
+    // scrollToSpan reads exactly this index; "a" sits at [trace, root, a, ...]
+    const index = buildRowIndexBySpanId(treeRows);
+    expect(index.get("a")).toBe(2);
+    expect(index.size).toBe(treeRows.length - 1);
   });
 
-  it("returns -1 for a span hidden under a collapsed ancestor", () => {
+  it("has no index for a span hidden under a collapsed ancestor", () => {
     const { spanById, rows } = makeTree();
     const treeRows = buildTreeRows(rows, spanById, new Set(["a"]));
-    const index = treeRows.findIndex((r) => r.type === "span" && r.row.span.span_id === "a1");
-    expect(index).toBe(-1);
+    expect(buildRowIndexBySpanId(treeRows).get("a1")).toBeUndefined();
   });
 });
 
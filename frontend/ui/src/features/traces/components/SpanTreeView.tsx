@@ -86,6 +86,19 @@ export function buildTreeRows(
   ];
 }
 
+/**
+ * Maps each visible span id to its index in the virtualized row model, so
+ * scroll-to-selected is a single lookup instead of a scan over every row.
+ * Spans hidden under a collapsed ancestor have no entry.
+ */
+export function buildRowIndexBySpanId(rows: TreeRow[]): Map<string, number> {
+  const index = new Map<string, number>();
+  rows.forEach((r, i) => {
+    if (r.type === "span") index.set(r.row.span.span_id, i);
+  });
+  return index;
+}
+
 interface SpanTreeViewProps {
   trace: TraceDetail;
   selection: TraceSelection;
@@ -208,6 +221,7 @@ export const SpanTreeView = forwardRef<SpanTreeViewHandle, SpanTreeViewProps>(fu
     () => buildTreeRows(spanRows, spanById, collapsedIds),
     [spanRows, spanById, collapsedIds],
   );
+  const rowIndexBySpanId = useMemo(() => buildRowIndexBySpanId(allRows), [allRows]);
 
   const rowVirtualizer = useVirtualizer({
     count: allRows.length,
@@ -223,11 +237,11 @@ export const SpanTreeView = forwardRef<SpanTreeViewHandle, SpanTreeViewProps>(fu
     ref,
     () => ({
       scrollToSpan: (spanId: string) => {
-        const index = allRows.findIndex((r) => r.type === "span" && r.row.span.span_id === spanId);
-        if (index !== -1) rowVirtualizer.scrollToIndex(index, { align: "center" });
+        const index = rowIndexBySpanId.get(spanId);
+        if (index !== undefined) rowVirtualizer.scrollToIndex(index, { align: "center" });
       },
     }),
-    [allRows, rowVirtualizer],
+    [rowIndexBySpanId, rowVirtualizer],
   );
 
   return (
@@ -4,7 +4,7 @@ import { describe, it, expect, vi, beforeEach } from "vitest";
 const mockFetch = vi.fn();
 vi.stubGlobal("fetch", mockFetch);
 
-import { writeDetectorRun, writeDetectorFinding } from "../clickhouse-writer.js";
+import { writeDetectorRun, writeDetectorRuns, writeDetectorFinding } from "../clickhouse-writer.js";
 
 describe("writeDetectorRun", () => {
   beforeEach(() => vi.clearAllMocks());
@@ -97,6 +97,31 @@ describe("writeDetectorRun", () => {
   });
 });
 
+describe("writeDetectorRuns", () => {
+  beforeEach(() => vi.clearAllMocks());
+
+  it("posts every run in one request to the batch endpoint", async () => {
+    mockFetch.mockResolvedValueOnce({ ok: true });
+
+    const run = { projectId: "p", traceId: "t", findingId: "f", status: "completed" as const };
+    await writeDetectorRuns([
+      { ...run, runId: "r1", detectorId: "d1" },
+      { ...run, runId: "r2", detectorId: "d2" },
+    ]);
+
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+    expect(mockFetch.mock.calls[0][0]).toContain("/api/v1/internal/detector-runs/batch");
+    const body = JSON.parse(mockFetch.mock.calls[0][1].body);
+    expect(body.runs.map((r: { runId: string }) => r.runId)).toEqual(["r1", "r2"]);
+  });
+
+  it("skips the request for an empty batch", async () => {
+    await writeDetectorRuns([]);
+
+    expect(mockFetch).not.toHaveBeenCalled();
+  });
+});
+
 describe("writeDetectorFinding", () => {
   beforeEach(() => vi.clearAllMocks());
 
@@ -23,7 +23,7 @@ async function internalPost(path: string, body: unknown): Promise<void> {
   }
 }
 
-export async function writeDetectorRun(params: {
+export type DetectorRunWrite = {
   runId: string;
   detectorId: string;
   projectId: string;
@@ -39,10 +39,21 @@ export async function writeDetectorRun(params: {
   // default to now64(3). Set for triggered runs so the digest window count
   // shares the clock that keys the flush.
   timestampMs?: number;
-}): Promise<void> {
+};
+
+export async function writeDetectorRun(params: DetectorRunWrite): Promise<void> {
   await internalPost("/api/v1/internal/detector-runs", params);
 }
 
+/**
+ * Write several runs in one request (and one ClickHouse INSERT) rather than
+ * one round-trip per run. All-or-nothing: a failure rejects for every run.
+ */
+export async function writeDetectorRuns(runs: DetectorRunWrite[]): Promise<void> {
+  if (runs.length === 0) return;
+  await internalPost("/api/v1/internal/detector-runs/batch", { runs });
+}
+
 export async function writeDetectorFinding(params: {
   findingId: string;
   projectId: string;
@@ -131,4 +131,30 @@ describe("runBillingJob usage-quota notification wiring", () => {
     expect(logged.some((m) => m.includes("Error processing workspace"))).toBe(false);
     errorSpy.mockRestore();
   });
+
+  it("does not hold later workspaces behind a slow one", async () => {
+    mocks.workspaceFindMany.mockResolvedValue([
+      workspace({ id: "ws-slow" }),
+      workspace({ id: "ws-fast" }),
+    ]);
+    let releaseSlow!: () => void;
+    mocks.getWorkspaceUsageDetails.mockImplementationOnce(
+      () =>
+        new Promise((resolve) => {
+          releaseSlow = () => resolve({ traces: 1, spans: 1, detectorRuns: 0 });
+        }),
+    );
+
+    const job = runBillingJob();
+    // ws-fast is billed while ws-slow's usage read is still outstanding
+    await vi.waitFor(() =>
+      expect(mocks.workspaceUpdate).toHaveBeenCalledWith(
+        expect.objectContaining({ where: { id: "ws-fast" } }),
+      ),
+    );
+    releaseSlow();
+    await job;
+
+    expect(mocks.workspaceUpdate).toHaveBeenCalledTimes(2);
+  });
 });
@@ -33,6 +33,11 @@ import {
 import { getWorkspaceUsageDetails } from "./clickhouse.js";
 import { runUsageQuotaNotifications } from "./usageNotifications.js";
 
+// Workspaces processed at once by the hourly job. Each workspace already fans out
+// several Postgres/ClickHouse reads in parallel, so a small pool keeps the job
+// inside the database connection limits while no slow workspace holds up the rest.
+const BILLING_WORKSPACE_CONCURRENCY = 4;
+
 let stripe: Stripe | null = null;
 
 function getStripe(): Stripe {
@@ -66,6 +71,11 @@ export async function runBillingJob(): Promise<void> {
 
     const now = new Date();
     const allTimeStart = new Date(0);
+    // Calendar-month fallback for paid workspaces with no Stripe billing period.
+    // The job runs against a single `now`, so the bounds are built once here
+    // rather than re-derived per workspace.
+    const monthStart = new Date(now.getFullYear(), now.getMonth(), 1);
+    const monthEnd = new Date(now.getFullYear(), now.getMonth() + 1, 1);
 
     let stripeClient: Stripe | null = null;
     try {
@@ -74,17 +84,28 @@ export async function runBillingJob(): Promise<void> {
       console.warn("[Billing] Stripe not configured, skipping Stripe updates");
     }
 
-    for (const workspace of workspaces) {
-      try {
-        await processWorkspace(workspace, {
-          now,
-          allTimeStart,
-          stripeClient,
-        });
-      } catch (error) {
-        console.error(`[Billing] Error processing workspace ${workspace.id}:`, error);
+    // A fixed pool of runners pulls the next workspace as soon as it finishes
+    // one, rather than processing the list strictly one at a time.
+    let next = 0;
+    const runner = async () => {
+      while (next < workspaces.length) {
+        const workspace = workspaces[next++];
+        try {
+          await processWorkspace(workspace, {
+            now,
+            allTimeStart,
+            monthStart,
+            monthEnd,
+            stripeClient,
+          });
+        } catch (error) {
+          console.error(`[Billing] Error processing workspace ${workspace.id}:`, error);
+        }
       }
-    }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(BILLING_WORKSPACE_CONCURRENCY, workspaces.length) }, runner),
+    );
 
     console.log("[Billing] Job completed successfully");
   } catch (error) {
@@ -112,6 +133,8 @@ async function processWorkspace(
   ctx: {
     now: Date;
     allTimeStart: Date;
+    monthStart: Date;
+    monthEnd: Date;
     stripeClient: Stripe | null;
   },
 ): Promise<void> {
@@ -140,8 +163,8 @@ async function processWorkspace(
       end = workspace.billingPeriodEnd;
     } else {
       // Fallback to calendar month if no billing period set
-      start = new Date(ctx.now.getFullYear(), ctx.now.getMonth(), 1);
-      end = new Date(ctx.now.getFullYear(), ctx.now.getMonth() + 1, 1);
+      start = ctx.monthStart;
+      end = ctx.monthEnd;
     }
 
     usage = await getWorkspaceUsageDetails({
@@ -158,10 +181,8 @@ async function processWorkspace(
   // =========================================================================
   const aiPeriodStart = isFreePlan
     ? ctx.allTimeStart
-    : (workspace.billingPeriodStart ?? new Date(ctx.now.getFullYear(), ctx.now.getMonth(), 1));
-  const aiPeriodEnd = isFreePlan
-    ? ctx.now
-    : (workspace.billingPeriodEnd ?? new Date(ctx.now.getFullYear(), ctx.now.getMonth() + 1, 1));
+    : (workspace.billingPeriodStart ?? ctx.monthStart);
+  const aiPeriodEnd = isFreePlan ? ctx.now : (workspace.billingPeriodEnd ?? ctx.monthEnd);
 
   // =========================================================================
   // 2a-2d. Aggregate aIMessage rows by kind for billing + usage display.
@@ -488,7 +488,6 @@ describe("processRcaJob", () => {
     } as any);
     vi.spyOn(p.detectorRca, "upsert").mockResolvedValue({} as any);
     vi.spyOn(p.detectorRca, "update").mockResolvedValue({} as any);
-    vi.spyOn(p.gitHubInstallation, "count").mockResolvedValue(0);
 
     const projectFindUnique = vi.spyOn(p.project, "findUnique").mockResolvedValue({
       rcaModel: "gpt-5.3",
@@ -520,6 +519,43 @@ describe("processRcaJob", () => {
     );
   });
 
+  it("takes the GitHub installation count from the project read", async () => {
+    const { prisma: p } = await import("@traceroot/core");
+    vi.spyOn(p.workspace, "findUnique").mockResolvedValue({
+      billingPlan: "pro",
+      rcaBlocked: false,
+    } as any);
+    vi.spyOn(p.detectorRca, "upsert").mockResolvedValue({} as any);
+    vi.spyOn(p.detectorRca, "update").mockResolvedValue({} as any);
+    const ghCount = vi.spyOn(p.gitHubInstallation, "count");
+    vi.spyOn(p.project, "findUnique").mockResolvedValue({
+      rcaModel: null,
+      rcaProvider: null,
+      rcaSource: null,
+      alertConfig: null,
+      workspace: { _count: { githubInstallations: 2 } },
+    } as any);
+
+    mockFetch
+      .mockResolvedValueOnce({ ok: true, json: async () => ({ id: "s1" }) })
+      .mockResolvedValueOnce(sseBody([textDeltaFrame]));
+
+    const { processRcaJob } = await import("../detector-rca-processor.js");
+    await processRcaJob({
+      data: {
+        findingId: "f1",
+        projectId: "p1",
+        traceId: "t1",
+        workspaceId: "ws1",
+        findings: [{ detectorName: "d1", summary: "s1", detectorId: "did1" }],
+      },
+    } as any);
+
+    expect(ghCount).not.toHaveBeenCalled();
+    const [, agentInit] = mockFetch.mock.calls.at(-1)!;
+    expect(String(agentInit.body)).toContain("git_source_file");
+  });
+
   it("skips RCA when workspace is free plan and rcaBlocked", async () => {
     const { prisma: p } = await import("@traceroot/core");
     vi.spyOn(p.workspace, "findUnique").mockResolvedValue({
@@ -595,7 +631,6 @@ describe("processRcaJob", () => {
     } as any);
     vi.spyOn(p.detectorRca, "upsert").mockResolvedValue({} as any);
     const detectorRcaUpdate = vi.spyOn(p.detectorRca, "update").mockResolvedValue({} as any);
-    vi.spyOn(p.gitHubInstallation, "count").mockResolvedValue(0);
     vi.spyOn(p.project, "findUnique").mockResolvedValue({
       rcaModel: null,
       rcaProvider: null,
@@ -653,7 +688,6 @@ describe("processRcaJob — digest scheduling at the flush seam", () => {
     } as any);
     vi.spyOn(p.detectorRca, "upsert").mockResolvedValue({} as any);
     vi.spyOn(p.detectorRca, "update").mockResolvedValue({} as any);
-    vi.spyOn(p.gitHubInstallation, "count").mockResolvedValue(0);
     vi.spyOn(p.project, "findUnique").mockResolvedValue({
       rcaModel: null,
       rcaProvider: null,
@@ -728,7 +762,6 @@ describe("processRcaJob — digest scheduling at the flush seam", () => {
     } as any);
     vi.spyOn(p.detectorRca, "upsert").mockResolvedValue({} as any);
     const updateSpy = vi.spyOn(p.detectorRca, "update").mockResolvedValue({} as any);
-    vi.spyOn(p.gitHubInstallation, "count").mockResolvedValue(0);
     vi.spyOn(p.project, "findUnique").mockResolvedValue({
       rcaModel: null,
       rcaProvider: null,
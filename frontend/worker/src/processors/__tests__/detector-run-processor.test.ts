@@ -7,6 +7,7 @@ const EVALUATOR_DELAY = 60_000;
 const {
   mockRunDetection,
   mockWriteRun,
+  mockWriteRuns,
   mockWriteFinding,
   mockQueueAdd,
   mockPrisma,
@@ -15,6 +16,7 @@ const {
 } = vi.hoisted(() => ({
   mockRunDetection: vi.fn(),
   mockWriteRun: vi.fn(),
+  mockWriteRuns: vi.fn(),
   mockWriteFinding: vi.fn(),
   mockQueueAdd: vi.fn(),
   mockCalculateCost: vi.fn(),
@@ -51,6 +53,7 @@ vi.mock("../../queues/detector-run-queue.js", () => ({
 vi.mock("../../detection/sandbox-eval.js", () => ({ runDetectionForTrace: mockRunDetection }));
 vi.mock("../../detection/clickhouse-writer.js", () => ({
   writeDetectorRun: mockWriteRun,
+  writeDetectorRuns: mockWriteRuns,
   writeDetectorFinding: mockWriteFinding,
 }));
 vi.mock("../../detection/self-trace-emitter.js", () => ({
@@ -96,6 +99,7 @@ beforeEach(() => {
   // The production code chains `.catch` on these side-effects, so the mocks
   // must return resolved promises rather than the default `undefined`.
   mockWriteRun.mockResolvedValue(undefined);
+  mockWriteRuns.mockResolvedValue(undefined);
   mockWriteFinding.mockResolvedValue(undefined);
   mockQueueAdd.mockResolvedValue(undefined);
   mockCalculateCost.mockResolvedValue(0);
@@ -199,7 +203,7 @@ describe("processTrace — finding + RCA", () => {
     expect(mockWriteFinding).toHaveBeenCalledTimes(1);
     // never passes a `retracted` flag anymore
     expect(mockWriteFinding.mock.calls[0][0]).not.toHaveProperty("retracted");
-    expect(mockWriteRun).toHaveBeenCalled();
+    expect(mockWriteRuns).toHaveBeenCalledTimes(1); // every triggered run, one batch
     expect(mockQueueAdd).toHaveBeenCalledTimes(1); // one RCA job
 
     // The finding row, its triggered run, and the RCA job that keys the digest
@@ -207,7 +211,7 @@ describe("processTrace — finding + RCA", () => {
     // matches the window the key selects (no clock-boundary skew).
     const ts = mockWriteFinding.mock.calls[0][0].timestampMs;
     expect(typeof ts).toBe("number");
-    expect(mockWriteRun.mock.calls[0][0].timestampMs).toBe(ts);
+    expect(mockWriteRuns.mock.calls[0][0][0].timestampMs).toBe(ts);
     expect(mockQueueAdd.mock.calls[0][1].findingTimestamp).toBe(ts);
   });
 
@@ -354,6 +358,47 @@ describe("processTrace — finding + RCA", () => {
 
     expect(mockPrisma.aIMessage.createMany).not.toHaveBeenCalled();
   });
+
+  it("writes the finding without waiting on the usage rows", async () => {
+    mockFetches(60_000, '{"span":1}\n');
+    mockPrisma.detector.findMany.mockResolvedValue([
+      {
+        id: "d1",
+        name: "Slow",
+        prompt: "p",
+        outputSchema: [],
+        detectionModel: null,
+        detectionProvider: null,
+        detectionSource: "system",
+        enableRca: false,
+      },
+    ]);
+    mockRunDetection.mockResolvedValue({
+      identified: true,
+      summary: "found it",
+      data: {},
+      inferenceCost: 0.01,
+      inferenceInputTokens: 10,
+      inferenceOutputTokens: 5,
+      inferenceSource: "system",
+      inferenceModel: "m",
+      inferenceProvider: "anthropic",
+    });
+    let releaseUsage!: () => void;
+    mockPrisma.aIMessage.createMany.mockReturnValue(
+      new Promise<void>((resolve) => {
+        releaseUsage = resolve;
+      }),
+    );
+
+    const done = processTrace("t1", "p1", ["d1"]);
+
+    // The usage insert is still pending, yet the finding and runs go out.
+    await vi.waitFor(() => expect(mockWriteRuns).toHaveBeenCalledTimes(1));
+    expect(mockWriteFinding).toHaveBeenCalledTimes(1);
+    releaseUsage();
+    await done;
+  });
 });
 
 describe("processTrace — self-trace emission", () => {
@@ -434,7 +479,7 @@ describe("processTrace — self-trace emission", () => {
 
     await processTrace("t1", "p1", ["d1"]);
 
-    const runWrites = mockWriteRun.mock.calls.map((c) => c[0]);
+    const runWrites = mockWriteRuns.mock.calls.flatMap((c) => c[0]);
     const triggeredWrite = runWrites.find((w) => w.findingId !== null);
     expect(triggeredWrite?.selfTraced).toBe(true);
   });
@@ -467,8 +512,8 @@ describe("processTrace — self-trace emission", () => {
     await processTrace("t1", "p1", ["d1"]);
 
     expect(mockWithSelfTrace).not.toHaveBeenCalled();
-    expect(mockWriteRun).toHaveBeenCalledWith(
+    expect(mockWriteRuns).toHaveBeenCalledWith([
       expect.not.objectContaining({ selfTraced: expect.anything() }),
-    );
+    ]);
   });
 });
@@ -364,9 +364,10 @@ export async function processRcaJob(job: Job<DetectorRcaJob>) {
   };
 
   try {
-    // Pull project-scoped rca_model and alert recipients in one read.
-    // Inside the try so a Prisma failure routes through the catch's
-    // failure-state + fallback-alert handling.
+    // Pull project-scoped rca_model, alert window and the workspace's GitHub
+    // installation count in one read rather than a project read followed by a
+    // separate count. Inside the try so a Prisma failure routes through the
+    // catch's failure-state + fallback-alert handling.
     const project = await prisma.project.findUnique({
       where: { id: projectId },
       select: {
@@ -374,16 +375,14 @@ export async function processRcaJob(job: Job<DetectorRcaJob>) {
         rcaProvider: true,
         rcaSource: true,
         alertConfig: { select: { alertWindow: true } },
+        workspace: { select: { _count: { select: { githubInstallations: true } } } },
       },
     });
     alertWindow = project?.alertConfig?.alertWindow ?? DEFAULT_ALERT_WINDOW;
 
     // Workspace-level GitHub installations now drive the GitHub tool.
     // Any installation in this workspace is enough to flip the tool on.
-    const ghCount = await prisma.gitHubInstallation.count({
-      where: { workspaceId },
-    });
-    const hasGitHub = ghCount > 0;
+    const hasGitHub = (project?.workspace?._count.githubInstallations ?? 0) > 0;
 
     const { result: rcaResult } = await runRcaSession({
       findingId,
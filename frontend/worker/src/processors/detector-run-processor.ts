@@ -13,7 +13,11 @@ import {
   createRedisConnection,
 } from "../queues/detector-run-queue.js";
 import { runDetectionForTrace } from "../detection/sandbox-eval.js";
-import { writeDetectorRun, writeDetectorFinding } from "../detection/clickhouse-writer.js";
+import {
+  writeDetectorRun,
+  writeDetectorRuns,
+  writeDetectorFinding,
+} from "../detection/clickhouse-writer.js";
 import { withSelfTrace } from "../detection/self-trace-emitter.js";
 import { boundedJson } from "../detection/traced-complete.js";
 
@@ -300,10 +304,8 @@ async function runSingleDetector(params: {
   }
 
   // Triggered — return result without writing anything.
-  // flushTrace will generate the shared finding_id, write the finding, then write this run.
-  console.log(
-    `[Detector] Detector ${detector.name} triggered on trace ${traceId}: ${result.summary.slice(0, 80)}`,
-  );
+  // flushTrace will generate the shared finding_id, write the finding, then write this run,
+  // and logs the triggered detectors once for the trace.
   return {
     triggered: {
       detectorId: detector.id,
@@ -328,18 +330,16 @@ export async function processTrace(
     spansJsonl = await downloadSpansJsonl(projectId, traceId);
   } catch (e) {
     console.error(`[Detector] Failed to download spans for trace ${traceId}:`, e);
-    await Promise.allSettled(
-      detectorIds.map((detectorId) =>
-        writeDetectorRun({
-          runId: deterministicRunId(projectId, traceId, detectorId),
-          detectorId,
-          projectId,
-          traceId,
-          findingId: null,
-          status: "failed",
-        }).catch((err) => console.error("[Detector] Failed to write run:", err)),
-      ),
-    );
+    await writeDetectorRuns(
+      detectorIds.map((detectorId) => ({
+        runId: deterministicRunId(projectId, traceId, detectorId),
+        detectorId,
+        projectId,
+        traceId,
+        findingId: null,
+        status: "failed" as const,
+      })),
+    ).catch((err) => console.error("[Detector] Failed to write runs:", err));
     return;
   }
 
@@ -410,9 +410,24 @@ async function evaluateTrace(
     .filter((r): r is PromiseFulfilledResult<SingleDetectorOutcome> => r.status === "fulfilled")
     .map((r) => r.value);
 
-  // Persist one AIMessage row per scan with kind="detector". This is the
-  // source of truth for detector by-model + cost aggregations in the hourly
-  // billing cron — same role aIMessage plays for chat + RCA.
+  // The usage rows and the finding/run/RCA writes are independent, so they go
+  // out together instead of back to back.
+  await Promise.all([
+    recordScanUsage(workspaceId, traceId, fulfilled),
+    flushTrace(traceId, projectId, workspaceId, detectors, fulfilled),
+  ]);
+}
+
+/**
+ * Persist one AIMessage row per scan with kind="detector". This is the source
+ * of truth for detector by-model + cost aggregations in the hourly billing
+ * cron — same role aIMessage plays for chat + RCA.
+ */
+async function recordScanUsage(
+  workspaceId: string,
+  traceId: string,
+  fulfilled: SingleDetectorOutcome[],
+): Promise<void> {
   const usages = fulfilled
     .map((o) => o.usage)
     .filter((u): u is ScanUsage => u !== null && u.inferenceModel !== null);
@@ -438,7 +453,19 @@ async function evaluateTrace(
       console.error(`[Detector] Failed to write aIMessage rows for trace ${traceId}:`, err);
     }
   }
+}
 
+/**
+ * Write the trace's single finding, point every triggered run at it, and seed
+ * the shared RCA. A no-op when no detector triggered.
+ */
+async function flushTrace(
+  traceId: string,
+  projectId: string,
+  workspaceId: string,
+  detectors: { id: string; enableRca: boolean }[],
+  fulfilled: SingleDetectorOutcome[],
+): Promise<void> {
   const triggered = fulfilled
     .map((o) => o.triggered)
     .filter((t): t is TriggeredResult => t !== null);
@@ -480,24 +507,23 @@ async function evaluateTrace(
 
   // Write runs for all triggered detectors, all pointing to the same finding_id
   // and stamped with the shared findingTimestamp so the digest count window
-  // matches the flush key.
-  await Promise.allSettled(
-    triggered.map((r) =>
-      writeDetectorRun({
-        runId: deterministicRunId(projectId, traceId, r.detectorId),
-        detectorId: r.detectorId,
-        projectId,
-        traceId,
-        findingId,
-        status: "completed",
-        timestampMs: findingTimestamp,
-        selfTraced: r.selfTraced,
-      }).catch((err) => console.error("[Detector] Failed to write run:", err)),
-    ),
-  );
+  // matches the flush key. One batch request: a single INSERT on the backend.
+  await writeDetectorRuns(
+    triggered.map((r) => ({
+      runId: deterministicRunId(projectId, traceId, r.detectorId),
+      detectorId: r.detectorId,
+      projectId,
+      traceId,
+      findingId,
+      status: "completed" as const,
+      timestampMs: findingTimestamp,
+      selfTraced: r.selfTraced,
+    })),
+  ).catch((err) => console.error("[Detector] Failed to write runs:", err));
 
   console.log(
-    `[Detector] Finding ${findingId} created for trace ${traceId} (${triggered.length} detector(s) triggered)`,
+    `[Detector] Finding ${findingId} created for trace ${traceId} ` +
+      `(${triggered.length} detector(s) triggered: ${triggered.map((r) => r.detectorName).join(", ")})`,
   );
 
   // RCA is shared per trace. Run it only when at least one triggered detector
@@ -30,12 +30,21 @@ def pytest_configure(config):
 def _reset_singletons(monkeypatch):
     """Reset module-level singleton instances between tests.
 
-    Prevents test pollution from cached ClickHouse/S3 clients.
+    Prevents test pollution from cached ClickHouse/S3 clients and auth lookups.
     """
     import db.clickhouse.client as ch_mod
+    import rest.routers.deps as deps_mod
+    import rest.routers.public.deps as public_deps_mod
     import rest.services.s3 as s3_mod
     import rest.services.trace_reader as tr_mod
+    import rest.ui_client as ui_client_mod
+    import worker.detector_tasks as detector_tasks_mod
+    from rest.auth_cache import AuthCache
 
     monkeypatch.setattr(ch_mod, "_client", None)
     monkeypatch.setattr(s3_mod, "_s3_service", None)
     monkeypatch.setattr(tr_mod, "_service", None)
+    monkeypatch.setattr(ui_client_mod, "_client", None)
+    monkeypatch.setattr(detector_tasks_mod, "_redis_client", None)
+    monkeypatch.setattr(deps_mod, "_project_access_cache", AuthCache())
+    monkeypatch.setattr(public_deps_mod, "_api_key_cache", AuthCache())
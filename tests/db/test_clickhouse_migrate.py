@@ -59,6 +59,30 @@ def test_resolve_pressly_goose_prefers_valid_binary(monkeypatch, tmp_path):
     assert migrate.resolve_pressly_goose() == str(valid)
 
 
+def test_run_goose_shares_one_environment_snapshot(monkeypatch, tmp_path):
+    goose = tmp_path / "goose"
+    goose.write_text("stub", encoding="utf-8")
+    seen_envs: list[dict] = []
+
+    def fake_candidates(env):
+        seen_envs.append(env)
+        return [goose]
+
+    def fake_run(command, **kwargs):
+        seen_envs.append(kwargs["env"])
+        return CompletedProcess(command, 0, stdout="GOOSE_DRIVER", stderr="")
+
+    monkeypatch.setattr(migrate, "_goose_candidates", fake_candidates)
+    monkeypatch.setattr(migrate, "_run_command", fake_run)
+
+    migrate.run_goose("status", env={"CLICKHOUSE_HOST": "ch"})
+
+    # PATH lookup, the --help probe, and the goose run all see the same merged dict.
+    assert len(seen_envs) == 3
+    assert all(env is seen_envs[0] for env in seen_envs)
+    assert seen_envs[0]["CLICKHOUSE_HOST"] == "ch"
+
+
 def test_is_pressly_goose_returns_false_for_non_executable_candidate(monkeypatch, tmp_path):
     invalid = tmp_path / "goose"
     invalid.write_text("stub", encoding="utf-8")
@@ -6,7 +6,8 @@ Tests row construction without a real ClickHouse connection.
 from datetime import datetime
 from unittest.mock import MagicMock
 
-from db.clickhouse.client import ClickHouseClient
+from db.clickhouse.client import QUERY_FANOUT_WORKERS, ClickHouseClient, get_query_executor
+from shared.config import settings
 
 
 class TestInsertTracesBatch:
@@ -235,3 +236,23 @@ class TestInsertSpansBatch:
         assert rows[0][source_idx] == "detector"
         assert rows[1][source_idx] == "user"
         assert all(len(row) == len(columns) for row in rows)
+
+
+class TestFromSettings:
+    def test_uses_dedicated_pool_sized_from_settings(self, monkeypatch):
+        get_client = MagicMock()
+        monkeypatch.setattr("db.clickhouse.client.clickhouse_connect.get_client", get_client)
+        monkeypatch.setattr(settings.clickhouse, "pool_size", 17)
+
+        ClickHouseClient.from_settings()
+
+        pool_mgr = get_client.call_args.kwargs["pool_mgr"]
+        assert pool_mgr.connection_pool_kw["maxsize"] == 17
+        assert get_client.call_args.kwargs["autogenerate_session_id"] is False
+
+
+class TestGetQueryExecutor:
+    def test_is_a_shared_bounded_singleton(self):
+        executor = get_query_executor()
+        assert get_query_executor() is executor
+        assert executor._max_workers == QUERY_FANOUT_WORKERS
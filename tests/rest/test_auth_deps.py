@@ -4,6 +4,10 @@ Tests authenticate_api_key (public API auth) and get_project_access (user auth)
 with mocked httpx calls.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
 
 import httpx
@@ -12,8 +16,11 @@ import respx
 from fastapi import HTTPException
 from httpx import Response
 
+import rest.routers.public.deps as public_deps
+from rest.auth_cache import AuthCache
 from rest.routers.deps import get_project_access
 from rest.routers.public.traces import AuthResult, authenticate_api_key
+from shared.config import settings
 
 BASE_URL = "http://localhost:3000"
 
@@ -302,3 +309,226 @@ class TestGetProjectAccess:
             await get_project_access("proj-123", "user-456")
         assert exc_info.value.status_code == 503
         assert exc_info.value.detail == "Authentication service error"
+
+
+# ── auth result cache ───────────────────────────────────────────────────
+
+
+class TestAuthCache:
+    @pytest.fixture(autouse=True)
+    def _cache_enabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "auth_cache_ttl_seconds", 30.0)
+
+    @respx.mock
+    async def test_api_key_success_is_cached(self):
+        route = respx.post(f"{BASE_URL}/api/internal/validate-api-key").mock(
+            return_value=Response(
+                200,
+                json={
+                    "valid": True,
+                    "projectId": "proj-123",
+                    "workspaceId": "ws-456",
+                    "billingPlan": "pro",
+                    "ingestionBlocked": False,
+                },
+            )
+        )
+        first = await authenticate_api_key("Bearer test-api-key")
+        second = await authenticate_api_key("Bearer test-api-key")
+        assert first == second
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_api_key_failure_is_not_cached(self):
+        route = respx.post(f"{BASE_URL}/api/internal/validate-api-key").mock(
+            return_value=Response(200, json={"valid": False})
+        )
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await authenticate_api_key("Bearer test-api-key")
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_concurrent_project_access_misses_coalesce(self):
+        route = respx.post(f"{BASE_URL}/api/internal/validate-project-access").mock(
+            return_value=Response(
+                200,
+                json={"hasAccess": True, "role": "ADMIN", "workspaceId": "ws-456"},
+            )
+        )
+        results = await asyncio.gather(
+            *(get_project_access("proj-123", "user-456") for _ in range(5))
+        )
+        assert {r.workspace_id for r in results} == {"ws-456"}
+        assert route.call_count == 1
+
+    async def test_lock_survives_the_handoff_to_a_queued_waiter(self):
+        cache: AuthCache[str] = AuthCache()
+        failed, finish = asyncio.Event(), asyncio.Event()
+        loads = 0
+
+        async def fail() -> str:
+            await failed.wait()
+            raise RuntimeError("upstream down")
+
+        async def load() -> str:
+            nonlocal loads
+            loads += 1
+            await finish.wait()
+            return "value"
+
+        first = asyncio.create_task(cache.get_or_load(("k",), fail))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(cache.get_or_load(("k",), load))
+        await asyncio.sleep(0)
+        failed.set()
+        with pytest.raises(RuntimeError):
+            await first
+
+        # Arrives while the queued waiter is loading: it must wait on the same
+        # lock and reuse that result, not start a second upstream call.
+        late = asyncio.create_task(cache.get_or_load(("k",), load))
+        await asyncio.sleep(0)
+        finish.set()
+        assert await asyncio.gather(queued, late) == ["value", "value"]
+        assert loads == 1
+        assert cache._locks == {}
+
+    @respx.mock
+    async def test_project_access_keyed_per_user(self):
+        route = respx.post(f"{BASE_URL}/api/internal/validate-project-access").mock(
+            return_value=Response(
+                200,
+                json={"hasAccess": True, "role": "ADMIN", "workspaceId": "ws-456"},
+            )
+        )
+        await get_project_access("proj-123", "user-1")
+        await get_project_access("proj-123", "user-2")
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_cached_project_access_is_immutable(self):
+        respx.post(f"{BASE_URL}/api/internal/validate-project-access").mock(
+            return_value=Response(
+                200,
+                json={"hasAccess": True, "role": "ADMIN", "workspaceId": "ws-456"},
+            )
+        )
+        access = await get_project_access("proj-123", "user-456")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            access.billing_plan = "enterprise"
+        assert (await get_project_access("proj-123", "user-456")).billing_plan == "free"
+
+    @respx.mock
+    async def test_ttl_zero_disables_cache(self, monkeypatch):
+        monkeypatch.setattr(settings, "auth_cache_ttl_seconds", 0)
+        route = respx.post(f"{BASE_URL}/api/internal/validate-project-access").mock(
+            return_value=Response(
+                200,
+                json={"hasAccess": True, "role": "ADMIN", "workspaceId": "ws-456"},
+            )
+        )
+        await get_project_access("proj-123", "user-456")
+        await get_project_access("proj-123", "user-456")
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_lookups_share_one_pooled_client(self):
+        from rest.ui_client import get_ui_client
+
+        respx.post(f"{BASE_URL}/api/internal/validate-project-access").mock(
+            return_value=Response(
+                200,
+                json={"hasAccess": True, "role": "ADMIN", "workspaceId": "ws-456"},
+            )
+        )
+        client = get_ui_client()
+        await get_project_access("proj-123", "user-1")
+        await get_project_access("proj-123", "user-2")
+        assert get_ui_client() is client
+        assert not client.is_closed
+
+    @respx.mock
+    async def test_api_key_is_sent_as_sha256(self):
+        route = respx.post(f"{BASE_URL}/api/internal/validate-api-key").mock(
+            return_value=Response(200, json={"valid": False})
+        )
+        with pytest.raises(HTTPException):
+            await authenticate_api_key("Bearer raw-key")
+
+        expected = hashlib.sha256(b"raw-key").hexdigest()
+        assert json.loads(route.calls[0].request.content) == {"keyHash": expected}
+
+
+class TestExportSlots:
+    @pytest.fixture(autouse=True)
+    def _fresh_slots(self, monkeypatch):
+        monkeypatch.setattr(public_deps, "_export_slots", {})
+        monkeypatch.setattr(settings, "max_concurrent_exports_per_workspace", 1)
+
+    @staticmethod
+    def _auth(workspace_id: str) -> AuthResult:
+        return AuthResult(
+            project_id="proj-123",
+            workspace_id=workspace_id,
+            billing_plan="pro",
+            ingestion_blocked=False,
+        )
+
+    async def test_full_workspace_waits_for_a_released_slot(self):
+        holder = public_deps.acquire_export_slot(self._auth("ws-1"))
+        await anext(holder)
+
+        waiter = public_deps.acquire_export_slot(self._auth("ws-1"))
+        pending = asyncio.ensure_future(anext(waiter))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        await holder.aclose()
+        assert (await asyncio.wait_for(pending, 1)).workspace_id == "ws-1"
+        await waiter.aclose()
+
+    async def test_workspaces_do_not_share_slots(self):
+        first = public_deps.acquire_export_slot(self._auth("ws-1"))
+        await anext(first)
+
+        other = public_deps.acquire_export_slot(self._auth("ws-2"))
+        assert (await asyncio.wait_for(anext(other), 1)).workspace_id == "ws-2"
+        await other.aclose()
+        await first.aclose()
+
+    async def test_slot_is_dropped_once_the_workspace_is_idle(self):
+        holder = public_deps.acquire_export_slot(self._auth("ws-1"))
+        await anext(holder)
+        waiter = public_deps.acquire_export_slot(self._auth("ws-1"))
+        pending = asyncio.ensure_future(anext(waiter))
+        await asyncio.sleep(0.01)
+
+        await holder.aclose()
+        await asyncio.wait_for(pending, 1)
+        assert "ws-1" in public_deps._export_slots
+
+        await waiter.aclose()
+        assert public_deps._export_slots == {}
+
+    async def test_wait_past_the_limit_is_rejected_with_429(self, monkeypatch):
+        monkeypatch.setattr(settings, "export_slot_wait_seconds", 0.01)
+        holder = public_deps.acquire_export_slot(self._auth("ws-1"))
+        await anext(holder)
+
+        waiter = public_deps.acquire_export_slot(self._auth("ws-1"))
+        with pytest.raises(HTTPException) as exc_info:
+            await anext(waiter)
+        assert exc_info.value.status_code == 429
+
+        await holder.aclose()
+        assert public_deps._export_slots == {}
+
+    async def test_zero_disables_the_cap(self, monkeypatch):
+        monkeypatch.setattr(settings, "max_concurrent_exports_per_workspace", 0)
+        holders = [public_deps.acquire_export_slot(self._auth("ws-1")) for _ in range(3)]
+        for holder in holders:
+            await asyncio.wait_for(anext(holder), 1)
+        assert public_deps._export_slots == {}
+        for holder in holders:
+            await holder.aclose()
@@ -5,6 +5,8 @@ names trace/sessions/users use), the COUNT-driven pagination metadata, and
 the {data, meta} response envelope.
 """
 
+import asyncio
+import gc
 import gzip
 import inspect
 import logging
@@ -13,12 +15,16 @@ from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
+from clickhouse_connect.driver.common import StreamContext
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
 )
 
 from rest.main import app
+from rest.routers.internal import get_spans_jsonl
+from rest.routers.internal import router as internal_router
 from shared.config import settings
 
 
@@ -390,6 +396,58 @@ class TestWriteDetectorRun:
         assert "timestamp_ms" not in params
 
 
+class TestWriteDetectorRunsBatch:
+    def _run(self, run_id: str, **extra) -> dict:
+        return {
+            "runId": run_id,
+            "detectorId": f"d-{run_id}",
+            "projectId": "p1",
+            "traceId": "trace-aaa",
+            "findingId": "f1",
+            "status": "completed",
+            **extra,
+        }
+
+    def test_writes_every_run_in_one_insert(self, client, mock_ch, secret):
+        resp = client.post(
+            "/api/v1/internal/detector-runs/batch",
+            json={"runs": [self._run("r1"), self._run("r2", selfTraced=True)]},
+            headers={"X-Internal-Secret": secret},
+        )
+        assert resp.status_code == 200
+        mock_ch.query.assert_called_once()
+        sql = mock_ch.query.call_args.args[0]
+        params = mock_ch.query.call_args.kwargs["parameters"]
+        assert sql.startswith("INSERT INTO detector_runs")
+        assert "{run_id_0:String}" in sql and "{run_id_1:String}" in sql
+        assert params["run_id_0"] == "r1"
+        assert params["self_traced_1"] is True
+
+    def test_timestamp_stamped_per_run(self, client, mock_ch, secret):
+        resp = client.post(
+            "/api/v1/internal/detector-runs/batch",
+            json={"runs": [self._run("r1", timestampMs=1_700_000_000_123), self._run("r2")]},
+            headers={"X-Internal-Secret": secret},
+        )
+        assert resp.status_code == 200
+        sql = mock_ch.query.call_args.args[0]
+        params = mock_ch.query.call_args.kwargs["parameters"]
+        assert "fromUnixTimestamp64Milli({timestamp_ms_0:Int64})" in sql
+        assert params["timestamp_ms_0"] == 1_700_000_000_123
+        # A run without a worker time falls back to the column default.
+        assert "now64(3)" in sql
+        assert "timestamp_ms_1" not in params
+
+    def test_empty_batch_rejected(self, client, mock_ch, secret):
+        resp = client.post(
+            "/api/v1/internal/detector-runs/batch",
+            json={"runs": []},
+            headers={"X-Internal-Secret": secret},
+        )
+        assert resp.status_code == 422
+        mock_ch.query.assert_not_called()
+
+
 # =============================================================================
 # /traces/{trace_id}/findings
 # =============================================================================
@@ -442,6 +500,97 @@ class TestInternalAuth:
         assert resp.status_code == 403
 
 
+# =============================================================================
+# /traces/{trace_id}/spans-jsonl
+# =============================================================================
+
+
+class TestGetSpansJsonl:
+    def _stream(self, blocks: list[list[tuple]], column_names: list[str]) -> StreamContext:
+        source = MagicMock()
+        source.column_names = column_names
+        return StreamContext(source, iter(blocks))
+
+    def test_streams_every_block_as_ndjson(self, client, mock_ch, secret):
+        ts = datetime(2026, 6, 24, 12, 30, 45)
+        stream = self._stream(
+            [[("s1", ts)], [("s2", ts), ("s3", None)]],
+            ["span_id", "span_start_time"],
+        )
+        mock_ch.query_rows_stream.return_value = stream
+
+        resp = client.get(
+            "/api/v1/internal/traces/t1/spans-jsonl",
+            params={"project_id": "p1"},
+            headers={"X-Internal-Secret": secret},
+        )
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert resp.text.split("\n") == [
+            f'{{"span_id": "s1", "span_start_time": "{ts.isoformat()}"}}',
+            f'{{"span_id": "s2", "span_start_time": "{ts.isoformat()}"}}',
+            '{"span_id": "s3", "span_start_time": null}',
+        ]
+        stream.source.close.assert_called_once()
+
+    def test_empty_trace_returns_empty_body(self, client, mock_ch, secret):
+        mock_ch.query_rows_stream.return_value = self._stream([], ["span_id"])
+
+        resp = client.get(
+            "/api/v1/internal/traces/t1/spans-jsonl",
+            params={"project_id": "p1"},
+            headers={"X-Internal-Secret": secret},
+        )
+
+        assert resp.status_code == 200
+        assert resp.text == ""
+
+    def test_closes_the_stream_when_the_body_never_starts(self, mock_ch):
+        # A client that disconnects before the first chunk never runs the
+        # generator, so only the response's background task can close the source.
+        stream = self._stream([[("s1",)]], ["span_id"])
+        mock_ch.query_rows_stream.return_value = stream
+
+        resp = get_spans_jsonl("t1", "p1")
+        asyncio.run(resp.background())
+
+        stream.source.close.assert_called_once()
+
+    def test_first_block_error_raises_before_the_response(self, mock_ch):
+        # The first block is read eagerly, so its failure becomes a 500 rather
+        # than a truncated 200, and the stream is still closed.
+        def _blocks():
+            raise RuntimeError("clickhouse down")
+            yield
+
+        stream = StreamContext(MagicMock(column_names=["span_id"]), _blocks())
+        mock_ch.query_rows_stream.return_value = stream
+
+        with pytest.raises(RuntimeError, match="clickhouse down"):
+            get_spans_jsonl("t1", "p1")
+
+        stream.source.close.assert_called_once()
+
+    def test_closes_the_stream_when_the_body_is_abandoned(self, mock_ch):
+        stream = self._stream([[("s1",)], [("s2",)]], ["span_id"])
+        mock_ch.query_rows_stream.return_value = stream
+
+        # A disconnect mid-body stops draining the generator; once it is
+        # dropped, its ``finally`` closes the source without the background task.
+        async def _read_first_chunk() -> str:
+            body = get_spans_jsonl("t1", "p1").body_iterator
+            try:
+                return await anext(body)
+            finally:
+                await body.aclose()
+
+        assert asyncio.run(_read_first_chunk()) == '{"span_id": "s1"}'
+        gc.collect()
+
+        stream.source.close.assert_called_once()
+
+
 # =============================================================================
 # /detector-window-summary (#810)
 # =============================================================================
@@ -1065,9 +1214,7 @@ class TestUsageBillsEveryStoredRow:
 
     def test_usage_details_counts_rows_from_every_source(self, client, mock_ch, secret):
         mock_ch.query.side_effect = [
-            _make_query_result([(3,)], ["total"]),  # traces
-            _make_query_result([(9,)], ["total"]),  # spans
-            _make_query_result([(2,)], ["total"]),  # detector_runs
+            _make_query_result([(3, 9, 2)], ["traces", "spans", "detector_runs"]),
         ]
         resp = client.get(
             "/api/v1/internal/usage/details",
@@ -1075,16 +1222,27 @@ class TestUsageBillsEveryStoredRow:
             headers={"X-Internal-Secret": secret},
         )
         assert resp.status_code == 200
-        traces_sql = mock_ch.query.call_args_list[0].args[0]
-        spans_sql = mock_ch.query.call_args_list[1].args[0]
-        runs_sql = mock_ch.query.call_args_list[2].args[0]
+        assert resp.json() == {"traces": 3, "spans": 9, "detector_runs": 2}
+        # One round-trip covers all three tables.
+        assert mock_ch.query.call_count == 1
+        combined_sql = mock_ch.query.call_args_list[0].args[0]
+        assert "FROM traces" in combined_sql
+        assert "FROM spans" in combined_sql
+        assert "FROM detector_runs" in combined_sql
         # Storage is billed whoever produced it, so metering must not filter on source
         # at all. Asserted rather than left to the commit message: re-adding a filter here
-        # would silently stop billing self-traces again.
-        assert "source" not in traces_sql
-        assert "source" not in spans_sql
-        # detector_runs was never filtered — it is the per-evaluation result record.
-        assert "source" not in runs_sql
+        # would silently stop billing self-traces again. detector_runs was never
+        # filtered either — it is the per-evaluation result record.
+        assert "source" not in combined_sql
+
+    def test_usage_details_empty_result_is_zero(self, client, mock_ch, secret):
+        mock_ch.query.side_effect = [_make_query_result([], ["traces", "spans", "detector_runs"])]
+        resp = client.get(
+            "/api/v1/internal/usage/details",
+            params=self.PARAMS,
+            headers={"X-Internal-Secret": secret},
+        )
+        assert resp.json() == {"traces": 0, "spans": 0, "detector_runs": 0}
 
     def test_usage_total_counts_rows_from_every_source(self, client, mock_ch, secret):
         mock_ch.query.side_effect = [_make_query_result([(12,)], ["total"])]
@@ -1197,3 +1355,19 @@ class TestSelfTracedFlag:
         )
         assert resp.status_code == 200
         assert resp.json()["data"][0]["self_traced"] is False
+
+
+# =============================================================================
+# Router-wide auth
+# =============================================================================
+
+
+class TestInternalRouterAuth:
+    def test_every_route_rejects_missing_secret(self, client):
+        routes = [r for r in internal_router.routes if isinstance(r, APIRoute)]
+        assert routes
+        for route in routes:
+            path = "/api/v1" + route.path.replace("{trace_id}", "t1")
+            for method in route.methods:
+                resp = client.request(method, path, params={"project_id": "p1"})
+                assert resp.status_code == 403, (method, path)
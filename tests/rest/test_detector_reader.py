@@ -5,6 +5,7 @@ ClickHouse is faked (dispatches by SQL content) and the Postgres boundary
 """
 
 import json
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -69,6 +70,27 @@ def test_list_findings_parses_payload_into_summaries(reader):
     assert all(p and p.get("project_id") == "p1" for _, p in reader._client.calls)
 
 
+def test_list_findings_count_and_page_run_concurrently(reader):
+    reader._client.rows = []
+    reader._client.count_rows = [(3,)]
+    # Each query blocks until the other has started; run back to back, the
+    # first would time out and break the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    query = reader._client.query
+
+    def blocking_query(sql, parameters=None):
+        barrier.wait()
+        return query(sql, parameters=parameters)
+
+    reader._client.query = blocking_query
+
+    items, total = reader.list_findings(
+        project_id="p1", limit=50, start_after=None, end_before=None, detector=None, trace_id=None
+    )
+
+    assert (items, total) == ([], 3)
+
+
 def test_list_findings_detector_filter_includes_token_and_resolved_names(reader, monkeypatch):
     reader._client.rows = []
     reader._client.count_rows = [(0,)]
@@ -305,3 +327,176 @@ def test_get_detector_reader_service_is_singleton(monkeypatch):
     monkeypatch.setattr(mod, "get_clickhouse_client", lambda: MagicMock())
     mod._service = None
     assert mod.get_detector_reader_service() is mod.get_detector_reader_service()
+
+
+def test_pg_rows_reuses_pooled_connection(reader, monkeypatch):
+    import rest.services.detector_reader as mod
+
+    conn = MagicMock(closed=0)
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [("d1", "tmpl")]
+    pool = MagicMock()
+    pool.getconn.return_value = conn
+    make_pool = MagicMock(return_value=pool)
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", make_pool)
+
+    assert reader._pg_rows("SELECT 1", ()) == [("d1", "tmpl")]
+    assert reader._pg_rows("SELECT 1", ()) == [("d1", "tmpl")]
+
+    make_pool.assert_called_once()
+    assert conn.autocommit is True
+    assert pool.putconn.call_count == 2
+    pool.putconn.assert_called_with(conn, close=False)
+
+
+def test_pg_pool_sized_from_settings(monkeypatch):
+    import rest.services.detector_reader as mod
+    from shared.config import settings
+
+    monkeypatch.setattr(settings, "database_pool_size", 33)
+    monkeypatch.setattr(mod, "get_clickhouse_client", lambda: FakeCH())
+    make_pool = MagicMock()
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", make_pool)
+
+    mod.DetectorReaderService()._get_pg_pool()
+
+    make_pool.assert_called_once_with(0, 33, settings.database_url)
+
+
+def test_pg_rows_discards_broken_connection(reader, monkeypatch):
+    import rest.services.detector_reader as mod
+
+    conn = MagicMock(closed=0)
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    def broken(sql, params):
+        conn.closed = 2
+        raise RuntimeError("server closed the connection")
+
+    cursor.execute.side_effect = broken
+    pool = MagicMock()
+    pool.getconn.return_value = conn
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", MagicMock(return_value=pool))
+
+    with pytest.raises(RuntimeError):
+        reader._pg_rows("SELECT 1", ())
+    pool.putconn.assert_called_once_with(conn, close=True)
+
+
+def test_pg_rows_retries_on_a_connection_that_died_while_idle(reader, monkeypatch):
+    import psycopg2
+
+    import rest.services.detector_reader as mod
+
+    stale = MagicMock(closed=0)
+
+    def dead_socket(sql, params):
+        stale.closed = 2
+        raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    stale.cursor.return_value.__enter__.return_value.execute.side_effect = dead_socket
+    fresh = MagicMock(closed=0)
+    fresh.cursor.return_value.__enter__.return_value.fetchall.return_value = [("row",)]
+    pool = MagicMock()
+    pool.getconn.side_effect = [stale, fresh]
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", MagicMock(return_value=pool))
+
+    assert reader._pg_rows("SELECT 1", ()) == [("row",)]
+    assert pool.putconn.call_args_list == [
+        ((stale,), {"close": True}),
+        ((fresh,), {"close": False}),
+    ]
+
+
+def test_pg_rows_does_not_retry_a_query_error_on_a_live_connection(reader, monkeypatch):
+    import psycopg2
+
+    import rest.services.detector_reader as mod
+
+    conn = MagicMock(closed=0)
+    conn.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError(
+        "canceling statement due to statement timeout"
+    )
+    pool = MagicMock()
+    pool.getconn.return_value = conn
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", MagicMock(return_value=pool))
+
+    with pytest.raises(psycopg2.OperationalError):
+        reader._pg_rows("SELECT 1", ())
+    pool.getconn.assert_called_once()
+    pool.putconn.assert_called_once_with(conn, close=False)
+
+
+def test_pg_rows_waits_for_a_connection_when_the_pool_is_full(monkeypatch):
+    from psycopg2.pool import PoolError
+
+    import rest.services.detector_reader as mod
+    from shared.config import settings
+
+    monkeypatch.setattr(settings, "database_pool_size", 1)
+    monkeypatch.setattr(mod, "get_clickhouse_client", lambda: FakeCH())
+    svc = mod.DetectorReaderService()
+
+    release = threading.Event()
+    holding = threading.Event()
+    checked_out: list[object] = []
+
+    class OneConnPool:
+        """Mimics ThreadedConnectionPool(0, 1): getconn raises when exhausted."""
+
+        def getconn(self):
+            if checked_out:
+                raise PoolError("connection pool exhausted")
+            conn = MagicMock(closed=0)
+            cursor = conn.cursor.return_value.__enter__.return_value
+
+            def fetchall():
+                holding.set()
+                release.wait(timeout=5)
+                return [("row",)]
+
+            cursor.fetchall.side_effect = fetchall
+            checked_out.append(conn)
+            return conn
+
+        def putconn(self, conn, close=False):
+            checked_out.remove(conn)
+
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", MagicMock(return_value=OneConnPool()))
+
+    results: list[list[tuple]] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(svc._pg_rows("SELECT 1", ())))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    assert holding.wait(timeout=5)
+    # The second query finds the only connection checked out and must wait.
+    threads[1].start()
+    threads[1].join(timeout=0.2)
+    assert threads[1].is_alive()
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert results == [[("row",)], [("row",)]]
+
+
+def test_pg_pool_is_built_once_under_concurrent_first_use(reader, monkeypatch):
+    import rest.services.detector_reader as mod
+
+    barrier = threading.Barrier(4)
+    make_pool = MagicMock()
+    monkeypatch.setattr(mod, "ThreadedConnectionPool", make_pool)
+
+    def first_use():
+        barrier.wait(timeout=5)
+        reader._get_pg_pool()
+
+    threads = [threading.Thread(target=first_use) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    make_pool.assert_called_once()
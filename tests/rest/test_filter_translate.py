@@ -14,6 +14,7 @@ import pytest
 from rest.services.filters.translate import (
     SPAN_TIME_BOUND_LOOKBACK_HOURS,
     Predicate,
+    _parse_filters,
     build_conditions,
     parse_filters_param,
 )
@@ -31,6 +32,20 @@ def test_parse_valid_json_array_yields_predicates():
     assert preds == [Predicate(field="model_name", op="in", value=["gpt-4"])]
 
 
+def test_parse_reuses_the_parse_for_a_repeated_value():
+    raw = '[{"field":"model_name","op":"in","value":["gpt-4o-memo"]}]'
+    first = parse_filters_param(raw)
+    first.append(Predicate(field="model_name", op="in", value=["other"]))
+    hits = _parse_filters.cache_info().hits
+
+    # A repeat hits the memo and hands back a fresh list, untouched by the
+    # caller's edit to the first one.
+    assert parse_filters_param(raw) == [
+        Predicate(field="model_name", op="in", value=["gpt-4o-memo"])
+    ]
+    assert _parse_filters.cache_info().hits == hits + 1
+
+
 def test_parse_rejects_non_json():
     with pytest.raises(ValueError):
         parse_filters_param("not json")
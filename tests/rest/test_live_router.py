@@ -13,6 +13,7 @@ Key invariants under test:
 
 import asyncio
 import json
+import threading
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -340,6 +341,39 @@ class TestSubscribeBeforeCheckInvariant:
 
         assert call_order.index("subscribe") < call_order.index("clickhouse_check")
 
+    def test_retention_lookup_overlaps_subscribe(self, client):
+        """The start-time lookup needs no subscription, so it runs during SUBSCRIBE."""
+        lookup_started = threading.Event()
+        overlapped = []
+
+        def tracked_start(project_id, trace_id):
+            lookup_started.set()
+            return _utcnow_naive()
+
+        async def waiting_subscribe(channel):
+            overlapped.append(await asyncio.to_thread(lookup_started.wait, 5))
+
+        pubsub = MockPubSub([])
+        pubsub.subscribe.side_effect = waiting_subscribe
+        mock_redis = MagicMock()
+        mock_redis.pubsub.return_value = pubsub
+        mock_service = MagicMock()
+        mock_service.get_trace_start_time.side_effect = tracked_start
+
+        with (
+            patch("rest.routers.live.TRACE_COMPLETE_QUIET_SECONDS", 0.1),
+            patch("rest.routers.live.get_trace_reader_service", return_value=mock_service),
+            patch(
+                "rest.routers.live._completion_state_in_clickhouse",
+                return_value=(_utcnow_naive(), _utcnow_naive()),
+            ),
+            patch("shared.redis.get_async_redis_client", return_value=mock_redis),
+        ):
+            resp = client.get(ENDPOINT)
+
+        assert resp.status_code == 200
+        assert overlapped == [True]
+
     def test_events_published_during_clickhouse_check_are_not_lost(self, client):
         """Simulates a Celery worker publishing a span to Redis while the
         ClickHouse completion check is running. Because subscribe happens
@@ -370,6 +404,27 @@ class TestSubscribeBeforeCheckInvariant:
         assert "event: spans" in events, "span published during ClickHouse check was lost"
         assert events[-1] == "event: trace_complete"
 
+    def test_check_failure_surfaces_unwrapped_and_unsubscribes(self, client):
+        """The completion check runs concurrently with the retention lookup; its
+        failure must reach FastAPI as the original error, not an ExceptionGroup,
+        and the Redis subscription must still be released."""
+        pubsub = MockPubSub([])
+        mock_redis = MagicMock()
+        mock_redis.pubsub.return_value = pubsub
+
+        with (
+            patch(
+                "rest.routers.live._completion_state_in_clickhouse",
+                side_effect=RuntimeError("clickhouse down"),
+            ),
+            patch("shared.redis.get_async_redis_client", return_value=mock_redis),
+            pytest.raises(RuntimeError, match="clickhouse down"),
+        ):
+            client.get(ENDPOINT)
+
+        pubsub.unsubscribe.assert_awaited_once()
+        pubsub.close.assert_awaited_once()
+
 
 class TestQuietWindowAnchoring:
     def test_old_completed_trace_closes_immediately(self, client):
@@ -514,6 +569,10 @@ class TestRetentionGate:
                     "rest.routers.live.get_trace_reader_service",
                     return_value=mock_service,
                 ),
+                patch(
+                    "rest.routers.live._completion_state_in_clickhouse",
+                    return_value=(None, None),
+                ),
                 patch("shared.redis.get_async_redis_client", return_value=mock_redis),
             ):
                 resp = test_client.get(ENDPOINT)
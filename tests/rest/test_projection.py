@@ -5,6 +5,8 @@ expansion, the canonical-column mapping the bulk reader uses, and the in-place
 merge of bulk span I/O onto skeleton spans.
 """
 
+import threading
+
 import pytest
 
 from rest.projection import (
@@ -15,6 +17,7 @@ from rest.projection import (
     SKELETON,
     USAGE,
     InvalidFieldsError,
+    get_trace_with_span_io,
     hydrate_span_io,
     io_columns,
     merge_span_io,
@@ -91,6 +94,17 @@ class TestResolveSpanFields:
         with pytest.raises(InvalidFieldsError):
             resolve_span_fields("io.input", default=SKELETON)
 
+    def test_repeat_value_is_memoized(self):
+        first = resolve_span_fields("io, usage", default=SKELETON)
+        assert resolve_span_fields("io, usage", default=SKELETON) is first
+        # A different default is a different key, never the cached answer.
+        assert resolve_span_fields(None, default=FULL) == FULL
+
+    def test_rejected_value_raises_every_time(self):
+        for _ in range(2):
+            with pytest.raises(InvalidFieldsError):
+                resolve_span_fields("bogus,io", default=SKELETON)
+
 
 class TestIoColumns:
     def test_skeleton_needs_no_columns(self):
@@ -183,3 +197,43 @@ class TestHydrateSpanIo:
         assert reader.calls[0]["columns"] == frozenset({"input", "output"})
         assert trace["spans"][0]["input"] == "i"
         assert trace["spans"][0]["metadata"] is None
+
+
+class _BarrierReader(_StubReader):
+    """Both reads block on a shared barrier, so they only finish if run concurrently."""
+
+    def __init__(self, span_io=None):
+        super().__init__(span_io)
+        self._barrier = threading.Barrier(2, timeout=5)
+        self.get_trace_kwargs = None
+
+    def get_trace(self, *, project_id, trace_id, **kwargs):
+        self.get_trace_kwargs = {"project_id": project_id, "trace_id": trace_id, **kwargs}
+        self._barrier.wait()
+        return {"spans": [{"span_id": "s1", "input": None}]}
+
+    def get_trace_spans_io(self, *, project_id, trace_id, columns):
+        self._barrier.wait()
+        return super().get_trace_spans_io(project_id=project_id, trace_id=trace_id, columns=columns)
+
+
+class TestGetTraceWithSpanIo:
+    def test_io_projection_reads_concurrently(self):
+        reader = _BarrierReader({"s1": {"input": "i"}})
+        trace, span_io = get_trace_with_span_io(
+            reader, project_id="p", trace_id="t", groups=FULL, source="sdk"
+        )
+        assert reader.get_trace_kwargs == {"project_id": "p", "trace_id": "t", "source": "sdk"}
+        assert span_io == {"s1": {"input": "i"}}
+        # Returned unmerged: the caller applies it after its own gates.
+        assert trace["spans"][0]["input"] is None
+
+    def test_skeleton_reads_trace_only(self):
+        reader = _StubReader()
+        reader.get_trace = lambda **kwargs: {"spans": []}
+        trace, span_io = get_trace_with_span_io(
+            reader, project_id="p", trace_id="t", groups=SKELETON
+        )
+        assert trace == {"spans": []}
+        assert span_io == {}
+        assert reader.calls == []
@@ -3,6 +3,7 @@
 Uses FastAPI TestClient with mocked S3, Celery, and protobuf decode.
 """
 
+import asyncio
 import gzip
 from unittest.mock import MagicMock
 
@@ -168,6 +169,25 @@ class TestIngestTraces:
         uploaded_data = mock_s3.upload_json.call_args[0][1]
         assert uploaded_data == decoded
 
+    def test_upload_runs_off_the_event_loop(self, client):
+        test_client, mock_s3, _ = client
+        loops = []
+
+        def record_loop(*_args):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+
+        mock_s3.upload_json.side_effect = record_loop
+        response = test_client.post(
+            "/api/v1/public/traces",
+            content=b"protobuf-bytes",
+            headers={"Content-Type": "application/x-protobuf"},
+        )
+        assert response.status_code == 200
+        assert loops == [None]
+
 
 class TestContentTypeValidation:
     def test_missing_content_type_returns_415(self, client):
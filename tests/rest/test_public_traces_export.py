@@ -6,6 +6,7 @@ project. `bundle.trace` must equal the public `traces get` payload.
 """
 
 import copy
+import json
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -13,9 +14,12 @@ import pytest
 import respx
 from fastapi.testclient import TestClient
 from httpx import Response
+from pydantic import ValidationError
 
 from rest.main import app
 from rest.routers.public.deps import AuthResult, authenticate_api_key
+from rest.routers.public.serialize import export_bundle, export_bundle_json
+from rest.schemas.public import PublicTraceExportResponse
 
 BASE_URL = "http://localhost:3000"
 
@@ -362,3 +366,29 @@ class TestPublicUrlAcrossStack:
         for url in urls:
             assert url.startswith("http://localhost:3000")
             assert "web:3000" not in url
+
+
+class TestStreamedBundleEncoding:
+    @staticmethod
+    def _trace_with_spans(count: int) -> dict:
+        trace = copy.deepcopy(TRACE_DETAIL)
+        template = trace["spans"][0]
+        trace["spans"] = [{**template, "span_id": f"span-{i}"} for i in range(count)]
+        return trace
+
+    @pytest.mark.parametrize("span_count", [0, 1, 64, 130])
+    def test_stream_matches_buffered_bundle(self, span_count):
+        trace = self._trace_with_spans(span_count)
+        streamed = json.loads(b"".join(export_bundle_json(trace, "proj-A")))
+        buffered = PublicTraceExportResponse.model_validate(
+            export_bundle(trace, "proj-A")
+        ).model_dump(mode="json")
+
+        assert streamed == buffered
+
+    def test_invalid_span_fails_before_streaming(self):
+        trace = self._trace_with_spans(2)
+        del trace["spans"][1]["name"]
+
+        with pytest.raises(ValidationError):
+            export_bundle_json(trace, "proj-A")
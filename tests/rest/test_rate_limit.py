@@ -107,6 +107,28 @@ def test_key_read_format_embeds_bucket_plan_and_workspace():
     assert key == f"rl:{rate_limit.BUCKET_READ}:free:ws-xyz"
 
 
+def test_bucket_key_built_once_per_identity_stamp():
+    """slowapi calls key_func twice per request; the second call reuses the key.
+
+    Re-stamping the identity (or keying a different bucket) rebuilds it.
+    """
+    # Arrange
+    request = _make_stamped_request("ws-1", "free")
+
+    # Act
+    first = rate_limit.key_read(request)
+    request.state.rl_workspace_id = "ws-other"  # not a re-stamp: key is reused
+    second = rate_limit.key_read(request)
+    rate_limit.set_rate_limit_identity(request, "ws-2", "pro")
+    restamped = rate_limit.key_read(request)
+    exported = rate_limit.key_export(request)
+
+    # Assert
+    assert first == second == f"rl:{rate_limit.BUCKET_READ}:free:ws-1"
+    assert restamped == f"rl:{rate_limit.BUCKET_READ}:pro:ws-2"
+    assert exported == f"rl:{rate_limit.BUCKET_EXPORT}:pro:ws-2"
+
+
 # ---------------------------------------------------------------------------
 # C. Tier values (enterprise EQUALS pro) + normalize_plan
 # ---------------------------------------------------------------------------
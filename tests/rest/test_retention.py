@@ -100,6 +100,12 @@ class TestClampRetentionWindow:
         result_sa, _ = clamp_retention_window("free", recent)
         assert result_sa == recent
 
+    def test_tz_aware_recent_start_after_returned_as_naive_utc(self):
+        recent = datetime.now(UTC) - timedelta(days=5)
+        result_sa, _ = clamp_retention_window("free", recent)
+        assert result_sa.tzinfo is None
+        assert result_sa == recent.replace(tzinfo=None)
+
     def test_tz_aware_old_start_after_clamps(self):
         old = datetime.now(UTC) - timedelta(days=30)
         result_sa, _ = clamp_retention_window("free", old)
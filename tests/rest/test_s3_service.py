@@ -0,0 +1,94 @@
+"""Unit tests for the S3 service's bucket check, with a mocked boto3 client."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from rest.services.s3 import S3Service
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code}}, "operation")
+
+
+@pytest.fixture()
+def service():
+    svc = S3Service(bucket_name="traces")
+    svc._client = MagicMock()
+    return svc
+
+
+class TestEnsureBucketExists:
+    def test_bucket_checked_once(self, service):
+        service.ensure_bucket_exists()
+        service.ensure_bucket_exists()
+
+        service._client.head_bucket.assert_called_once_with(Bucket="traces")
+
+    def test_missing_bucket_created_then_remembered(self, service):
+        service._client.head_bucket.side_effect = _client_error("404")
+
+        service.ensure_bucket_exists()
+        service.ensure_bucket_exists()
+
+        service._client.create_bucket.assert_called_once_with(Bucket="traces")
+        service._client.head_bucket.assert_called_once()
+
+    def test_failed_check_is_retried(self, service):
+        service._client.head_bucket.side_effect = _client_error("403")
+
+        for _ in range(2):
+            with pytest.raises(ClientError):
+                service.ensure_bucket_exists()
+
+        assert service._client.head_bucket.call_count == 2
+
+    def test_upload_to_deleted_bucket_forces_recheck(self, service):
+        service.ensure_bucket_exists()
+        service._client.put_object.side_effect = _client_error("NoSuchBucket")
+
+        with pytest.raises(ClientError):
+            service.upload_json("k.json", {"a": 1})
+        service.ensure_bucket_exists()
+
+        assert service._client.head_bucket.call_count == 2
+
+
+class TestJsonRoundTrip:
+    def test_upload_is_compact_utf8(self, service):
+        service.upload_json("k.json", {"name": "café", "spans": [1, 2]})
+
+        body = service._client.put_object.call_args.kwargs["Body"]
+        assert body == '{"name":"café","spans":[1,2]}'.encode()
+
+    def test_download_parses_raw_bytes(self, service):
+        service._client.get_object.return_value = {
+            "Body": MagicMock(read=MagicMock(return_value='{"name": "café"}'.encode()))
+        }
+
+        assert service.download_json("k.json") == {"name": "café"}
+
+
+class TestGetClient:
+    def test_concurrent_first_use_builds_one_client(self, monkeypatch):
+        svc = S3Service(bucket_name="traces")
+        barrier = threading.Barrier(4)
+        build = MagicMock(side_effect=lambda: MagicMock())
+        monkeypatch.setattr(svc, "_build_client", build)
+
+        clients: list[object] = []
+
+        def first_use():
+            barrier.wait(timeout=5)
+            clients.append(svc._get_client())
+
+        threads = [threading.Thread(target=first_use) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        build.assert_called_once()
+        assert len(clients) == 4 and all(c is clients[0] for c in clients)
@@ -6,6 +6,7 @@ Covers ``GET /traces/filter-fields`` (registry serialization) and
 mocked dependencies — no ClickHouse needed.
 """
 
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -256,6 +257,47 @@ class TestGetDistinctSpanValues:
         assert first == second
         mock_client.query.assert_called_once()  # second call served from cache
 
+    def test_concurrent_misses_share_one_scan(self, monkeypatch):
+        started, release = threading.Event(), threading.Event()
+        mock_client = MagicMock()
+
+        def slow_query(*args, **kwargs):
+            started.set()
+            assert release.wait(5)
+            return MagicMock(result_rows=[("gpt-4", 10)])
+
+        mock_client.query.side_effect = slow_query
+        svc = self._service(monkeypatch, mock_client)
+        joined = threading.Event()
+
+        class _InflightSpy(dict):
+            def get(self, key, default=None):
+                inflight = super().get(key, default)
+                if inflight is not None:
+                    joined.set()
+                return inflight
+
+        svc._distinct_inflight = _InflightSpy()
+        results = []
+
+        def fetch():
+            results.append(svc.get_distinct_span_values(project_id="p1", column="model_name"))
+
+        leader = threading.Thread(target=fetch)
+        leader.start()
+        assert started.wait(5)
+        follower = threading.Thread(target=fetch)
+        follower.start()
+        # The follower found the leader's scan in flight and waits on it.
+        assert joined.wait(5)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert results == [[{"value": "gpt-4", "count": 10}]] * 2
+        mock_client.query.assert_called_once()
+        assert svc._distinct_inflight == {}
+
     def test_query_excludes_null_and_empty_values(self, monkeypatch):
         mock_client = MagicMock()
         mock_client.query.return_value.result_rows = []
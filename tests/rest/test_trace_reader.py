@@ -572,3 +572,103 @@ class TestHasTraces:
         service.has_traces("c")
         assert "a" not in service._has_traces_cache
         assert "c" in service._has_traces_cache
+
+
+class TestGetSession:
+    def _side_effect(self, trace_rows):
+        def side_effect(query, parameters=None):
+            if "sum(input_tokens)" in query:
+                return _rows([(10, 20, 0.5)])
+            if "argMin(input" in query:
+                return _rows([("t-1", "span-in", "span-out")])
+            return _rows(trace_rows)
+
+        return side_effect
+
+    def test_backfills_io_and_sums_tokens(self):
+        start = datetime(2026, 1, 1)
+        side_effect = self._side_effect([("t-1", "root", start, "u-1", "", "{}", 5.0, "OK")])
+        service, client = _make_service(side_effect)
+
+        session = service.get_session("proj-1", "s-1")
+
+        assert client.query.call_count == 3
+        assert session["traces"][0]["input"] == "span-in"
+        assert session["traces"][0]["output"] == "span-out"
+        assert session["total_input_tokens"] == 10
+        assert session["total_output_tokens"] == 20
+        assert session["total_cost"] == 0.5
+
+    def test_skips_span_io_query_when_trace_io_present(self):
+        start = datetime(2026, 1, 1)
+        side_effect = self._side_effect([("t-1", "root", start, "u-1", "in", "out", 5.0, "OK")])
+        service, client = _make_service(side_effect)
+
+        session = service.get_session("proj-1", "s-1")
+
+        assert client.query.call_count == 2
+        assert not any("argMin(input" in c.args[0] for c in client.query.call_args_list)
+        assert session["traces"][0]["input"] == "in"
+        assert session["total_input_tokens"] == 10
+
+    def test_span_io_query_scans_only_traces_missing_io(self):
+        start = datetime(2026, 1, 1)
+        side_effect = self._side_effect(
+            [
+                ("t-1", "root", start, "u-1", "", "{}", 5.0, "OK"),
+                ("t-2", "root", start, "u-1", "in", "out", 5.0, "OK"),
+            ]
+        )
+        service, client = _make_service(side_effect)
+
+        service.get_session("proj-1", "s-1")
+
+        calls = client.query.call_args_list
+        span_io = next(c for c in calls if "argMin(input" in c.args[0])
+        tokens = next(c for c in calls if "sum(input_tokens)" in c.args[0])
+        assert span_io.kwargs["parameters"]["trace_ids"] == ["t-1"]
+        assert tokens.kwargs["parameters"]["trace_ids"] == ["t-1", "t-2"]
+
+
+class TestGetTraceStartTime:
+    def test_caches_per_project_and_trace(self):
+        start = datetime(2026, 1, 1)
+        call_count = {"n": 0}
+
+        def side_effect(*a, **kw):
+            call_count["n"] += 1
+            return _rows([(start,)])
+
+        service, _ = _make_service(side_effect)
+        assert service.get_trace_start_time("proj-1", "t-1") == start
+        assert service.get_trace_start_time("proj-1", "t-1") == start
+        assert call_count["n"] == 1
+        assert ("proj-1", "t-1") in service._trace_start_cache
+
+        service.get_trace_start_time("proj-2", "t-1")
+        assert call_count["n"] == 2
+
+    def test_get_trace_seeds_cache_from_root_span(self):
+        start = datetime(2026, 1, 1)
+        trace_row = ("t-1", "proj-1", "root", start, None, None, None, None, "", "", "")
+
+        def span_row(span_id, parent_span_id, span_start):
+            return (
+                (span_id, "t-1", parent_span_id, "s", "SPAN", span_start, None, "OK")
+                + (None,) * 6
+                + ({},)
+                + (None,) * 4
+            )
+
+        def side_effect(query, parameters=None):
+            if "FROM spans" not in query:
+                return _rows([trace_row])
+            return _rows(
+                [span_row("root", None, start), span_row("child", "root", start.replace(hour=1))]
+            )
+
+        service, client = _make_service(side_effect)
+        service.get_trace("proj-1", "t-1")
+
+        assert service.get_trace_start_time("proj-1", "t-1") == start
+        assert client.query.call_count == 2  # no separate start-time probe
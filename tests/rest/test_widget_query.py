@@ -395,6 +395,15 @@ def test_empty_rows_validates_and_serializes():
     assert encoded["rows"] == []
 
 
+def test_clickhouse_row_tuples_validate_as_lists():
+    """run_widget_query hands ClickHouse's row tuples straight to the response model."""
+    response = WidgetQueryResponse.model_validate(
+        {"columns": ("bucket", "value"), "rows": [(datetime(2026, 6, 1), 1.0)], "meta": {}}
+    )
+    assert response.columns == ["bucket", "value"]
+    assert response.rows == [[datetime(2026, 6, 1), 1.0]]
+
+
 def test_traces_view_null_guards_measures():
     """The traces base relation must NULL-guard measures for span-less traces.
 
@@ -1,5 +1,6 @@
 """Unit tests for the exactly-once detector enqueue path (Redis lock + BullMQ)."""
 
+import hashlib
 import json
 import threading
 from unittest.mock import MagicMock
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 import worker.detector_tasks as dt
+from shared.config import settings
 
 PROJECT = "proj-1"
 TRACE = "aa" * 16
@@ -19,6 +21,10 @@ class FakeRedis:
     def __init__(self):
         self.store: dict[str, bytes] = {}
         self._mutex = threading.Lock()
+        self.pipelines_executed = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
 
     def set(self, key, value, nx=False, ex=None):
         if isinstance(value, str):
@@ -43,6 +49,21 @@ class FakeRedis:
             return 0
 
 
+class FakePipeline:
+    """Buffers SETs and applies them, in order, on ``execute``."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def set(self, key, value, nx=False, ex=None):
+        self._commands.append((key, value, nx, ex))
+
+    def execute(self):
+        self._redis.pipelines_executed += 1
+        return [self._redis.set(k, v, nx=nx, ex=ex) for k, v, nx, ex in self._commands]
+
+
 @pytest.fixture()
 def fake_redis(monkeypatch):
     r = FakeRedis()
@@ -50,10 +71,26 @@ def fake_redis(monkeypatch):
     return r
 
 
+def _patch_add_job(monkeypatch, add_one):
+    """Route ``_add_bullmq_jobs`` through a per-job callable; a raise fails only that job."""
+
+    def add_jobs(jobs):
+        outcomes = []
+        for job_id, data in jobs:
+            try:
+                add_one(job_id, data)
+                outcomes.append(None)
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    monkeypatch.setattr(dt, "_add_bullmq_jobs", add_jobs)
+
+
 @pytest.fixture()
 def mock_add_job(monkeypatch):
     mock = MagicMock()
-    monkeypatch.setattr(dt, "_add_bullmq_job", mock)
+    _patch_add_job(monkeypatch, mock)
     return mock
 
 
@@ -159,6 +196,31 @@ class TestPrimaryEnqueue:
         mock_add_job.assert_not_called()
         assert _lock_state(fake_redis)["state"] == "sampled_out"
 
+    def test_conditionless_detectors_skip_summary_query(
+        self, fake_redis, mock_add_job, monkeypatch
+    ):
+        _patch_detectors(monkeypatch, [_detector("d1"), _detector("d2", sample_rate=0)])
+        summaries = MagicMock(return_value={})
+        monkeypatch.setattr(dt, "_get_trace_summaries", summaries)
+
+        dt.enqueue_detector_runs(PROJECT, {TRACE})
+
+        summaries.assert_not_called()
+        assert mock_add_job.call_args.args[1]["detectorIds"] == ["d1"]
+
+    def test_caller_summaries_skip_summary_query(self, fake_redis, mock_add_job, monkeypatch):
+        _patch_detectors(
+            monkeypatch,
+            [_detector("d1", conditions=[{"field": "environment", "op": "=", "value": "prod"}])],
+        )
+        query = MagicMock(return_value={})
+        monkeypatch.setattr(dt, "_get_trace_summaries", query)
+
+        dt.enqueue_detector_runs(PROJECT, {TRACE}, summaries={TRACE: {"environment": "prod"}})
+
+        query.assert_not_called()
+        assert mock_add_job.call_args.args[1]["detectorIds"] == ["d1"]
+
     def test_bad_trace_does_not_drop_rest_of_batch(self, fake_redis, mock_add_job, monkeypatch):
         """A malformed condition only drops the offending trace."""
         other = "bb" * 16
@@ -174,9 +236,51 @@ class TestPrimaryEnqueue:
         assert mock_add_job.call_count == 0
         assert _lock_state(fake_redis, trace_id=other)["state"] == "sampled_out"
 
+    def test_batch_claims_share_one_round_trip(self, fake_redis, mock_add_job, monkeypatch):
+        traces = {"aa" * 16, "bb" * 16, "cc" * 16}
+        _patch_detectors(monkeypatch, [_detector("d1")])
+        _patch_summaries(monkeypatch, {})
+
+        dt.enqueue_detector_runs(PROJECT, traces)
+
+        assert fake_redis.pipelines_executed == 1
+        assert mock_add_job.call_count == 3
+        assert all(_lock_state(fake_redis, trace_id=t)["state"] == "pending" for t in traces)
+
+    def test_batch_adds_its_jobs_in_one_call(self, fake_redis, monkeypatch):
+        traces = {"aa" * 16, "bb" * 16, "cc" * 16}
+        batches = []
+        monkeypatch.setattr(
+            dt, "_add_bullmq_jobs", lambda jobs: batches.append(jobs) or [None] * len(jobs)
+        )
+        _patch_detectors(monkeypatch, [_detector("d1")])
+        _patch_summaries(monkeypatch, {})
+
+        dt.enqueue_detector_runs(PROJECT, traces)
+
+        assert len(batches) == 1
+        assert {job_id for job_id, _ in batches[0]} == {f"{PROJECT}--{t}" for t in traces}
+        assert all(_lock_state(fake_redis, trace_id=t)["state"] == "pending" for t in traces)
+
+    def test_failed_add_releases_only_its_trace(self, fake_redis, monkeypatch):
+        other = "bb" * 16
+
+        def add_one(job_id, data):
+            if data["traceId"] == TRACE:
+                raise RuntimeError("add failed")
+
+        _patch_add_job(monkeypatch, add_one)
+        _patch_detectors(monkeypatch, [_detector("d1")])
+        _patch_summaries(monkeypatch, {})
+
+        dt.enqueue_detector_runs(PROJECT, {TRACE, other})
+
+        assert dt._lock_key(PROJECT, TRACE) not in fake_redis.store
+        assert _lock_state(fake_redis, trace_id=other)["state"] == "pending"
+
     def test_concurrent_claims_enqueue_exactly_once(self, fake_redis, monkeypatch):
         added = []
-        monkeypatch.setattr(dt, "_add_bullmq_job", lambda job_id, data: added.append(job_id))
+        _patch_add_job(monkeypatch, lambda job_id, data: added.append(job_id))
         _patch_detectors(monkeypatch, [_detector("d1")])
         _patch_summaries(monkeypatch, {})
 
@@ -224,7 +328,7 @@ class TestFailureRelease:
             fake_redis.store[key] = foreign.encode()
             raise RuntimeError("boom")
 
-        monkeypatch.setattr(dt, "_add_bullmq_job", hijack_then_fail)
+        _patch_add_job(monkeypatch, hijack_then_fail)
         dt.enqueue_detector_runs(PROJECT, {TRACE})
 
         assert fake_redis.store[key] == foreign.encode()
@@ -258,6 +362,13 @@ class TestDeterministicSampling:
         assert dt._sample_passes(TRACE, "det-1", -5) is False
         assert dt._sample_passes(TRACE, "det-1", 150) is True
 
+    def test_roll_is_pinned_to_sha256(self):
+        # Changing the hash would re-sample every detector's traces on deploy.
+        digest = hashlib.sha256(f"{TRACE}:det-1".encode()).digest()
+        roll = int.from_bytes(digest[:8], "big") / 2**64 * 100
+        assert dt._sample_passes(TRACE, "det-1", roll + 0.01) is True
+        assert dt._sample_passes(TRACE, "det-1", roll - 0.01) is False
+
     def test_distribution_close_to_rate(self):
         n = 2000
         hits = sum(dt._sample_passes(f"trace-{i}", "det-x", 30) for i in range(n))
@@ -267,7 +378,7 @@ class TestDeterministicSampling:
 # ── BullMQ helper ───────────────────────────────────────────────────────
 
 
-class TestAddBullmqJob:
+class TestAddBullmqJobs:
     def test_adds_delayed_job_with_dedup_id_and_closes(self, monkeypatch):
         queues = []
 
@@ -288,7 +399,7 @@ class TestAddBullmqJob:
         monkeypatch.setattr("bullmq.Queue", FakeQueue)
 
         data = {"traceId": TRACE, "detectorIds": ["d1"], "projectId": PROJECT}
-        dt._add_bullmq_job(f"{PROJECT}--{TRACE}", data)
+        assert dt._add_bullmq_jobs([(f"{PROJECT}--{TRACE}", data)]) == [None]
 
         assert len(queues) == 1
         queue = queues[0]
@@ -310,6 +421,33 @@ class TestAddBullmqJob:
             )
         ]
 
+    def test_batch_shares_one_queue_and_isolates_failures(self, monkeypatch):
+        queues = []
+
+        class FakeQueue:
+            def __init__(self, name, opts=None):
+                self.added = []
+                self.closed = False
+                queues.append(self)
+
+            async def add(self, name, data, opts):
+                if opts["jobId"] == "bad":
+                    raise RuntimeError("add failed")
+                self.added.append(opts["jobId"])
+
+            async def close(self):
+                self.closed = True
+
+        monkeypatch.setattr("bullmq.Queue", FakeQueue)
+
+        outcomes = dt._add_bullmq_jobs([("a", {}), ("bad", {}), ("c", {})])
+
+        assert outcomes[0] is None and outcomes[2] is None
+        assert isinstance(outcomes[1], RuntimeError)
+        assert len(queues) == 1
+        assert queues[0].added == ["a", "c"]
+        assert queues[0].closed is True
+
 
 # ── Top-level guard ─────────────────────────────────────────────────────
 
@@ -326,6 +464,28 @@ class TestTopLevelGuard:
         dt.enqueue_detector_runs(PROJECT, {TRACE})
 
 
+class TestGetRedis:
+    def test_client_reused_within_a_process(self, monkeypatch):
+        import redis
+
+        from_url = MagicMock(side_effect=lambda url: MagicMock())
+        monkeypatch.setattr(redis, "from_url", from_url)
+
+        assert dt._get_redis() is dt._get_redis()
+        assert from_url.call_count == 1
+
+    def test_client_rebuilt_after_fork(self, monkeypatch):
+        import redis
+
+        from_url = MagicMock(side_effect=lambda url: MagicMock())
+        monkeypatch.setattr(redis, "from_url", from_url)
+
+        parent = dt._get_redis()
+        monkeypatch.setattr(dt.os, "getpid", lambda: -1)
+        assert dt._get_redis() is not parent
+        assert from_url.call_count == 2
+
+
 # ── _eval_condition: environment field semantics ────────────────────────
 
 
@@ -374,3 +534,90 @@ class TestEvalConditionEnvironment:
             dt._eval_condition(summary, {"field": "environment", "op": "!=", "value": "staging"})
             is True
         )
+
+
+class TestParseConditions:
+    """Trigger conditions are parsed and validated once when detectors load."""
+
+    def test_json_string_is_parsed(self):
+        raw = json.dumps([{"field": "environment", "op": "=", "value": "production"}])
+        assert dt._parse_conditions(raw) == [
+            {"field": "environment", "op": "=", "value": "production"}
+        ]
+
+    def test_missing_or_non_list_is_no_conditions(self):
+        assert dt._parse_conditions(None) == []
+        assert dt._parse_conditions({"field": "environment"}) == []
+
+    def test_numeric_string_ordering_value_is_accepted(self):
+        conditions = [{"field": "latency", "op": ">=", "value": "1.5"}]
+        assert dt._parse_conditions(conditions) == conditions
+
+    def test_non_numeric_ordering_value_is_rejected(self):
+        with pytest.raises(ValueError):
+            dt._parse_conditions([{"field": "latency", "op": ">", "value": "slow"}])
+
+    def test_non_object_condition_is_rejected(self):
+        with pytest.raises(ValueError):
+            dt._parse_conditions(["environment = production"])
+
+    def test_unparseable_json_is_rejected(self):
+        with pytest.raises(ValueError):
+            dt._parse_conditions("[{")
+
+
+class TestGetTraceSummaries:
+    def test_root_filter_is_pushed_into_where(self, monkeypatch):
+        ch = MagicMock()
+        ch.query.return_value.result_rows = [(TRACE, "production")]
+        monkeypatch.setattr("db.clickhouse.client.get_clickhouse_client", lambda: ch)
+
+        summaries = dt._get_trace_summaries(PROJECT, [TRACE])
+
+        sql = ch.query.call_args.args[0]
+        assert "AND parent_span_id IS NULL" in sql
+        assert "anyIf" not in sql
+        assert summaries == {TRACE: {"environment": "production"}}
+
+    def test_no_trace_ids_skips_query(self, monkeypatch):
+        ch = MagicMock()
+        monkeypatch.setattr("db.clickhouse.client.get_clickhouse_client", lambda: ch)
+
+        assert dt._get_trace_summaries(PROJECT, []) == {}
+        ch.query.assert_not_called()
+
+
+class TestActiveDetectorsCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self, monkeypatch):
+        monkeypatch.setattr(dt, "_detectors_cache", {})
+
+    def test_repeat_batches_reuse_one_load(self, monkeypatch):
+        load = MagicMock(return_value=[])
+        monkeypatch.setattr(dt, "_load_active_detectors", load)
+
+        assert dt._get_active_detectors(PROJECT) == []
+        assert dt._get_active_detectors(PROJECT) == []
+        assert dt._get_active_detectors("other-project") == []
+
+        assert [c.args for c in load.call_args_list] == [(PROJECT,), ("other-project",)]
+
+    def test_expired_entry_reloads(self, monkeypatch):
+        load = MagicMock(side_effect=[[_detector("d-old")], [_detector("d-new")]])
+        monkeypatch.setattr(dt, "_load_active_detectors", load)
+        clock = iter([0.0, settings.detectors_cache_ttl_seconds + 1])
+        monkeypatch.setattr(dt.time, "monotonic", lambda: next(clock))
+
+        assert dt._get_active_detectors(PROJECT)[0]["id"] == "d-old"
+        assert dt._get_active_detectors(PROJECT)[0]["id"] == "d-new"
+
+    def test_zero_ttl_disables_the_cache(self, monkeypatch):
+        monkeypatch.setattr(settings, "detectors_cache_ttl_seconds", 0)
+        load = MagicMock(return_value=[])
+        monkeypatch.setattr(dt, "_load_active_detectors", load)
+
+        dt._get_active_detectors(PROJECT)
+        dt._get_active_detectors(PROJECT)
+
+        assert load.call_count == 2
+        assert dt._detectors_cache == {}
@@ -1,11 +1,14 @@
 """Unit tests for Celery task logic with mocked S3 + ClickHouse."""
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
+import redis as redis_lib
 
+import worker.ingest_tasks as ingest_tasks
 from tests.fixtures.otel_payloads import make_otel_payload, make_span
-from worker.ingest_tasks import process_s3_traces
+from worker.ingest_tasks import _publish_live_spans, process_s3_traces
 
 TRACE_HEX = "aa" * 16
 SPAN_HEX = "bb" * 8
@@ -78,6 +81,28 @@ class TestProcessS3Traces:
         with pytest.raises(Exception, match="CH connection error"):
             process_s3_traces(s3_key="test/key.json", project_id="proj-1")
 
+    def test_trace_insert_failure_skips_span_insert(self, mock_s3, mock_ch):
+        """Spans are only written once their traces landed."""
+        payload = make_otel_payload([make_span(TRACE_HEX, SPAN_HEX)])
+        mock_s3.download_json.return_value = payload
+        mock_ch.insert_traces_batch.side_effect = Exception("CH trace error")
+
+        with pytest.raises(Exception, match="CH trace error"):
+            process_s3_traces(s3_key="test/key.json", project_id="proj-1")
+
+        mock_ch.insert_spans_batch.assert_not_called()
+
+    def test_span_insert_failure_raises_after_trace_insert(self, mock_s3, mock_ch):
+        """A span failure after the trace insert still fails the task."""
+        payload = make_otel_payload([make_span(TRACE_HEX, SPAN_HEX)])
+        mock_s3.download_json.return_value = payload
+        mock_ch.insert_spans_batch.side_effect = Exception("CH span error")
+
+        with pytest.raises(Exception, match="CH span error"):
+            process_s3_traces(s3_key="test/key.json", project_id="proj-1")
+
+        mock_ch.insert_traces_batch.assert_called_once()
+
     def test_multiple_traces_and_spans(self, mock_s3, mock_ch):
         """Payload with multiple traces processes correctly."""
         trace1 = "aa" * 16
@@ -119,6 +144,10 @@ class TestProcessS3Traces:
         assert project_id == "proj-1"
         # Only the root-bearing trace is passed; the child-only late_trace is not.
         assert traces_with_root == {root_trace}
+        # Trigger fields come from the batch's own root span, not a read-back.
+        assert mock_detector_enqueue.call_args.kwargs["summaries"] == {
+            root_trace: {"environment": None}
+        }
 
     def test_missing_root_probe_is_scoped_to_the_project(self, mock_s3, mock_ch):
         """The probe names project_id, the sort-key prefix it needs to prune on."""
@@ -142,3 +171,54 @@ class TestProcessS3Traces:
         process_s3_traces(s3_key="test/key.json", project_id="proj-1")
 
         mock_detector_enqueue.assert_not_called()
+
+
+class TestPublishLiveSpans:
+    @pytest.fixture(autouse=True)
+    def _fresh_client(self, monkeypatch):
+        monkeypatch.setattr(ingest_tasks, "_live_redis_client", None)
+
+    def test_publishes_whole_batch_in_one_pipeline(self, monkeypatch):
+        """Every per-trace publish rides a single pipeline round-trip, with
+        trace_complete queued after the spans of the trace it closes."""
+        client = MagicMock()
+        monkeypatch.setattr(redis_lib, "from_url", lambda *a, **kw: client)
+        pipe = client.pipeline.return_value
+
+        spans = [
+            {"trace_id": "t-1", "span_id": "s-1", "parent_span_id": None, "span_end_time": 1},
+            {"trace_id": "t-2", "span_id": "s-2", "parent_span_id": "p", "span_end_time": None},
+        ]
+        _publish_live_spans(spans, "proj-1")
+
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_called_once()
+        client.publish.assert_not_called()
+        published = [
+            (c.args[0], json.loads(c.args[1])["type"]) for c in pipe.publish.call_args_list
+        ]
+        assert published == [
+            ("trace:live:proj-1:t-1", "spans"),
+            ("trace:live:proj-1:t-1", "trace_complete"),
+            ("trace:live:proj-1:t-2", "spans"),
+        ]
+
+    def test_client_reused_across_batches(self, monkeypatch):
+        from_url = MagicMock(return_value=MagicMock())
+        monkeypatch.setattr(redis_lib, "from_url", from_url)
+        spans = [{"trace_id": "t-1", "span_id": "s-1", "parent_span_id": "p"}]
+
+        _publish_live_spans(spans, "proj-1")
+        _publish_live_spans(spans, "proj-1")
+
+        from_url.assert_called_once()
+        from_url.return_value.close.assert_not_called()
+
+    def test_client_rebuilt_after_fork(self, monkeypatch):
+        from_url = MagicMock(side_effect=lambda *a, **kw: MagicMock())
+        monkeypatch.setattr(redis_lib, "from_url", from_url)
+
+        parent = ingest_tasks._get_live_redis()
+        monkeypatch.setattr(ingest_tasks.os, "getpid", lambda: -1)
+        assert ingest_tasks._get_live_redis() is not parent
+        assert from_url.call_count == 2
@@ -122,6 +122,21 @@ class TestNanosToDatetime:
         result = nanos_to_datetime(0)
         assert result == datetime(1970, 1, 1, 0, 0, 0)
 
+    def test_microseconds_are_exact(self):
+        result = nanos_to_datetime(1705320000123456000)
+        assert result == datetime(2024, 1, 15, 12, 0, 0, 123456)
+
+    def test_sub_microsecond_digits_round_half_even(self):
+        assert nanos_to_datetime(1705320000123456789).microsecond == 123457
+        assert nanos_to_datetime(1705320000123456499).microsecond == 123456
+        assert nanos_to_datetime(1705320000123456500).microsecond == 123456
+        assert nanos_to_datetime(1705320000123457500).microsecond == 123458
+
+    def test_out_of_range_returns_none(self):
+        assert nanos_to_datetime(10**21) is None
+        assert nanos_to_datetime(str(10**30)) is None
+        assert nanos_to_datetime(-(10**21)) is None
+
 
 # ── extract_attribute_value ─────────────────────────────────────────────
 
@@ -1989,6 +2004,17 @@ class TestManualUsageAttribute:
         assert "audio_tokens" in warning
         assert "image_tokens" in warning
 
+    def test_unrecognized_field_report_is_capped_at_first_ten(self, caplog):
+        import logging
+
+        from worker.otel_transform import parse_manual_usage
+
+        raw = {f"extra_{i:03d}": 1 for i in range(500, 0, -1)}
+        with caplog.at_level(logging.WARNING):
+            parse_manual_usage(raw)
+        (record,) = caplog.records
+        assert record.args[0] == [f"extra_{i:03d}" for i in range(1, 11)]
+
     def test_fully_recognized_usage_logs_no_warning(self, caplog):
         import logging
 
@@ -2,6 +2,7 @@
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -206,6 +207,35 @@ class TestGetModelPrice:
     def test_unknown_model(self):
         assert get_model_price("unknown-model-xyz") is None
 
+    def test_repeat_lookup_is_memoized(self):
+        get_model_price("gpt-4o-2024-01-01")
+        with patch("worker.tokens.pricing._match_model_price") as scan:
+            price = get_model_price("gpt-4o-2024-01-01")
+        scan.assert_not_called()
+        assert price["input"] == 0.0000025
+
+    def test_memo_resets_when_price_list_reloads(self):
+        assert get_model_price("gpt-4o")["input"] == 0.0000025
+        reloaded = [{**MOCK_CACHE[0], "prices": {"input": 1.0, "output": 2.0}}]
+        with patch("worker.tokens.pricing._load_cache", lambda: reloaded):
+            assert get_model_price("gpt-4o")["input"] == 1.0
+
+    def test_concurrent_lookups_past_the_memo_bound(self, monkeypatch):
+        monkeypatch.setattr("worker.tokens.pricing._MODEL_PRICE_MEMO_MAX", 2)
+        models = [f"gpt-4o-2024-01-{day:02d}" for day in range(1, 29)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            prices = list(pool.map(get_model_price, models * 20))
+        assert {p["input"] for p in prices} == {0.0000025}
+
+    def test_invalid_pattern_is_skipped_at_index_time(self):
+        broken = [
+            {"model_name": "broken", "match_pattern": "([", "prices": {"input": 9.0}},
+            *MOCK_CACHE,
+        ]
+        with patch("worker.tokens.pricing._load_cache", lambda: broken):
+            assert get_model_price("broken")["input"] == 9.0
+            assert get_model_price("gpt-4o-2024-01-01")["input"] == 0.0000025
+
 
 class TestOpenAIModelIds:
     @pytest.mark.parametrize("model_id,expected_name", OPENAI_MODEL_CASES)
@@ -1,5 +1,7 @@
 """Unit tests for token counting."""
 
+from unittest.mock import MagicMock
+
 from worker.tokens.usage import CLAUDE_CHARS_PER_TOKEN, count_tokens
 
 
@@ -25,3 +27,22 @@ class TestCountTokens:
 
     def test_none_text_returns_zero(self):
         assert count_tokens(None, "gpt-4o") == 0
+
+    def test_encoding_resolved_once_per_model(self, monkeypatch):
+        """Repeated counts for one model name reuse the resolved encoding."""
+        import tiktoken
+
+        from worker.tokens import usage
+
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2, 3]
+        lookup = MagicMock(return_value=encoding)
+        monkeypatch.setattr(tiktoken, "encoding_for_model", lookup)
+        usage._encoding_for.cache_clear()
+        try:
+            assert count_tokens("a", "gpt-memo") == 3
+            assert count_tokens("b", "gpt-memo") == 3
+        finally:
+            usage._encoding_for.cache_clear()
+
+        lookup.assert_called_once_with("gpt-memo")